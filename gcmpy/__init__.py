@@ -7,13 +7,25 @@ from gcmpy.names.gcm_algorithm_names import GCMAlgorithmNames
 
 from gcmpy.network.network import Network
 from gcmpy.network.edge_list import LightWeightEdgeList
+from gcmpy.network.compact_edge_list import CompactEdgeList
+from gcmpy.network.edge_block import EdgeBlock
+from gcmpy.network.edge_block_store import EdgeBlockStore
+from gcmpy.network.sparse_network import SparseNetwork
+from gcmpy.network.multi_edges import MultiEdges
 from gcmpy.network.edge_list_to_network import EdgeListToNetwork
+from gcmpy.network.edge_list_to_sparse_network import EdgeListToSparseNetwork
 from gcmpy.network.network_to_edge_list import NetworkToEdgeList
 
 from gcmpy.joint_degree.joint_degree import JointDegree
+from gcmpy.joint_degree.alias_table import AliasTable
+from gcmpy.joint_degree.joint_degree_table import JointDegreeTable
+from gcmpy.joint_degree.joint_degree_counter import JointDegreeCounter
+from gcmpy.joint_degree.vectorized import vectorized, is_vectorized
+from gcmpy.joint_degree.integer_partitions import IntegerPartitions
 from gcmpy.joint_degree.joint_degree_type import JointDegreeType
 from gcmpy.joint_degree.joint_degree_factory import JointDegreeFactory
 from gcmpy.joint_degree.joint_degree_distribution import JointDegreeDistribution
+from gcmpy.joint_degree.joint_degree_cache import JointDegreeCache
 from gcmpy.joint_degree.joint_degree_loaders.joint_degree_manual import (
     JointDegreeManual,
 )
@@ -32,25 +44,40 @@ from gcmpy.joint_degree.joint_degree_loaders.joint_degree_function import (
     JointDegreeFunction,
 )
 
-from gcmpy.motif_generators.clique_motif import clique_motif
-from gcmpy.motif_generators.cycle_motif import cycle_motif
-from gcmpy.motif_generators.diamond_motif import diamond_motif
+from gcmpy.motif_generators.clique_motif import clique_motif, clique_motif_batch
+from gcmpy.motif_generators.cycle_motif import cycle_motif, cycle_motif_batch
+from gcmpy.motif_generators.diamond_motif import diamond_motif, diamond_motif_batch
+from gcmpy.motif_generators.motif_template import (
+    motif_template,
+    get_template,
+    build_from_template,
+)
 
 from gcmpy.gcm_algorithm.gcm_algorithm import GCMAlgorithm
 from gcmpy.gcm_algorithm.gcm_algorithm_factory import GCMAlgorithmFactory
 from gcmpy.gcm_algorithm.gcm_algorithm_fast import GCMAlgorithmFast
 from gcmpy.gcm_algorithm.gcm_algorithm_main import GCMAlgorithmMain
+from gcmpy.gcm_algorithm.gcm_ensemble import GCMEnsemble
 from gcmpy.gcm_algorithm.gcm_algorithm_custom_motifs import GCMAlgorithmCustomMotifs
 from gcmpy.gcm_algorithm.gcm_algorithm_network import GCMAlgorithmNetwork
+from gcmpy.gcm_algorithm.gcm_algorithm_compact import GCMAlgorithmCompact
+from gcmpy.gcm_algorithm.gcm_algorithm_csr import GCMAlgorithmCSR
 from gcmpy.gcm_algorithm.gcm_algorithm_types import GCMAlgorithmTypes
+from gcmpy.gcm_algorithm.motif_stubs import MotifStubs
+from gcmpy.gcm_algorithm.multi_edge_policy import MultiEdgePolicy
 
 from gcmpy.distributions.exponential import exponential
 from gcmpy.distributions.poisson import poisson
 from gcmpy.distributions.power_law import power_law
 from gcmpy.distributions.scale_free_cut_off import scale_free_cut_off
+from gcmpy.distributions.special_functions import zeta, polylog
 
 from gcmpy.covers.eecc import EECC
-from gcmpy.covers.mpcc import MPCC
+from gcmpy.covers.mpcc import MPCC, MPCC_cover, label_cover
+from gcmpy.covers.cover_types import CoverTypes
+from gcmpy.covers.component_cover import ComponentCover
+from gcmpy.covers.clique_edge_index import CliqueEdgeIndex
+from gcmpy.covers.bounded_cliques import bounded_cliques, bounded_cliques_through
 
 from gcmpy.tools.average_joint_degree_from_jdd import AverageJointDegreeFromJDD
 from gcmpy.tools.joint_degree_distribution_from_network import (
@@ -1,3 +1,7 @@
 # flake8: noqa
+from .bounded_cliques import bounded_cliques, bounded_cliques_through
+from .clique_edge_index import CliqueEdgeIndex
 from .eecc import EECC
-from .mpcc import MPCC
+from .cover_types import CoverTypes
+from .component_cover import ComponentCover
+from .mpcc import MPCC, MPCC_cover, label_cover
@@ -0,0 +1,81 @@
+import networkx as nx
+
+
+def _extend(
+    adj: dict, clique: list, cand: list, common: set, max_order: int, maximal: bool
+):
+    """
+    Depth first extension of `clique` by the candidates, in order, so that each
+    clique is reached exactly once.
+    :param adj: vertex to the set of its neighbours
+    :param clique: current clique
+    :param cand: sorted common neighbours of the clique that may still be added
+    :param common: all common neighbours of the clique
+    :param max_order: maximum clique order
+    :param maximal: only yield cliques that are maximal or of order `max_order`
+    """
+    if not maximal or len(clique) == max_order or not common:
+        yield clique
+    if len(clique) == max_order:
+        return
+    if len(clique) == max_order - 1:
+        # the last level only completes the clique, so skip the recursion
+        for v in cand:
+            yield clique + [v]
+        return
+    for i, v in enumerate(cand):
+        nbrs = adj[v]
+        yield from _extend(
+            adj,
+            clique + [v],
+            [w for w in cand[i + 1 :] if w in nbrs],
+            common & nbrs,
+            max_order,
+            maximal,
+        )
+
+
+def _adjacency(G: nx.Graph) -> dict:
+    return {u: set(G[u]) - {u} for u in G}
+
+
+def bounded_cliques(G: nx.Graph, max_order: int, maximal: bool = True):
+    """
+    Enumerates the cliques of G up to order `max_order`, pruning the search at
+    that depth. By default these are the cliques of order `max_order` and the
+    maximal cliques of lower order, which are the maximal cliques of G with the
+    larger ones decomposed into their sub-cliques of order `max_order`, each
+    yielded exactly once. With `maximal=False` every clique up to `max_order`
+    is yielded.
+    :param G: networkx graph, with comparable vertices
+    :param max_order: maximum clique order
+    :param maximal: only yield cliques that are maximal or of order `max_order`
+    :returns: generator of sorted tuples of vertices
+    """
+    adj = _adjacency(G)
+    for u in sorted(adj):
+        nbrs = adj[u]
+        cand = sorted(w for w in nbrs if w > u)
+        for clique in _extend(adj, [u], cand, nbrs, max_order, maximal):
+            yield tuple(clique)
+
+
+def bounded_cliques_through(
+    G: nx.Graph, v, max_order: int, maximal: bool = True, within: set = None
+):
+    """
+    As `bounded_cliques`, restricted to the cliques containing the vertex v.
+    Only the neighbourhood of v is searched, optionally only its part in
+    `within`, though maximality is still judged against all of G.
+    :param G: networkx graph, with comparable vertices
+    :param v: vertex
+    :param max_order: maximum clique order
+    :param maximal: only yield cliques that are maximal or of order `max_order`
+    :param within: optional set of vertices the rest of the clique is drawn from
+    :returns: generator of sorted tuples of vertices
+    """
+    nbrs = set(G[v]) - {v}
+    cand = nbrs if within is None else nbrs & within
+    adj = {u: set(G[u]) & nbrs for u in cand}
+    for clique in _extend(adj, [v], sorted(cand), nbrs, max_order, maximal):
+        yield tuple(sorted(clique))
@@ -0,0 +1,70 @@
+from itertools import combinations
+
+
+class CliqueEdgeIndex:
+    """
+    Inverted index from each edge to the ids of the cliques that contain it. An
+    edge is keyed by its vertex pair in increasing order, so whether an edge is
+    shared with another clique is a single lookup instead of a scan over every
+    clique. The index is updated in place as cliques are added or removed.
+    :param cliques: optional list of cliques, indexed by their position
+    """
+
+    def __init__(self, cliques: list = None):
+        self._index: dict = {}
+        if cliques is not None:
+            for clique_id, clique in enumerate(cliques):
+                self.add(clique_id, clique)
+
+    @staticmethod
+    def edges(clique: list) -> list:
+        """
+        :param clique: list of vertices
+        :returns list: edge keys of the clique
+        """
+        return [(u, v) if u < v else (v, u) for u, v in combinations(clique, 2)]
+
+    def add(self, clique_id: int, clique: list) -> None:
+        """
+        :param clique_id: id of the clique
+        :param clique: list of vertices
+        """
+        for edge in self.edges(clique):
+            self._index.setdefault(edge, []).append(clique_id)
+
+    def remove(self, clique_id: int, clique: list) -> None:
+        """
+        :param clique_id: id of a clique previously added
+        :param clique: list of vertices
+        """
+        for edge in self.edges(clique):
+            ids = self._index[edge]
+            ids.remove(clique_id)
+            if not ids:
+                del self._index[edge]
+
+    def cliques(self, u, v) -> list:
+        """
+        :param u: vertex
+        :param v: vertex
+        :returns list: ids of the cliques containing the edge (u, v)
+        """
+        return self._index.get((u, v) if u < v else (v, u), [])
+
+    def multiplicity(self, u, v) -> int:
+        """
+        :param u: vertex
+        :param v: vertex
+        :returns int: number of cliques containing the edge (u, v)
+        """
+        return len(self.cliques(u, v))
+
+    def shared_edges(self, clique: list) -> int:
+        """
+        :param clique: list of vertices of an indexed clique
+        :returns int: number of its edges that another clique also contains
+        """
+        return sum(len(self._index[edge]) > 1 for edge in self.edges(clique))
+
+    def __len__(self) -> int:
+        return len(self._index)
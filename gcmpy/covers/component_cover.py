@@ -0,0 +1,158 @@
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import networkx as nx
+import numpy as np
+
+from gcmpy.covers.cover_types import CoverTypes
+from gcmpy.covers.eecc import EECC
+from gcmpy.covers.mpcc import MPCC_cover, label_cover
+
+
+def _cover_parts(cover_type: CoverTypes, max_size: int, parts: list) -> list:
+    return [
+        ComponentCover.cover_part(cover_type, max_size, edges, seed)
+        for edges, seed in parts
+    ]
+
+
+class ComponentCover:
+    """
+    Computes an EECC or MPCC clique cover part by part. An edge-disjoint clique
+    cover decomposes exactly over the connected components of a graph, and
+    further over its biconnected blocks, since every clique of order 3 or more
+    lies within one block and every edge belongs to exactly one block. The
+    parts are covered in a process pool and the covers are concatenated, so
+    the position of a clique in the result is a globally unique ID.
+
+    Each part draws from its own stream spawned from one
+    `numpy.random.SeedSequence`, in the order the parts are found, so the cover
+    for a root seed does not depend on the number of workers.
+    :param cover_type: CoverTypes.EECC or CoverTypes.MPCC
+    :param max_size: maximum clique order, m0 for EECC, 0 for no limit in MPCC
+    :param blocks: split the components into biconnected blocks
+    """
+
+    def __init__(self, cover_type: CoverTypes, max_size: int = 0, blocks: bool = True):
+        if cover_type == CoverTypes.EECC and max_size < 2:
+            raise ValueError(
+                f"EECC needs a maximum clique size of at least 2, not {max_size}"
+            )
+        self._cover_type: CoverTypes = cover_type
+        self._max_size: int = max_size
+        self._blocks: bool = blocks
+
+    def parts(self, G: nx.Graph) -> list:
+        """
+        Splits the edges of G, less any self-loops, into independent parts.
+        :param G: networkx graph
+        :returns list: list of edge lists, largest first
+        """
+        g = nx.Graph(G)
+        g.remove_edges_from(list(nx.selfloop_edges(g)))
+        g.remove_nodes_from([v for v in list(g) if g.degree(v) == 0])
+        if self._blocks:
+            parts = [list(edges) for edges in nx.biconnected_component_edges(g)]
+        else:
+            parts = [list(g.subgraph(c).edges()) for c in nx.connected_components(g)]
+        return sorted(parts, key=len, reverse=True)
+
+    @staticmethod
+    def cover_part(
+        cover_type: CoverTypes, max_size: int, edges: list, seed: np.random.SeedSequence
+    ) -> list:
+        """
+        Covers one part. The covers draw from Python's `random' module, which is
+        seeded from `seed` for the duration of the call.
+        :param cover_type: CoverTypes.EECC or CoverTypes.MPCC
+        :param max_size: maximum clique order
+        :param edges: list of edges
+        :param seed: SeedSequence for this part
+        :returns list: list of cliques
+        """
+        state = random.getstate()
+        random.seed(int(seed.generate_state(1)[0]))
+        try:
+            if cover_type == CoverTypes.EECC:
+                G = EECC()
+                G.add_edges_from(edges)
+                G.set_max_clique_size(max_size)
+                return G.get_EECC()
+            return MPCC_cover(nx.Graph(edges), max_size)
+        finally:
+            random.setstate(state)
+
+    def cover(
+        self,
+        G: nx.Graph,
+        seed=None,
+        n_workers: int = None,
+        mp_context=None,
+        batch_edges: int = None,
+    ) -> list:
+        """
+        Covers G across a process pool. Parts are grouped into batches of about
+        `batch_edges` edges so that many small parts do not each cost a task.
+        With `n_workers=1` parts are covered in this process.
+        :param G: networkx graph
+        :param seed: root entropy (int) or SeedSequence, random if None
+        :param n_workers: number of worker processes, defaults to the cpu count
+        :param mp_context: optional multiprocessing context for the pool
+        :param batch_edges: edges per task, defaults to spreading the edges over
+        four tasks per worker
+        :returns list: edge-disjoint cliques covering every edge of G
+        """
+        parts = self.parts(G)
+        if not isinstance(seed, np.random.SeedSequence):
+            seed = np.random.SeedSequence(seed)
+        parts = list(zip(parts, seed.spawn(len(parts))))
+
+        if n_workers == 1 or len(parts) <= 1:
+            covers = _cover_parts(self._cover_type, self._max_size, parts)
+        else:
+            n_tasks = 4 * (n_workers or os.cpu_count() or 1)
+            if batch_edges is None:
+                batch_edges = max(1, sum(len(p[0]) for p in parts) // n_tasks)
+            batches: list = [[]]
+            size = 0
+            for part in parts:
+                if size >= batch_edges:
+                    batches.append([])
+                    size = 0
+                batches[-1].append(part)
+                size += len(part[0])
+
+            covers = []
+            with ProcessPoolExecutor(
+                max_workers=n_workers, mp_context=mp_context
+            ) as pool:
+                futures = [
+                    pool.submit(_cover_parts, self._cover_type, self._max_size, batch)
+                    for batch in batches
+                ]
+                for future in futures:
+                    covers.extend(future.result())
+
+        return [list(c) for cover in covers for c in cover]
+
+    def label(
+        self, G: nx.Graph, seed=None, n_workers: int = None, mp_context=None
+    ) -> nx.Graph:
+        """
+        Covers G and labels its edges with their cliques as `MPCC` does.
+        :param G: networkx graph
+        :param seed: root entropy (int) or SeedSequence, random if None
+        :param n_workers: number of worker processes, defaults to the cpu count
+        :param mp_context: optional multiprocessing context for the pool
+        :returns: G with labelled edges
+        """
+        return label_cover(G, self.cover(G, seed, n_workers, mp_context))
+
+    @property
+    def cover_type(self) -> CoverTypes:
+        return self._cover_type
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
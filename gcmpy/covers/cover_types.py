@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class CoverTypes(Enum):
+    EECC = "eecc"
+    MPCC = "mpcc"
@@ -0,0 +1,171 @@
+import heapq
+import random
+from itertools import count
+from math import comb
+
+import networkx as nx
+
+from gcmpy.covers.bounded_cliques import bounded_cliques, bounded_cliques_through
+from gcmpy.covers.clique_edge_index import CliqueEdgeIndex
+
+
+class LimitedCliqueSet:
+    """
+    Incrementally maintained set of the cliques of order up to m0 used by EECC:
+    the maximal cliques of a graph, with those larger than m0 decomposed into
+    their sub-cliques of order m0. Removing a clique's edges only changes the
+    cliques through its vertices, so only those are re-enumerated, and only
+    the cliques that share an edge with a clique that came or went are
+    rescored. Cliques are ranked in a heap keyed by (score, -order), with ties
+    broken by a uniform random key drawn whenever a clique is (re)scored.
+
+    A clique's score is the fraction of its edges that are also part of another
+    clique; cliques of order 2 or less score zero.
+    :param G: networkx graph, whose edges are removed as cliques are removed
+    :param m0: maximum clique order
+    """
+
+    def __init__(self, G: nx.Graph, m0: int):
+        self._G: nx.Graph = G
+        self._m0: int = m0
+        self._limited: dict = {}  # clique to id
+        self._cliques: dict = {}  # id to clique
+        self._scores: dict = {}  # id to score
+        self._keys: dict = {}  # id to random key of its live heap entry
+        self._index: CliqueEdgeIndex = CliqueEdgeIndex()
+        self._heap: list = []  # (score, -order, key, clique, id), stale skipped
+        self._ids = count()
+
+        touched: set = set()
+        for clique in bounded_cliques(G, m0):
+            if len(clique) > 1:
+                touched |= self.add(clique)
+        self._zero: list = self.rescore(touched)
+
+    def add(self, clique: tuple) -> set:
+        """
+        :param clique: sorted clique
+        :returns set: ids of the cliques whose score may have changed
+        """
+        clique_id = next(self._ids)
+        self._limited[clique] = clique_id
+        self._cliques[clique_id] = clique
+        self._index.add(clique_id, clique)
+        touched: set = set()
+        for u, v in CliqueEdgeIndex.edges(clique):
+            touched.update(self._index.cliques(u, v))
+        return touched
+
+    def discard(self, clique: tuple) -> set:
+        """
+        :param clique: sorted clique of the set
+        :returns set: ids of the cliques whose score may have changed
+        """
+        clique_id = self._limited.pop(clique)
+        self._index.remove(clique_id, clique)
+        touched: set = set()
+        for u, v in CliqueEdgeIndex.edges(clique):
+            touched.update(self._index.cliques(u, v))
+        del self._cliques[clique_id]
+        self._scores.pop(clique_id, None)
+        self._keys.pop(clique_id, None)
+        return touched
+
+    def score(self, clique: tuple) -> float:
+        order = len(clique)
+        r: float = 0.0
+        if order > 2:
+            size = comb(order, 2)
+            # accumulate as EECC.compute_scores does so that ties compare equal
+            for _ in range(self._index.shared_edges(clique)):
+                r += 1.0 / size
+        return r
+
+    def rescore(self, ids: set) -> list:
+        """
+        Updates the scores of the live cliques in `ids`.
+        :param ids: clique ids
+        :returns list: the cliques that now score zero
+        """
+        zero: list = []
+        for clique_id in ids:
+            clique = self._cliques.get(clique_id)
+            if clique is None:
+                continue
+            r = self.score(clique)
+            if self._scores.get(clique_id) != r:
+                self._scores[clique_id] = r
+                key = self._keys[clique_id] = random.random()
+                heapq.heappush(self._heap, (r, -len(clique), key, clique, clique_id))
+            if r == 0:
+                zero.append(clique)
+        return sorted(zero)
+
+    def remove(self, clique: tuple) -> list:
+        """
+        Removes the edges of `clique` from the graph and updates the cliques
+        around them.
+        :param clique: sorted clique, not necessarily one of the set
+        :returns list: the cliques that now score zero
+        """
+        G = self._G
+        edges = [e for e in CliqueEdgeIndex.edges(clique) if G.has_edge(*e)]
+
+        # removing edges never makes a clique non-maximal, so the only cliques
+        # to go are those that lose an edge, and the only ones to appear are
+        # those that could previously be extended across a removed edge (u, w):
+        # they contain u and lie in the common neighbourhood of u and w
+        members = set(clique)
+        common = [(set(G[u]) & set(G[w])) - members for u, w in edges]
+
+        touched: set = set()
+        for u, w in edges:
+            for clique_id in list(self._index.cliques(u, w)):
+                touched |= self.discard(self._cliques[clique_id])
+        G.remove_edges_from(edges)
+
+        found: set = set()
+        for (u, w), within in zip(edges, common):
+            for v in (u, w):
+                found.update(bounded_cliques_through(G, v, self._m0, within=within))
+        for c in sorted(found):
+            if len(c) > 1 and c not in self._limited:
+                touched |= self.add(c)
+        return self.rescore(touched)
+
+    def pop_zero(self) -> list:
+        """
+        :returns list: cliques found to score zero since the last call
+        """
+        zero, self._zero = self._zero, []
+        return zero
+
+    def pop_best(self) -> tuple:
+        """
+        Pops one of the cliques with the lowest score and, among those, the
+        highest order, chosen uniformly at random.
+        :returns tuple: the clique, or None if the set is empty
+        """
+        while self._heap:
+            r, _, key, clique, clique_id = heapq.heappop(self._heap)
+            if self._keys.get(clique_id) == key:
+                return clique
+        return None
+
+    def score_of(self, clique: tuple) -> float:
+        """
+        :param clique: sorted clique
+        :returns float: its score, or None if it is not in the set
+        """
+        if clique not in self._limited:
+            return None
+        return self._scores.get(self._limited[clique])
+
+    def __iter__(self):
+        """
+        :returns: iterator over a snapshot of the live cliques, as sorted tuples
+        """
+        return iter(list(self._limited))
+
+    def __len__(self) -> int:
+        return len(self._cliques)
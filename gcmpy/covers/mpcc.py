@@ -1,7 +1,10 @@
 import networkx as nx
-from random import shuffle
+from random import random
+import heapq
 import itertools
 
+from gcmpy.covers.bounded_cliques import bounded_cliques
+
 
 def MPCC(G: nx.Graph, max_size: int = 0):
     """
@@ -11,9 +14,8 @@ def MPCC(G: nx.Graph, max_size: int = 0):
     G.edges[e[0],e[1]]['clique'] = f'{len(c)}-{c}-{ID}'
 
     where c is a list of vertices in the clique and ID is a unique ID
-    for the motif. For large networks the library call to
-    `nx.enumerate_all_cliques` might be slow; however, we only need to
-    call it once.
+    for the motif. Only the maximal cliques are enumerated, once; smaller
+    cliques are found within them as the cover grows, see `MPCC_cover`.
 
     Take care of self-loops in the network, as these will not be labelled.
 
@@ -27,24 +29,76 @@ def MPCC(G: nx.Graph, max_size: int = 0):
 
     :returns: G a covered graph.
     """
-    g: nx.Graph = G.copy()
-    cliques = list(nx.enumerate_all_cliques(g))
-    shuffle(cliques)
-    cliques = sorted(cliques, key=len, reverse=True)
-    cover: list = []
-    for c in cliques:
-        if len(c) > max_size and max_size > 0:
-            continue
+    return label_cover(G, MPCC_cover(G, max_size))
 
-        skip: bool = False
-        for e in itertools.combinations(c, 2):
-            if not g.has_edge(e[0], e[1]):
-                skip = True
-                break
-        if not skip:
+
+def MPCC_cover(G: nx.Graph, max_size: int = 0) -> list:
+    """
+    The cliques of the MPCC of G, largest first, without labelling the edges.
+    The maximal cliques, or with a `max_size` the cliques from `bounded_cliques`,
+    are taken from a heap by size, and a clique that has lost edges to the cover
+    is replaced by the maximal cliques of what is left of it, so memory stays
+    proportional to the number of candidates enumerated.
+    :param G nx.Graph: the network to cover, which is not modified.
+    :param max_size int: optional int to control the maximum clique size allowed
+
+    :returns: list of cliques, each a list of vertices.
+    """
+    if max_size == 1:
+        return []
+
+    g: nx.Graph = nx.Graph(G)
+    g.remove_edges_from(list(nx.selfloop_edges(g)))
+
+    # candidates are popped largest first, in random order within a size. With
+    # a max_size, the maximal cliques larger than it are split into their
+    # sub-cliques of that order as they are enumerated
+    if max_size > 0:
+        candidates = bounded_cliques(g, max_size)
+    else:
+        candidates = nx.find_cliques(g)
+
+    order = itertools.count()
+    heap: list = []
+    seen: set = set()
+
+    def push(c: list) -> None:
+        heapq.heappush(heap, (-len(c), random(), next(order), c))
+
+    for c in candidates:
+        if len(c) > 1:
+            push(list(c))
+
+    cover: list = []
+    while heap:
+        c = heapq.heappop(heap)[3]
+        pairs = list(itertools.combinations(c, 2))
+        uncovered = [e for e in pairs if g.has_edge(*e)]
+        if len(uncovered) == len(pairs):
             cover.append(c)
-            g.remove_edges_from(list(itertools.combinations(c, 2)))
+            g.remove_edges_from(pairs)
+        elif len(uncovered) > 0:
+            # some edges are covered: what is left of c are its sub-cliques
+            for q in nx.find_cliques(nx.Graph(uncovered)):
+                key = frozenset(q)
+                if len(q) > 1 and key not in seen:
+                    seen.add(key)
+                    push(q)
+    return cover
+
 
+def label_cover(G: nx.Graph, cover: list) -> nx.Graph:
+    """
+    Labels each edge of G with the clique of the cover it belongs to, as
+
+    G.edges[e[0],e[1]]['clique'] = f'{len(c)}-{c}-{ID}'
+
+    where ID is the position of the clique in the cover.
+    :param G nx.Graph: the network the cover was computed for.
+    :param cover list: list of edge-disjoint cliques.
+
+    :returns: G with labelled edges.
+    """
     clique_ID: int = itertools.count(0)
     for c in cover:
         ID: int = next(clique_ID)
@@ -3,3 +3,4 @@ from .exponential import exponential
 from .poisson import poisson
 from .power_law import power_law
 from .scale_free_cut_off import scale_free_cut_off
+from .special_functions import zeta, polylog
@@ -3,12 +3,15 @@ import numpy as np
 
 def exponential(a: float) -> callable:
     """
-    Implemnts an exponential distribution.
+    Implemnts an exponential distribution. The returned callable accepts a
+    degree or an array of degrees.
     :param a: distribution parameter, a>0.
     :returns p: callable
     """
+    log_norm = np.log(-np.expm1(-a))
 
-    def p(k: int) -> float:
-        return (1 - np.exp(-a)) * np.exp(-a * k)
+    def p(k):
+        k = np.asarray(k, dtype=float)
+        return np.where(k >= 0, np.exp(log_norm - a * k), 0.0)[()]
 
     return p
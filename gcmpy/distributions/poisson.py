@@ -1,14 +1,46 @@
+import math
+
 import numpy as np
 
+# largest k whose log(k!) is tabulated, above which math.lgamma is used
+TABLE_SIZE: int = 100000
+
 
 def poisson(kmean: float) -> callable:
     """
-    Implements a poisson distribution
+    Implements a poisson distribution. The returned callable accepts a degree
+    or an array of degrees and is evaluated in log space, so it stays finite
+    for large k.
     :param kmean: mean of poisson distribution
     :returns p: Callable
     """
+    log_kmean = np.log(kmean) if kmean > 0 else -np.inf
+    log_factorials = np.zeros(1)  # log(k!) for small k, grown on demand
+
+    def log_factorial(k: np.ndarray) -> np.ndarray:
+        nonlocal log_factorials
+        small = k < TABLE_SIZE
+        n = int(k.max(initial=0, where=small)) + 1
+        if n > len(log_factorials):
+            n = min(max(n, 2 * len(log_factorials)), TABLE_SIZE)
+            log_factorials = np.concatenate(
+                ([0.0], np.cumsum(np.log(np.arange(1, n, dtype=float))))
+            )
+        if small.all():
+            return log_factorials[k]
+
+        result = np.empty(k.shape)
+        result[small] = log_factorials[k[small]]
+        result[~small] = [math.lgamma(x + 1) for x in k[~small].tolist()]
+        return result
 
-    def p(k: int) -> float:
-        return np.exp(-kmean) * pow(kmean, k) / np.math.factorial(k)
+    def p(k):
+        k = np.asarray(k, dtype=np.int64)
+        valid = k >= 0
+        safe = np.where(valid, k, 0)
+        with np.errstate(invalid="ignore"):
+            log_p = -kmean + np.where(safe > 0, safe * log_kmean, 0.0)
+        log_p = log_p - log_factorial(safe)
+        return np.where(valid, np.exp(log_p), 0.0)[()]
 
     return p
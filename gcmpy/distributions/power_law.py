@@ -1,25 +1,25 @@
+import numpy as np
+
+from gcmpy.distributions.special_functions import zeta
+
+
 def power_law(alpha: float) -> callable:
     """
-    Implements a power law distribution with exponent alpha. Undefined for k = 0.
-    :param alpha: power law exponent
+    Implements a power law distribution with exponent alpha. The returned
+    callable accepts a degree or an array of degrees and is zero for k < 1.
+    :param alpha: power law exponent, alpha > 1
     :returns p: callable
     """
+    if not alpha > 1:
+        raise ValueError(
+            f"power_law requires alpha > 1 to be normalisable, not {alpha}"
+        )
+    log_C = np.log(zeta(float(alpha)))
 
-    def zeta(s: float) -> float:
-        tol = +1e-06
-        l = 0.0
-        k = 1
-        while 1:
-            term = 1.0 / k**s
-            l += term
-            if abs(term) < tol:
-                break
-            k += 1
-        return l
-
-    C = zeta(alpha)
-
-    def p(k: int) -> float:
-        return pow(k, -alpha) / C
+    def p(k):
+        k = np.asarray(k, dtype=float)
+        valid = k >= 1
+        log_p = -alpha * np.log(np.where(valid, k, 1.0)) - log_C
+        return np.where(valid, np.exp(log_p), 0.0)[()]
 
     return p
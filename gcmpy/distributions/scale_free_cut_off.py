@@ -1,38 +1,25 @@
 import numpy as np
 
+from gcmpy.distributions.special_functions import polylog
+
 
 def scale_free_cut_off(alpha: float, kappa: float) -> callable:
     """
     Implements a scale free with exponential degree cutoff function. Limits
-    to scale free for large degree cutoff. Undefined for k = 0.
+    to scale free for large degree cutoff. The returned callable accepts a
+    degree or an array of degrees and is zero for k < 1.
     :param k: int degree
     :param alpha: float power law exponent
     :param kappa: float degree cutoff
     """
+    # normalisation constant
+    log_C = np.log(polylog(float(alpha), float(np.exp(-1.0 / kappa))))
 
-    def polylog(s: float, z: float) -> float:
-        """
-        Implements a polylogarithm function for real arguments, taking two floats
-        :param s: base
-        :param z: arg
-        :returns float: polylogarithm
-        """
-        tol = +1e-06
-        l = 0.0
-        k = 1
-        zk = z
-        while 1:
-            term = zk / k**s
-            l += term
-            if abs(term) < tol:
-                break
-            zk *= z
-            k += 1
-        return l
-
-    C = polylog(alpha, np.exp(-1.0 / kappa))  # normalisation constant
-
-    def p(k: int) -> float:
-        return (pow((k + 0.0), -alpha) * np.exp(-(k + 0.0) / kappa)) / C
+    def p(k):
+        k = np.asarray(k, dtype=float)
+        valid = k >= 1
+        safe = np.where(valid, k, 1.0)
+        log_p = -alpha * np.log(safe) - safe / kappa - log_C
+        return np.where(valid, np.exp(log_p), 0.0)[()]
 
     return p
@@ -0,0 +1,128 @@
+import math
+from functools import lru_cache
+
+import numpy as np
+
+# B_2, B_4, ..., B_20
+BERNOULLI: tuple = (
+    1 / 6,
+    -1 / 30,
+    1 / 42,
+    -1 / 30,
+    5 / 66,
+    -691 / 2730,
+    7 / 6,
+    -3617 / 510,
+    43867 / 798,
+    -174611 / 330,
+)
+
+# number of terms summed directly before the Euler-Maclaurin tail correction
+EM_TERMS: int = 16
+
+TOLERANCE: float = 1e-15
+
+
+@lru_cache(maxsize=None)
+def zeta(s: float) -> float:
+    """
+    Riemann zeta function for real `s != 1`. The sum over k >= 16 is replaced
+    by its Euler-Maclaurin expansion, accurate to double precision, and
+    negative `s` use the reflection formula. Results are memoized.
+    :param s: argument
+    :returns float: zeta(s)
+    """
+    if s == 1:
+        raise ValueError("zeta(s) diverges at s = 1")
+    if s == 0:
+        return -0.5
+    if s < 0:
+        return (
+            2**s
+            * math.pi ** (s - 1)
+            * math.sin(math.pi * s / 2)
+            * math.gamma(1 - s)
+            * zeta(1 - s)
+        )
+
+    N = EM_TERMS
+    total = math.fsum(k**-s for k in range(1, N))
+    total += N ** (1 - s) / (s - 1) + 0.5 * N**-s
+
+    # B_2j / (2j)! * s (s + 1) ... (s + 2j - 2) * N^(-s - 2j + 1)
+    rising = s
+    factorial = 2.0
+    power = N ** (-s - 1)
+    for j, b in enumerate(BERNOULLI, start=1):
+        total += b / factorial * rising * power
+        rising *= (s + 2 * j - 1) * (s + 2 * j)
+        factorial *= (2 * j + 1) * (2 * j + 2)
+        power /= N * N
+    return total
+
+
+@lru_cache(maxsize=None)
+def polylog(s: float, z: float) -> float:
+    """
+    Polylogarithm Li_s(z) = sum_k z^k / k^s for real `s` and 0 <= z <= 1. Far
+    from z = 1 the series is summed directly; close to z = 1, where it converges
+    slowly, the expansion in mu = log(z) around z = 1 is used instead, whose
+    terms shrink like (mu / 2 pi)^k. Results are memoized.
+    :param s: order
+    :param z: argument
+    :returns float: Li_s(z)
+    """
+    if not 0 <= z <= 1:
+        raise ValueError(f"polylog is only implemented for 0 <= z <= 1, not {z}")
+    if z == 0:
+        return 0.0
+    if z == 1:
+        return zeta(s)
+
+    mu = math.log(z)
+    if mu < -1:
+        return polylog_series(s, z)
+
+    n = round(s)
+    if abs(s - n) < 1e-9 and n >= 1:
+        # the k = n - 1 term meets the pole of zeta and is replaced by a log
+        harmonic = math.fsum(1 / j for j in range(1, n))
+        total = mu ** (n - 1) / math.factorial(n - 1) * (harmonic - math.log(-mu))
+        s = n
+    else:
+        total = math.gamma(1 - s) * (-mu) ** (s - 1)
+
+    term = 1.0  # mu^k / k!
+    n_small = 0
+    for k in range(200):
+        if s - k != 1:
+            part = zeta(s - k) * term
+            total += part
+            # zeta vanishes at negative even integers, so wait for two small parts
+            n_small = n_small + 1 if abs(part) < TOLERANCE * abs(total) else 0
+            if n_small == 2:
+                break
+        term *= mu / (k + 1)
+    return total
+
+
+def polylog_series(s: float, z: float) -> float:
+    """
+    Sums the polylogarithm series directly in blocks until the geometric bound on
+    the remainder falls below the tolerance. Used for z <= 1 / e.
+    :param s: order
+    :param z: argument, 0 < z < 1
+    :returns float: Li_s(z)
+    """
+    total = 0.0
+    start = 1
+    block = 64
+    while True:
+        k = np.arange(start, start + block, dtype=float)
+        terms = np.exp(k * math.log(z) - s * np.log(k))
+        total += math.fsum(terms)
+        # once terms decrease, the rest is at most a geometric series in z
+        last = terms[-1]
+        if terms[-1] <= terms[-2] and last * z / (1 - z) < TOLERANCE * abs(total):
+            return total
+        start += block
@@ -3,6 +3,11 @@ from .gcm_algorithm import GCMAlgorithm
 from .gcm_algorithm_factory import GCMAlgorithmFactory
 from .gcm_algorithm_fast import GCMAlgorithmFast
 from .gcm_algorithm_main import GCMAlgorithmMain
+from .gcm_ensemble import GCMEnsemble
 from .gcm_algorithm_custom_motifs import GCMAlgorithmCustomMotifs
 from .gcm_algorithm_network import GCMAlgorithmNetwork
+from .gcm_algorithm_compact import GCMAlgorithmCompact
+from .gcm_algorithm_csr import GCMAlgorithmCSR
 from .gcm_algorithm_types import GCMAlgorithmTypes
+from .motif_stubs import MotifStubs
+from .multi_edge_policy import MultiEdgePolicy
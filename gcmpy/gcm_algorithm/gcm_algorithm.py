@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
 from typing import Any, Generator
 
+import numpy as np
+
+from gcmpy.gcm_algorithm.multi_edge_policy import MultiEdgePolicy
 from gcmpy.names.gcm_algorithm_names import GCMAlgorithmNames
 
 
@@ -10,12 +13,19 @@ class GCMAlgorithm(ABC):
     :param motif_sizes: list of ints that indicate the number of vertices in each motif
     :param build_functions: callbacks that accept list of vertices and return edges
     :param edge_names: list of names for edge topologies
+    :param seed: optional seed or numpy Generator for the stub shuffling
+    :param multi_edge_policy: optional MultiEdgePolicy for self-loops and repeated edges
+    :param resample_rounds: optional limit on rounds of the resample policy
     """
 
     def __init__(self, params: dict):
         self._motif_sizes: list = []  # list of number of vertices in each motif
         self._build_functions: list = []  # list of callbacks for motif construction
         self._edge_names: list = []  # list of edge topology names
+        self._rng: np.random.Generator = None  # random stream for stub shuffling
+        self._multi_edge_policy: MultiEdgePolicy = None  # None keeps every edge
+        self._resample_rounds: int = 10  # rounds before remaining edges are erased
+        self._multi_edge_counts: dict = {}  # name: (self-loops, repeated edges)
 
         try:
             self._motif_sizes = params[GCMAlgorithmNames.MOTIF_SIZES]
@@ -24,6 +34,18 @@ class GCMAlgorithm(ABC):
         except Exception as e:
             raise (f"Error in {self.__class__.__name__}: {e}")
 
+        if GCMAlgorithmNames.SEED in params:
+            self._rng = np.random.default_rng(params[GCMAlgorithmNames.SEED])
+        else:
+            self._rng = np.random.default_rng()
+
+        if GCMAlgorithmNames.MULTI_EDGE_POLICY in params:
+            self._multi_edge_policy = MultiEdgePolicy(
+                params[GCMAlgorithmNames.MULTI_EDGE_POLICY]
+            )
+        if GCMAlgorithmNames.RESAMPLE_ROUNDS in params:
+            self._resample_rounds = params[GCMAlgorithmNames.RESAMPLE_ROUNDS]
+
     def __new__(cls, *args, **kwargs):
         if cls is GCMAlgorithm:
             raise TypeError(
@@ -42,3 +64,24 @@ class GCMAlgorithm(ABC):
         while True:
             yield num
             num += 1
+
+    @property
+    def rng(self) -> np.random.Generator:
+        return self._rng
+
+    @rng.setter
+    def rng(self, value) -> None:
+        self._rng = np.random.default_rng(value)
+
+    @property
+    def multi_edge_policy(self) -> MultiEdgePolicy:
+        return self._multi_edge_policy
+
+    @property
+    def multi_edge_counts(self) -> dict:
+        """
+        Self-loops and repeated edges per topology name found by the last call to
+        `random_clustered_graph`. Under the resample policy these are the edges
+        left after resampling, which were erased.
+        """
+        return self._multi_edge_counts
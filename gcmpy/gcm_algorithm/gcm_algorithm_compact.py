@@ -0,0 +1,24 @@
+import numpy as np
+
+from gcmpy.gcm_algorithm.gcm_algorithm_fast import GCMAlgorithmFast
+from gcmpy.gcm_algorithm.motif_stubs import MotifStubs
+from gcmpy.network.compact_edge_list import CompactEdgeList
+
+
+class GCMAlgorithmCompact(GCMAlgorithmFast):
+    """
+    Runs the fast GCM algorithm and returns the graph as a `CompactEdgeList`,
+    holding edges, topology codes and motif ids in NumPy arrays.
+    """
+
+    def random_clustered_graph(self, jds: list) -> CompactEdgeList:
+        jds = MotifStubs.as_joint_degree_array(jds)
+        edges, codes, motif_ids = self.wire_graph(jds)
+
+        return CompactEdgeList(
+            edges.astype(CompactEdgeList.vertex_dtype(len(jds))),
+            codes.astype(CompactEdgeList.code_dtype(len(self._edge_names))),
+            self._edge_names,
+            motif_ids,
+            jds.astype(np.int32),
+        )
@@ -0,0 +1,14 @@
+from gcmpy.gcm_algorithm.gcm_algorithm_compact import GCMAlgorithmCompact
+from gcmpy.network.edge_list_to_sparse_network import EdgeListToSparseNetwork
+from gcmpy.network.sparse_network import SparseNetwork
+
+
+class GCMAlgorithmCSR(GCMAlgorithmCompact):
+    """
+    Runs the fast GCM algorithm and returns the graph as a `SparseNetwork`, a
+    symmetric `scipy.sparse.csr_matrix` adjacency with CSR-aligned topology codes
+    and motif ids. Requires scipy.
+    """
+
+    def random_clustered_graph(self, jds: list) -> SparseNetwork:
+        return EdgeListToSparseNetwork.convert(super().random_clustered_graph(jds))
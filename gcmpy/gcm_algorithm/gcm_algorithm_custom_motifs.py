@@ -1,7 +1,8 @@
-import random
-from itertools import chain, repeat, starmap
+import numpy as np
 
 from gcmpy.gcm_algorithm.gcm_algorithm import GCMAlgorithm
+from gcmpy.gcm_algorithm.motif_stubs import MotifStubs
+from gcmpy.motif_generators.motif_template import get_template, build_from_template
 from gcmpy.network.edge_list import LightWeightEdgeList
 from gcmpy.names.gcm_algorithm_names import GCMAlgorithmNames
 
@@ -23,59 +24,76 @@ class GCMAlgorithmCustomMotifs(GCMAlgorithm):
         return [lst[i : i + n] for i in range(0, len(lst), n)]
 
     def random_clustered_graph(self, jds: list) -> LightWeightEdgeList:
-        stubs = [
-            list(chain.from_iterable(starmap(repeat, r)))
-            for r in map(enumerate, zip(*jds))
-        ]
-
-        # shuffle each stub list
-        for k_list in stubs:
-            random.shuffle(k_list)
+        # expand, shuffle and partition the stubs of each orbit
+        jds = MotifStubs.as_joint_degree_array(jds)
+        blocks = MotifStubs.motif_blocks(jds, self._motif_sizes, self._rng)
 
         # create list for edges and add joint degree sequence
         EdgeList = LightWeightEdgeList()
-        EdgeList.joint_degrees = jds
-
-        # split the stub lists into partitions of equal
-        # size to the number of that topology required to
-        # construct the motif
-        partitions: list[list] = []
-        for i, k_list in enumerate(stubs):
-            partitions.append(self.partition(k_list, self._motif_sizes[i]))
+        EdgeList.joint_degrees = list(map(tuple, jds.tolist()))
 
-        # self._motif_vertices is a list of lists that contain
+        # self._motif_indices is a list of lists that contain
         # the indices of the joint degree slots required to construct
         # the motif.
 
-        gen = self.infinite_sequence()
+        first_id: int = 0
 
         # for each motif type
         for j, motif_indexes in enumerate(self._motif_indices):
-            # for each motif of that type
-            kk: int = motif_indexes[0]
-            num_motifs = (0.0 + len(stubs[kk])) / self._motif_sizes[kk]
-            for k in range(int(num_motifs)):
-                vertices: list = []
-                # for each orbit in the motif
-                for index in motif_indexes:
-                    vertices.append(partitions[index].pop())
-
-                vertices = [item for sublist in vertices for item in sublist]
-
-                # build the motif edges from the vertices
-                es: list = self._build_functions[j](vertices)
-
-                # get the motif id
-                id = next(gen)
-                EdgeList.motif_id.extend([id] * len(es))
-
-                if len(es) == 2:
-                    # if 2-clique tuple annoyingly unpacks ... so re-pack it
-                    EdgeList.edge_list.extend([es])
-                    EdgeList.topologies.extend([self._edge_names[j]()])
-
-                else:
-                    EdgeList.edge_list.extend(es)
-                    EdgeList.topologies.extend(self._edge_names[j]())
+            # the number of motifs is set by the first orbit
+            num_motifs: int = len(blocks[motif_indexes[0]][0])
+            orbits: list = []
+            for index in motif_indexes:
+                if len(blocks[index][0]) < num_motifs:
+                    raise ValueError(
+                        f"Error in {self.__class__.__name__}: too few stubs in orbit {index}"
+                    )
+                orbits.append(blocks[index][0][:num_motifs])
+
+            # each row holds the vertices of one motif, orbit by orbit
+            vertices: np.ndarray = np.hstack(orbits)
+
+            es, ids, names = self.wire_motif(j, vertices, first_id)
+            first_id += num_motifs
+
+            EdgeList.edge_list.extend(es)
+            EdgeList.topologies.extend(names)
+            EdgeList.motif_id.extend(ids)
 
         return EdgeList
+
+    def wire_motif(self, j: int, vertices: np.ndarray, first_id: int) -> tuple:
+        """
+        Builds every motif of type `j`. If the builder callback declares an edge
+        template the motifs are built at once, otherwise the callback is called
+        per motif.
+        :param j: motif type index
+        :param vertices: (n_motifs, motif_size) array of motif vertices
+        :param first_id: motif id of the first motif
+        :returns tuple: lists of edges, motif ids and edge names
+        """
+        num_motifs: int = len(vertices)
+        names = self._edge_names[j]()
+        if isinstance(names, str):
+            # a single edge motif names its edge directly
+            names = [names]
+        names = list(names)
+
+        template = get_template(self._build_functions[j], vertices.shape[1])
+        if template is not None:
+            es = build_from_template(vertices, template)
+            ids = np.repeat(np.arange(first_id, first_id + num_motifs), len(template))
+            return list(map(tuple, es.tolist())), ids.tolist(), names * num_motifs
+
+        edges: list = []
+        motif_ids: list = []
+        for id, motif in enumerate(vertices.tolist(), first_id):
+            # build the motif edges from the vertices
+            es = self._build_functions[j](motif)
+            if np.ndim(es) == 1:
+                # if 2-clique tuple annoyingly unpacks ... so re-pack it
+                es = [es]
+            edges.extend(es)
+            motif_ids.extend([id] * len(es))
+
+        return edges, motif_ids, names * num_motifs
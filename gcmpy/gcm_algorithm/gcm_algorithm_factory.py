@@ -4,6 +4,8 @@ from gcmpy.gcm_algorithm.gcm_algorithm import GCMAlgorithm
 from gcmpy.gcm_algorithm.gcm_algorithm_fast import GCMAlgorithmFast
 from gcmpy.gcm_algorithm.gcm_algorithm_network import GCMAlgorithmNetwork
 from gcmpy.gcm_algorithm.gcm_algorithm_custom_motifs import GCMAlgorithmCustomMotifs
+from gcmpy.gcm_algorithm.gcm_algorithm_compact import GCMAlgorithmCompact
+from gcmpy.gcm_algorithm.gcm_algorithm_csr import GCMAlgorithmCSR
 
 
 class GCMAlgorithmFactory:
@@ -15,5 +17,9 @@ class GCMAlgorithmFactory:
             return GCMAlgorithmNetwork(params)
         elif type == GCMAlgorithmTypes.MOTIFS:
             return GCMAlgorithmCustomMotifs(params)
+        elif type == GCMAlgorithmTypes.COMPACT:
+            return GCMAlgorithmCompact(params)
+        elif type == GCMAlgorithmTypes.CSR:
+            return GCMAlgorithmCSR(params)
         else:
             raise ("Error: unknown algorithm in GCMAlgorithmFactory: resolve_algorithm")
@@ -1,42 +1,211 @@
-import random
-from iteration_utilities import grouper
-from itertools import chain, repeat, starmap
+from typing import Generator
+
+import numpy as np
 
 from gcmpy.gcm_algorithm.gcm_algorithm import GCMAlgorithm
+from gcmpy.gcm_algorithm.motif_stubs import MotifStubs
+from gcmpy.gcm_algorithm.multi_edge_policy import MultiEdgePolicy
+from gcmpy.motif_generators.motif_template import get_template, build_from_template
 from gcmpy.network.edge_list import LightWeightEdgeList
+from gcmpy.network.compact_edge_list import CompactEdgeList
+from gcmpy.network.edge_block import EdgeBlock
+from gcmpy.network.edge_block_store import EdgeBlockStore
+from gcmpy.network.multi_edges import MultiEdges
 
 
 class GCMAlgorithmFast(GCMAlgorithm):
     def random_clustered_graph(self, jds: list) -> LightWeightEdgeList:
-        stubs = [
-            list(chain.from_iterable(starmap(repeat, r)))
-            for r in map(enumerate, zip(*jds))
-        ]
-
-        # shuffle each stub list
-        for k_list in stubs:
-            random.shuffle(k_list)
+        jds = MotifStubs.as_joint_degree_array(jds)
+        edges, codes, motif_ids = self.wire_graph(jds)
 
         # create list for edges and add joint degree sequence
         EdgeList = LightWeightEdgeList()
-        EdgeList.joint_degrees = jds
+        EdgeList.joint_degrees = list(map(tuple, jds.tolist()))
 
-        gen = self.infinite_sequence()
+        # add the edges, their names and motif ids to the lists
+        EdgeList.edge_list = list(map(tuple, edges.tolist()))
+        EdgeList.topologies = [self._edge_names[k] for k in codes.tolist()]
+        EdgeList.motif_id = motif_ids.tolist()
 
-        # for each topology list ...
-        for k, k_list in enumerate(stubs):
-            # iterate the degree list
-            for vertices in grouper(k_list, self._motif_sizes[k]):
-                # add the edges to the network using the builder callback
-                es = self._build_functions[k](list(vertices))
-                EdgeList.edge_list.extend(es)
+        # return the graph model as a LightWeightEdgeList
+        return EdgeList
 
-                # add the edge names to a list
-                EdgeList.topologies.extend([self._edge_names[k]] * len(es))
+    def wire_graph(self, jds: np.ndarray) -> tuple:
+        """
+        Wires every topology and applies the multi-edge policy, if one is set.
+        :param jds: (N, T) joint degree array
+        :returns tuple: (E, 2) edges, (E,) topology indices and (E,) motif ids
+        """
+        if self._multi_edge_policy == MultiEdgePolicy.RESAMPLE:
+            wired = self.resample(jds)
+        else:
+            wired = list(self.wire(jds))
 
-                # record the motif id
-                id = next(gen)
-                EdgeList.motif_id.extend([id] * len(es))
+        edges = np.concatenate([es for _, es, _ in wired])
+        codes = np.concatenate([np.full(len(es), k) for k, es, _ in wired])
+        motif_ids = np.concatenate([ids for _, _, ids in wired])
 
-        # return the graph model as a LightWeightEdgeList
-        return EdgeList
+        if self._multi_edge_policy is not None:
+            loops, repeats = MultiEdges.find(edges, len(jds))
+            self._multi_edge_counts = MultiEdges.count(
+                loops, repeats, codes, self._edge_names
+            )
+            if self._multi_edge_policy != MultiEdgePolicy.REPORT:
+                keep = ~(loops | repeats)
+                edges, codes, motif_ids = edges[keep], codes[keep], motif_ids[keep]
+
+        return edges, codes, motif_ids
+
+    def resample(self, jds: np.ndarray) -> list:
+        """
+        Wires every topology, then reshuffles the stubs of motifs that hold a
+        self-loop or repeated edge together with as many randomly chosen motifs of
+        the same topology, and rewires them. This repeats for at most
+        `resample_rounds` rounds; the leftover motif of a topology is not resampled.
+        :param jds: (N, T) joint degree array
+        :returns list: tuples of (topology index, edges, motif ids)
+        """
+        blocks = MotifStubs.motif_blocks(jds, self._motif_sizes, self._rng)
+        first_ids = np.cumsum(
+            [0] + [len(motifs) + int(len(rest) > 0) for motifs, rest in blocks]
+        )
+        wired = [
+            self.wire_topology(k, motifs, rest, int(first_ids[k]))
+            for k, (motifs, rest) in enumerate(blocks)
+        ]
+
+        for _ in range(self._resample_rounds):
+            edges = np.concatenate([es for es, _ in wired])
+            codes = np.concatenate(
+                [np.full(len(es), k) for k, (es, _) in enumerate(wired)]
+            )
+            motif_ids = np.concatenate([ids for _, ids in wired])
+
+            bad = np.logical_or(*MultiEdges.find(edges, len(jds)))
+            if not bad.any():
+                break
+
+            for k, (motifs, rest) in enumerate(blocks):
+                offending = np.unique(motif_ids[bad & (codes == k)]) - first_ids[k]
+                offending = offending[offending < len(motifs)]
+                if len(offending) == 0:
+                    continue
+
+                # reshuffle the offending motifs with random partners
+                partners = self._rng.choice(len(motifs), size=len(offending))
+                rows = np.union1d(offending, partners)
+                stubs = motifs[rows].ravel()
+                self._rng.shuffle(stubs)
+                motifs[rows] = stubs.reshape(len(rows), -1)
+                wired[k] = self.wire_topology(k, motifs, rest, int(first_ids[k]))
+
+        return [(k, es, ids) for k, (es, ids) in enumerate(wired)]
+
+    def wire(self, jds: np.ndarray, chunk_size: int = None) -> Generator:
+        """
+        Expands, shuffles and partitions the stubs of each topology in turn and
+        wires the motifs, at most `chunk_size` motifs at a time. Motif ids are
+        numbered consecutively across topologies.
+        :param jds: (N, T) joint degree array
+        :param chunk_size: maximum number of motifs per chunk, None for no limit
+        :returns generator: tuples of (topology index, edges, motif ids)
+        """
+        first_id: int = 0
+        for k, motif_size in enumerate(self._motif_sizes):
+            motifs, remainder = MotifStubs.motif_block(jds[:, k], motif_size, self._rng)
+
+            step: int = chunk_size or len(motifs) or 1
+            for start in range(0, max(len(motifs), 1), step):
+                chunk = motifs[start : start + step]
+                # leftover stubs are wired with the last chunk
+                rest = remainder if start + step >= len(motifs) else remainder[:0]
+                edges, motif_ids = self.wire_topology(k, chunk, rest, first_id)
+                first_id += len(chunk) + int(len(rest) > 0)
+                yield k, edges, motif_ids
+
+    def edge_blocks(self, jds: list, chunk_size: int = None) -> Generator:
+        """
+        Generator mode of the algorithm. Yields the graph as a sequence of edge
+        blocks, one per topology and chunk of at most `chunk_size` motifs, so that
+        peak memory is bounded by the stub arrays rather than the edge list.
+        :param jds: joint degree sequence
+        :param chunk_size: maximum number of motifs per block, None for no limit
+        :returns generator: EdgeBlock of edges, topology codes and motif ids
+        """
+        jds = MotifStubs.as_joint_degree_array(jds)
+        vertex_dtype = CompactEdgeList.vertex_dtype(len(jds))
+        code_dtype = CompactEdgeList.code_dtype(len(self._edge_names))
+        for k, edges, motif_ids in self.wire(jds, chunk_size):
+            yield EdgeBlock(
+                edges.astype(vertex_dtype),
+                np.full(len(edges), k, dtype=code_dtype),
+                motif_ids,
+            )
+
+    def write_random_clustered_graph(
+        self, jds: list, path: str, chunk_size: int = 1 << 20
+    ) -> CompactEdgeList:
+        """
+        Streams the graph to an `EdgeBlockStore` in the directory `path`.
+        :param jds: joint degree sequence
+        :param path: store directory
+        :param chunk_size: maximum number of motifs per block
+        :returns CompactEdgeList: the stored graph, memory-mapped read only
+        """
+        jds = MotifStubs.as_joint_degree_array(jds)
+        with EdgeBlockStore(
+            path,
+            self._edge_names,
+            jds.astype(np.int32),
+            CompactEdgeList.vertex_dtype(len(jds)),
+            CompactEdgeList.code_dtype(len(self._edge_names)),
+        ) as store:
+            for block in self.edge_blocks(jds, chunk_size):
+                store.append(block)
+        return EdgeBlockStore.load(path)
+
+    def wire_topology(
+        self, k: int, motifs: np.ndarray, remainder: np.ndarray, first_id: int
+    ) -> tuple:
+        """
+        Builds the edges of every motif of topology `k`. If the builder callback
+        declares an edge template the whole block is built at once, otherwise the
+        callback is called per motif.
+        :param k: topology index
+        :param motifs: (n_motifs, motif_size) block of vertices
+        :param remainder: leftover stubs that do not fill a motif
+        :param first_id: motif id of the first motif in the block
+        :returns tuple: (E, 2) edge array and (E,) motif id array
+        """
+        build_function: callable = self._build_functions[k]
+        template = get_template(build_function, self._motif_sizes[k])
+
+        edges: list = []
+        motif_ids: list = []
+        groups: list = []
+        if template is None:
+            groups = motifs.tolist()
+        else:
+            edges.append(build_from_template(motifs, template))
+            motif_ids.append(
+                np.repeat(np.arange(first_id, first_id + len(motifs)), len(template))
+            )
+            first_id += len(motifs)
+
+        if len(remainder) > 0:
+            # an incomplete motif is still wired from the leftover stubs
+            groups.append(remainder.tolist())
+
+        if groups:
+            es_list: list = []
+            id_list: list = []
+            for id, vertices in enumerate(groups, first_id):
+                es = build_function(vertices)
+                es_list.extend(es)
+                id_list.extend([id] * len(es))
+            edges.append(np.array(es_list, dtype=np.int64).reshape(-1, 2))
+            motif_ids.append(np.array(id_list, dtype=np.int64))
+
+        if not edges:
+            return np.empty((0, 2), dtype=np.int64), np.empty(0, dtype=np.int64)
+        return np.concatenate(edges), np.concatenate(motif_ids)
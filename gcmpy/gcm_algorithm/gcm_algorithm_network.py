@@ -11,6 +11,12 @@ class GCMAlgorithmNetwork(GCMAlgorithm):
         params[GCMAlgorithmNames.MOTIF_SIZES] = self._motif_sizes
         params[GCMAlgorithmNames.BUILD_FUNCTIONS] = self._build_functions
         params[GCMAlgorithmNames.EDGE_NAMES] = self._edge_names
-        CEdgeList = GCMAlgorithmFast(params).random_clustered_graph(jds)
+        params[GCMAlgorithmNames.SEED] = self._rng
+        params[GCMAlgorithmNames.RESAMPLE_ROUNDS] = self._resample_rounds
+        if self._multi_edge_policy is not None:
+            params[GCMAlgorithmNames.MULTI_EDGE_POLICY] = self._multi_edge_policy
+        fast = GCMAlgorithmFast(params)
+        CEdgeList = fast.random_clustered_graph(jds)
+        self._multi_edge_counts = fast.multi_edge_counts
 
         return EdgeListToNetwork.convert(CEdgeList)
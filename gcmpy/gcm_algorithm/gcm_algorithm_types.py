@@ -5,3 +5,5 @@ class GCMAlgorithmTypes(Enum):
     FAST = "fast"
     NETWORK = "network"
     MOTIFS = "motifs"
+    COMPACT = "compact"
+    CSR = "csr"
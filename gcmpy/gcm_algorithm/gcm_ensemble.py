@@ -0,0 +1,148 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Generator
+
+import numpy as np
+
+from gcmpy.gcm_algorithm.gcm_algorithm import GCMAlgorithm
+from gcmpy.gcm_algorithm.gcm_algorithm_main import GCMAlgorithmMain
+from gcmpy.joint_degree.joint_degree import JointDegree
+
+# ensemble held by each worker process, set when the pool starts
+_worker_ensemble = None
+
+
+def _init_worker(ensemble: "GCMEnsemble") -> None:
+    global _worker_ensemble
+    _worker_ensemble = ensemble
+
+
+def _run_realization(index: int, seed: np.random.SeedSequence) -> tuple:
+    return index, _worker_ensemble.realization(seed)
+
+
+class GCMEnsemble:
+    """
+    Generates an ensemble of independent GCM realizations. Each realization samples
+    a joint degree sequence of `n_vertices` from `joint_degree` and wires it with
+    the GCM algorithm that `GCMAlgorithmMain.load_gcm_algorithm` returns for `params`.
+
+    Realizations draw from independent streams spawned from one
+    `numpy.random.SeedSequence`, so the i-th realization of root seed `s` is
+    reproduced by `realization(SeedSequence(s, spawn_key=(i,)))` regardless of
+    which process generated it. The joint degree object and algorithm are handed
+    to the workers when the pool starts: with the `fork` start method closures
+    such as `poisson(2.5)` can be used, with `spawn` they must be picklable.
+    :param joint_degree: JointDegree to sample joint degree sequences from
+    :param params: GCM algorithm params dict, including the `GCM_type`
+    :param n_vertices: number of vertices in each realization
+    """
+
+    def __init__(self, joint_degree: JointDegree, params: dict, n_vertices: int):
+        self._joint_degree: JointDegree = joint_degree
+        self._algorithm: GCMAlgorithm = GCMAlgorithmMain.load_gcm_algorithm(params)
+        self._n_vertices: int = n_vertices
+
+    @staticmethod
+    def spawn_seeds(n_realizations: int, seed=None) -> list:
+        """
+        Spawns one independent SeedSequence per realization.
+        :param n_realizations: number of realizations
+        :param seed: root entropy (int) or SeedSequence, random if None
+        :returns list: SeedSequence per realization
+        """
+        if not isinstance(seed, np.random.SeedSequence):
+            seed = np.random.SeedSequence(seed)
+        return seed.spawn(n_realizations)
+
+    def realization(self, seed) -> Any:
+        """
+        Generates one realization. The result depends on `seed` alone.
+        :param seed: SeedSequence or int
+        :returns: graph in the output format of the GCM algorithm
+        """
+        if not isinstance(seed, np.random.SeedSequence):
+            seed = np.random.SeedSequence(seed)
+
+        # separate streams for sampling the jds and for wiring the stubs
+        self._joint_degree.rng = np.random.SeedSequence(
+            seed.entropy, spawn_key=seed.spawn_key + (0,)
+        )
+        self._algorithm.rng = np.random.SeedSequence(
+            seed.entropy, spawn_key=seed.spawn_key + (1,)
+        )
+        jds = self._joint_degree.sample_jds_from_jdd(self._n_vertices)
+        return self._algorithm.random_clustered_graph(jds)
+
+    def realizations(
+        self,
+        n_realizations: int,
+        seed=None,
+        n_workers: int = None,
+        mp_context=None,
+    ) -> Generator:
+        """
+        Generates the ensemble across a process pool and yields each realization
+        as soon as it finishes, so it can be written out without holding the whole
+        ensemble in memory. With `n_workers=1` realizations run in this process.
+        :param n_realizations: number of realizations
+        :param seed: root entropy (int) or SeedSequence, random if None
+        :param n_workers: number of worker processes, defaults to the cpu count
+        :param mp_context: optional multiprocessing context for the pool
+        :returns generator: tuples of (index, seed, graph) in completion order
+        """
+        seeds = self.spawn_seeds(n_realizations, seed)
+
+        if n_workers == 1:
+            for index, s in enumerate(seeds):
+                yield index, s, self.realization(s)
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(self,),
+        ) as pool:
+            futures = {
+                pool.submit(_run_realization, index, s): index
+                for index, s in enumerate(seeds)
+            }
+            for future in as_completed(futures):
+                # drop the finished future so its graph is not retained
+                del futures[future]
+                index, graph = future.result()
+                yield index, seeds[index], graph
+
+    def generate(
+        self,
+        n_realizations: int,
+        seed=None,
+        n_workers: int = None,
+        mp_context=None,
+    ) -> list:
+        """
+        Generates the ensemble and returns it ordered by realization index.
+        :param n_realizations: number of realizations
+        :param seed: root entropy (int) or SeedSequence, random if None
+        :param n_workers: number of worker processes, defaults to the cpu count
+        :param mp_context: optional multiprocessing context for the pool
+        :returns list: graphs in the output format of the GCM algorithm
+        """
+        ensemble: list = [None] * n_realizations
+        for index, _, graph in self.realizations(
+            n_realizations, seed, n_workers, mp_context
+        ):
+            ensemble[index] = graph
+        return ensemble
+
+    @property
+    def joint_degree(self) -> JointDegree:
+        return self._joint_degree
+
+    @property
+    def algorithm(self) -> GCMAlgorithm:
+        return self._algorithm
+
+    @property
+    def n_vertices(self) -> int:
+        return self._n_vertices
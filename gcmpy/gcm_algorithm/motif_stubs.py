@@ -0,0 +1,76 @@
+import numpy as np
+
+
+class MotifStubs:
+    """
+    Vectorised stub expansion for the GCM algorithms. A joint degree sequence
+    of `N` vertices over `T` topologies is handled as an `(N, T)` integer array.
+    Each column is expanded into a stub list with `np.repeat`, permuted with a
+    `numpy.random.Generator` and reshaped into an `(n_motifs, motif_size)` block
+    whose rows are the vertices of each motif.
+    """
+
+    @staticmethod
+    def as_joint_degree_array(jds) -> np.ndarray:
+        """
+        Converts a joint degree sequence to an `(N, T)` integer array.
+        :param jds: list of joint degree tuples or array
+        :returns np.ndarray: joint degree array
+        """
+        arr = np.asarray(jds, dtype=np.int64)
+        if arr.ndim == 1:
+            arr = arr.reshape(-1, 1)
+        return arr
+
+    @staticmethod
+    def expand(degrees: np.ndarray) -> np.ndarray:
+        """
+        Repeats each vertex index by its degree in a single topology.
+        :param degrees: 1D array of degrees
+        :returns np.ndarray: stub list of vertex indices
+        """
+        return np.repeat(np.arange(len(degrees), dtype=np.int64), degrees)
+
+    @staticmethod
+    def partition(stubs: np.ndarray, motif_size: int) -> tuple:
+        """
+        Reshapes a stub list into rows of `motif_size` vertices. Stubs that do not
+        fill a complete motif are returned separately.
+        :param stubs: 1D array of vertex indices
+        :param motif_size: number of vertices in the motif
+        :returns tuple: (n_motifs, motif_size) block and remainder array
+        """
+        n_motifs = len(stubs) // motif_size
+        cut = n_motifs * motif_size
+        return stubs[:cut].reshape(n_motifs, motif_size), stubs[cut:]
+
+    @staticmethod
+    def motif_block(
+        degrees: np.ndarray, motif_size: int, rng: np.random.Generator
+    ) -> tuple:
+        """
+        Expands, shuffles and partitions the stubs of a single topology.
+        :param degrees: 1D array of degrees in the topology
+        :param motif_size: number of vertices in the motif
+        :param rng: numpy random generator used for the permutation
+        :returns tuple: (n_motifs, motif_size) block and remainder array
+        """
+        stubs = MotifStubs.expand(degrees)
+        rng.shuffle(stubs)
+        return MotifStubs.partition(stubs, motif_size)
+
+    @staticmethod
+    def motif_blocks(
+        jds: np.ndarray, motif_sizes: list, rng: np.random.Generator
+    ) -> list:
+        """
+        Expands, shuffles and partitions the stubs of every topology.
+        :param jds: (N, T) joint degree array
+        :param motif_sizes: number of vertices in each motif
+        :param rng: numpy random generator used for the permutation
+        :returns list: tuples of (motif block, remainder) per topology
+        """
+        return [
+            MotifStubs.motif_block(jds[:, k], motif_size, rng)
+            for k, motif_size in enumerate(motif_sizes)
+        ]
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class MultiEdgePolicy(Enum):
+    ERASE = "erase"
+    REPORT = "report"
+    RESAMPLE = "resample"
@@ -1,5 +1,11 @@
 # flake8: noqa
 from .joint_degree import JointDegree
+from .alias_table import AliasTable
+from .joint_degree_table import JointDegreeTable
+from .joint_degree_counter import JointDegreeCounter
+from .vectorized import vectorized, is_vectorized
+from .integer_partitions import IntegerPartitions
 from .joint_degree_type import JointDegreeType
 from .joint_degree_factory import JointDegreeFactory
 from .joint_degree_distribution import JointDegreeDistribution
+from .joint_degree_cache import JointDegreeCache
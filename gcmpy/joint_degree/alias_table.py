@@ -0,0 +1,61 @@
+import numpy as np
+
+
+class AliasTable:
+    """
+    Walker/Vose alias table for drawing indices from a discrete distribution in
+    O(1) per sample. The table is built once in O(K) from the `K` weights; each
+    draw picks a column uniformly and keeps it or takes its alias by comparing
+    a uniform variate with the column's probability.
+    :param weights: (K,) non-negative weights, need not be normalised
+    """
+
+    def __init__(self, weights: np.ndarray):
+        weights = np.asarray(weights, dtype=float)
+        n = len(weights)
+        if n == 0 or not weights.sum() > 0:
+            raise ValueError("AliasTable requires at least one positive weight")
+
+        scaled = (weights * n / weights.sum()).tolist()
+        prob = [1.0] * n
+        alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+        while small and large:
+            s = small.pop()
+            g = large.pop()
+            prob[s] = scaled[s]
+            alias[s] = g
+            # the large column donates the mass that fills column s
+            scaled[g] += scaled[s] - 1.0
+            if scaled[g] < 1.0:
+                small.append(g)
+            else:
+                large.append(g)
+        # columns left in either list are full up to rounding error
+
+        self._prob: np.ndarray = np.array(prob)
+        self._alias: np.ndarray = np.array(alias, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self._prob)
+
+    def sample(self, n: int, rng: np.random.Generator) -> np.ndarray:
+        """
+        Draws `n` indices.
+        :param n: number of samples
+        :param rng: numpy random generator
+        :returns np.ndarray: (n,) array of indices into the weights
+        """
+        columns = rng.integers(0, len(self._prob), size=n)
+        keep = rng.random(n) < self._prob[columns]
+        return np.where(keep, columns, self._alias[columns])
+
+    @property
+    def prob(self) -> np.ndarray:
+        return self._prob
+
+    @property
+    def alias(self) -> np.ndarray:
+        return self._alias
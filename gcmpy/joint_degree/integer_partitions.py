@@ -0,0 +1,59 @@
+from collections import deque
+
+import numpy as np
+
+
+class IntegerPartitions:
+    """
+    Enumerates the partitions of successive integers `k` into parts of size
+    1..`n_parts`. The partitions of `k` are returned as an `(n, n_parts)` array
+    whose column `i` counts the parts of size `i + 1`, so each row `jd` satisfies
+    `sum((i + 1) * jd[i]) == k`.
+
+    The partitions of `k` with parts of size at most `t` are those with parts at
+    most `t - 1` together with those of `k - t` with one more part of size `t`.
+    The arrays are therefore grown from the previous integers and only the last
+    `n_parts` of them are remembered.
+    :param n_parts: largest part size
+    """
+
+    def __init__(self, n_parts: int):
+        self._n_parts: int = n_parts
+        self._k: int = -1
+        # partitions of the most recent integers, one array per largest part size
+        self._window: deque = deque(maxlen=n_parts)
+
+    def __call__(self, k: int) -> np.ndarray:
+        """
+        Partitions of `k`. Integers are visited in increasing order, so calls
+        for increasing `k` reuse the work done for the previous ones.
+        :param k: integer to partition
+        :returns np.ndarray: (n, n_parts) array of part counts
+        """
+        if k < self._k:
+            self._k = -1
+            self._window.clear()
+        while self._k < k:
+            self._window.append(self.extend())
+            self._k += 1
+        return self._window[-1][-1]
+
+    def extend(self) -> list:
+        """
+        Partitions of the integer after the last one visited, for every bound
+        on the part size.
+        :returns list: (n, n_parts) arrays for largest part size 1..n_parts
+        """
+        k = self._k + 1
+        first = np.zeros((1, self._n_parts), dtype=np.int64)
+        first[0, 0] = k
+        levels = [first]
+        for t in range(2, self._n_parts + 1):
+            if k < t:
+                levels.append(levels[-1])
+                continue
+            # partitions of k - t with parts at most t, plus one part of size t
+            previous = self._window[-t][t - 1].copy()
+            previous[:, t - 1] += 1
+            levels.append(np.concatenate([levels[-1], previous]))
+        return levels
@@ -1,10 +1,13 @@
-import random
 from collections import Counter
 from abc import ABC, abstractmethod
 
+import numpy as np
+
+from gcmpy.joint_degree.alias_table import AliasTable
+from gcmpy.joint_degree.joint_degree_table import JointDegreeTable
 
-class JointDegree(ABC):
 
+class JointDegree(ABC):
     """
     Abstract class whose purpose is to generate a joint degree
     distribution (jdd) dict through a variety of methods. A jdd
@@ -13,10 +16,20 @@ class JointDegree(ABC):
 
     The abstract method `create_jdd' should be defined in a subclass
     and is the primary method that will be called to create an object
-    to be sampled.
+    to be sampled. It is not called by the constructor: the jdd is built
+    once, on first access to `jdd' or first sample, and rebuilt only
+    after `invalidate_jdd' is called because a parameter changed.
     """
 
     _type: str = ""
+    _jdd: dict = None
+    _jdd_arrays: tuple = None  # (K, T) keys and (K,) weights of a compact jdd
+    _truncated_mass: float = 0.0  # mass of pruned joint degrees
+    _rng: np.random.Generator = None
+    _sampler: tuple = None  # (jdd it was built from, key array, AliasTable)
+    _table: tuple = None  # (jdd it was built from, JointDegreeTable)
+    _preserve_distribution: bool = False
+    _built: bool = False  # whether create_jdd has run for the current params
 
     def __init__(self):
         self._jdd: dict = None
@@ -35,56 +48,259 @@ class JointDegree(ABC):
             "Error attempting to call virtual method on JointDegree: create_joint_degree"
         )
 
-    def handshaking_lemma(self, jds: list) -> list:
-        """
-        Samples a joint degree sequence from the joint degree distribution.
-        Then ensures the handshaking lemma is satisfied by adding another
-        subgraph to the network.
-        """
-        # ensure that the sum of the numbers is divisible by the motif size
-        ntops = list(map(sum, zip(*jds)))
-        for i, ntop in enumerate(ntops):
-            if ntop % self._motif_sizes[i] != 0:
-                # if not, round up to add one more motif to the network
-                for j in range(self._motif_sizes[i] - ntop % self._motif_sizes[i]):
-                    j = random.randrange(0, len(jds))
-                    t = list(jds[j])
-                    t[i] += 1
-                    jds[j] = t
+    def build(self) -> None:
+        """
+        Calls `create_jdd' unless the jdd is already built.
+        """
+        if self._built:
+            return
+        # mark first so that create_jdd may read the jdd it is building
+        self._built = True
+        try:
+            self.create_jdd()
+        except BaseException:
+            self._built = False
+            raise
+
+    def invalidate_jdd(self) -> None:
+        """
+        Marks the jdd as stale so that it is rebuilt on next use.
+        """
+        self._built = False
+        self.invalidate_sampler()
+
+    def handshaking_lemma(self, jds: np.ndarray) -> np.ndarray:
+        """
+        Ensures the handshaking lemma is satisfied, i.e. that the stubs of each
+        topology sum to a multiple of its motif size. By default the missing
+        stubs of another subgraph are added to randomly chosen vertices in a
+        single scatter. If `preserve_distribution' is set, removing the excess
+        stubs is also considered, and the vertices are chosen to keep the joint
+        degree sequence closest to the jdd.
+        :param jds: (N, T) array or list of joint degree tuples
+        :returns np.ndarray: (N, T) joint degree array
+        """
+        jds = np.array(jds, dtype=np.int64).reshape(len(jds), len(self._motif_sizes))
+        sizes = np.asarray(self._motif_sizes, dtype=np.int64)
+
+        if self._preserve_distribution:
+            for i in range(jds.shape[1]):
+                self.repair_topology(jds, i, int(sizes[i]))
+            return jds
+
+        # round up to add one more motif of each unbalanced topology
+        missing = -jds.sum(axis=0) % sizes
+        columns = np.repeat(np.arange(jds.shape[1]), missing)
+        rows = self.rng.integers(0, len(jds), size=len(columns))
+        np.add.at(jds, (rows, columns), 1)
         return jds
 
-    def sample_jds_from_jdd(self, N: int) -> list:
+    def repair_topology(self, jds: np.ndarray, i: int, motif_size: int) -> None:
+        """
+        Balances the stubs of topology `i' in place by either adding the stubs
+        that complete one more motif or removing the excess stubs, whichever
+        moves vertices to the joint degrees with the highest weight in the jdd
+        relative to their current one. At most one stub is changed per vertex.
+        :param jds: (N, T) joint degree array
+        :param i: topology index
+        :param motif_size: number of vertices in the motif
+        """
+        excess = int(jds[:, i].sum() % motif_size)
+        if excess == 0:
+            return
+
+        keys, inverse = np.unique(jds, axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        counts = np.bincount(inverse, minlength=len(keys))
+
+        best = None
+        for delta, n_stubs in ((1, motif_size - excess), (-1, excess)):
+            moved = keys.copy()
+            moved[:, i] += delta
+            # log weight ratio of moving a vertex from each key to its neighbour
+            scores = np.array(
+                [self.log_weight(m) - self.log_weight(k) for k, m in zip(keys, moved)]
+            )
+            scores[np.isnan(scores)] = -np.inf
+            available = np.where(moved[:, i] < 0, 0, counts)
+
+            # take stubs from the best scoring keys first
+            order = np.argsort(-scores, kind="stable")
+            before = np.cumsum(available[order]) - available[order]
+            taken = np.clip(n_stubs - before, 0, available[order])
+            if taken.sum() < n_stubs:
+                continue
+            chosen = taken > 0
+            total = float(np.dot(taken[chosen], scores[order][chosen]))
+            if best is None or total > best[0]:
+                best = (total, delta, order[chosen], taken[chosen])
+
+        if best is None:
+            # too few vertices to change one stub each, so fall back to adding
+            rows = self.rng.integers(0, len(jds), size=motif_size - excess)
+            np.add.at(jds[:, i], rows, 1)
+            return
+
+        _, delta, key_ids, n_taken = best
+        for key_id, n in zip(key_ids, n_taken):
+            rows = self.rng.choice(
+                np.flatnonzero(inverse == key_id), size=int(n), replace=False
+            )
+            jds[rows, i] += delta
+
+    def log_weight(self, key: np.ndarray) -> float:
         """
-        Chooses a list of `N' keys from `self._jdd' with replacement
-        according to their weighting in the joint degree distribution.
+        Log of the weight of a joint degree in the jdd, -inf if it is absent.
+        """
+        table = self.table
+        weight = table.weight(key.tolist()) if table is not None else 0.0
+        return float(np.log(weight)) if weight > 0 else -np.inf
+
+    def sample_jds_from_jdd(self, N: int) -> np.ndarray:
+        """
+        Chooses `N' keys from `self._jdd' with replacement according to their
+        weighting in the joint degree distribution, drawing from the numpy
+        Generator `self.rng' through a cached alias table.
         Checks the handshaking lemma is satisfied.
         :param N int: number of keys to choose
-        :returns list: list of key choices
+        :returns np.ndarray: (N, T) array of key choices
         """
-        keys = list(self._jdd.keys())
-        weights = list(self._jdd.values())
-        jds = random.choices(population=keys, weights=weights, k=N)
+        keys, table = self.sampler()
+        jds = keys[table.sample(N, self.rng)]
         return self.handshaking_lemma(jds)
 
+    def sampler(self) -> tuple:
+        """
+        Returns the keys of the jdd as a (K, T) array together with an alias
+        table over their weights. Both are built on first use and cached
+        until the jdd is replaced or normalised.
+        :returns tuple: key array and AliasTable
+        """
+        self.build()
+        source = self._jdd if self._jdd_arrays is None else self._jdd_arrays
+        if self._sampler is None or self._sampler[0] is not source:
+            keys, weights = self.jdd_arrays()
+            self._sampler = (source, keys, AliasTable(weights))
+        return self._sampler[1], self._sampler[2]
+
+    def jdd_arrays(self) -> tuple:
+        """
+        Returns the jdd as a (K, T) array of joint degrees and a (K,) array of
+        weights.
+        :returns tuple: key array and weight array, or None if there is no jdd
+        """
+        self.build()
+        if self._jdd_arrays is not None:
+            return self._jdd_arrays
+        if self._jdd is None:
+            return None
+        keys = list(self._jdd.keys())
+        weights = np.fromiter(self._jdd.values(), dtype=float, count=len(keys))
+        return np.array(keys, dtype=np.int64).reshape(len(keys), -1), weights
+
+    def set_jdd_arrays(self, keys: np.ndarray, weights: np.ndarray) -> None:
+        """
+        Stores the jdd compactly as arrays of joint degrees and weights. The
+        dict returned by `jdd' is only built if it is requested.
+        :param keys: (K, T) array of joint degrees
+        :param weights: (K,) array of weights
+        """
+        self._jdd = None
+        self._jdd_arrays = (
+            np.asarray(keys, dtype=np.int64).reshape(len(keys), -1),
+            np.asarray(weights, dtype=float),
+        )
+        self._built = True
+        self.invalidate_sampler()
+
+    def invalidate_sampler(self) -> None:
+        """
+        Discards the cached alias table and `JointDegreeTable'. Needed only if
+        `self._jdd' is edited in place rather than through the `jdd' setter.
+        """
+        self._sampler = None
+        self._table = None
+
     def normalise_jdd(self) -> None:
-        summation: float = sum(self._jdd.values())
-        for key in self._jdd:
-            self._jdd[key] /= summation
+        if self._jdd_arrays is not None:
+            keys, weights = self._jdd_arrays
+            self._jdd_arrays = (keys, weights / weights.sum())
+        if self._jdd is not None:
+            summation: float = sum(self._jdd.values())
+            for key in self._jdd:
+                self._jdd[key] /= summation
+        self.invalidate_sampler()
 
     def convert_jds_to_jdd(self, jds: list) -> None:
         n_samples: int = len(jds)
         self._jdd = {}
+        self._jdd_arrays = None
+        self._built = True
+        self.invalidate_sampler()
+        if isinstance(jds, np.ndarray):
+            jds = list(map(tuple, jds.tolist()))
         d = Counter(jds)
         for k, v in d.items():
             self._jdd[k] = v / n_samples
 
     @property
     def jdd(self) -> dict:
+        self.build()
+        if self._jdd is None and self._jdd_arrays is not None:
+            keys, weights = self._jdd_arrays
+            self._jdd = dict(zip(map(tuple, keys.tolist()), weights.tolist()))
         return self._jdd
 
     @jdd.setter
     def jdd(self, value: dict) -> None:
         self._jdd = value
+        self._jdd_arrays = None
+        self._built = True
+        self.invalidate_sampler()
+
+    @property
+    def table(self) -> JointDegreeTable:
+        """
+        The jdd as a `JointDegreeTable', built on first use and cached until the
+        jdd is replaced or normalised. None if there is no jdd.
+        """
+        self.build()
+        source = self._jdd if self._jdd_arrays is None else self._jdd_arrays
+        if source is None:
+            return None
+        if self._table is None or self._table[0] is not source:
+            self._table = (source, JointDegreeTable(*self.jdd_arrays()))
+        return self._table[1]
+
+    @table.setter
+    def table(self, value: JointDegreeTable) -> None:
+        self.set_jdd_arrays(value.keys, value.weights)
+
+    @property
+    def truncated_mass(self) -> float:
+        """
+        Probability mass of the joint degrees pruned from the jdd.
+        """
+        self.build()
+        return self._truncated_mass
+
+    @property
+    def rng(self) -> np.random.Generator:
+        if self._rng is None:
+            self._rng = np.random.default_rng()
+        return self._rng
+
+    @rng.setter
+    def rng(self, value) -> None:
+        self._rng = np.random.default_rng(value)
+
+    @property
+    def preserve_distribution(self) -> bool:
+        return self._preserve_distribution
+
+    @preserve_distribution.setter
+    def preserve_distribution(self, value: bool) -> None:
+        self._preserve_distribution = value
 
     @property
     def motif_sizes(self) -> list:
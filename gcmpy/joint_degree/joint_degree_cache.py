@@ -0,0 +1,201 @@
+import hashlib
+import os
+import tempfile
+from enum import Enum
+from numbers import Integral, Real
+
+import numpy as np
+
+from gcmpy.joint_degree.joint_degree import JointDegree
+from gcmpy.joint_degree.joint_degree_type import JointDegreeType
+from gcmpy.names.joint_degree_names import JointDegreeNames
+
+
+class JointDegreeCache:
+    """
+    Content-addressed on-disk cache of joint degree distributions. An entry is
+    keyed by a hash of the loader type and its params and holds the jdd as key
+    and weight arrays in a `.npz` file under `cache_dir`. Callables in the params,
+    such as marginal functions, cannot be hashed by content, so params holding
+    callables are only cached if they also carry a `cache_token` naming them.
+    Input files are hashed by their path, size and modification time, so an
+    entry is not served once a file has been rewritten.
+    Entries are evicted least recently used first once the files exceed
+    `max_bytes`.
+    :param cache_dir: directory holding the cache files, created if missing
+    :param max_bytes: optional bound on the total size of the cache files
+    """
+
+    SUFFIX: str = ".npz"
+
+    # bump to invalidate entries written by an older layout
+    VERSION: int = 1
+
+    # params that do not change the jdd
+    IGNORED: tuple = (
+        JointDegreeNames.SEED,
+        JointDegreeNames.PRESERVE_DISTRIBUTION,
+        JointDegreeNames.CACHE_DIR,
+        JointDegreeNames.CACHE_MAX_BYTES,
+        JointDegreeNames.CHUNK_SIZE,
+        JointDegreeNames.N_WORKERS,
+    )
+
+    # params naming files, hashed by their path, size and modification time
+    FILES: tuple = (JointDegreeNames.JDS_FILES,)
+
+    def __init__(self, cache_dir: str, max_bytes: int = None):
+        os.makedirs(cache_dir, exist_ok=True)
+        self._cache_dir: str = cache_dir
+        self._max_bytes: int = max_bytes
+
+    @staticmethod
+    def key(input_type: JointDegreeType, params: dict) -> str:
+        """
+        Hashes the loader type and params.
+        :param input_type: JointDegreeType of the loader
+        :param params: loader params dict
+        :returns str: hex digest, or None if the params hold callables or other
+        objects that cannot be hashed by content but no token, or name files
+        that cannot be read
+        """
+        digest = hashlib.sha256()
+        found_opaque: list = []
+
+        def numeric(value) -> bool:
+            # rectangular numeric sequences, such as a jds, hash as one buffer
+            try:
+                return np.asarray(value).dtype.kind in "biuf"
+            except ValueError:
+                return False
+
+        def update(value) -> None:
+            if value is None or isinstance(value, (bool, str)):
+                digest.update(f"{type(value).__name__}:{value}|".encode())
+            elif isinstance(value, Enum):
+                update(value.value)
+            elif isinstance(value, Integral):
+                digest.update(f"int:{int(value)}|".encode())
+            elif isinstance(value, Real):
+                digest.update(f"float:{float(value)!r}|".encode())
+            elif isinstance(value, (list, tuple, np.ndarray)) and numeric(value):
+                value = np.asarray(value)
+                digest.update(f"array:{value.dtype.str}:{value.shape}|".encode())
+                digest.update(np.ascontiguousarray(value).tobytes())
+            elif isinstance(value, dict):
+                digest.update(f"dict:{len(value)}|".encode())
+                for k in sorted(value, key=repr):
+                    update(k)
+                    update(value[k])
+            elif isinstance(value, (list, tuple, np.ndarray)):
+                digest.update(f"seq:{len(value)}|".encode())
+                for item in value:
+                    update(item)
+            else:
+                # callables and other objects are named by the cache token
+                found_opaque.append(value)
+                digest.update(f"opaque:{type(value).__name__}|".encode())
+
+        update(JointDegreeCache.VERSION)
+        update(input_type)
+        for name in sorted(params, key=lambda n: n.value):
+            if name in JointDegreeCache.IGNORED:
+                continue
+            update(name)
+            if name in JointDegreeCache.FILES:
+                paths = params[name]
+                if isinstance(paths, (str, os.PathLike)):
+                    paths = [paths]
+                for path in paths:
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        return None
+                    update(os.fspath(path))
+                    update(stat.st_size)
+                    update(stat.st_mtime_ns)
+            else:
+                update(params[name])
+
+        if found_opaque and JointDegreeNames.CACHE_TOKEN not in params:
+            return None
+        return digest.hexdigest()
+
+    def path(self, key: str) -> str:
+        return os.path.join(self._cache_dir, key + self.SUFFIX)
+
+    def load(self, key: str, loader: JointDegree) -> bool:
+        """
+        Sets the jdd of `loader` from the cache, so it is not built, and marks
+        the entry as recently used.
+        :param key: cache key
+        :param loader: JointDegree to receive the cached jdd
+        :returns bool: True on a hit
+        """
+        path = self.path(key)
+        try:
+            with np.load(path) as entry:
+                keys = entry["keys"]
+                weights = entry["weights"]
+                truncated_mass = float(entry["truncated_mass"])
+        except (OSError, KeyError, ValueError):
+            return False
+        os.utime(path)
+
+        loader.set_jdd_arrays(keys, weights)
+        loader._truncated_mass = truncated_mass
+        return True
+
+    def store(self, key: str, loader: JointDegree) -> None:
+        """
+        Writes the jdd of `loader` to the cache and evicts old entries. Loaders
+        that hold no jdd are not cached.
+        :param key: cache key
+        :param loader: JointDegree with a built jdd
+        """
+        arrays = loader.jdd_arrays()
+        if arrays is None:
+            return
+        keys, weights = arrays
+
+        # write to a temporary file first so readers never see a partial entry
+        fd, tmp = tempfile.mkstemp(dir=self._cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            np.savez(
+                f,
+                keys=keys,
+                weights=weights,
+                truncated_mass=np.float64(loader.truncated_mass),
+            )
+        os.replace(tmp, self.path(key))
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Removes the least recently used entries until the cache fits `max_bytes`.
+        """
+        if self._max_bytes is None:
+            return
+        entries = []
+        for name in os.listdir(self._cache_dir):
+            if name.endswith(self.SUFFIX):
+                stat = os.stat(os.path.join(self._cache_dir, name))
+                entries.append((stat.st_mtime, stat.st_size, name))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self._max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self._cache_dir, name))
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    @property
+    def cache_dir(self) -> str:
+        return self._cache_dir
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
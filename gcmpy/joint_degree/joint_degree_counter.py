@@ -0,0 +1,184 @@
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+import numpy as np
+
+from gcmpy.joint_degree.joint_degree_table import JointDegreeTable
+
+
+def _count_file(path: str, chunk_size: int, delimiter: str) -> tuple:
+    counter = JointDegreeCounter()
+    counter.read(path, chunk_size, delimiter)
+    return counter.keys, counter.counts
+
+
+class JointDegreeCounter:
+    """
+    Counts the distinct rows of a joint degree sequence that arrives in chunks,
+    so the sequence never has to be held in memory. Memory is bounded by the
+    number of distinct joint degrees plus one chunk. Counters built from
+    separate files, possibly in separate processes, can be merged.
+    """
+
+    def __init__(self):
+        self._keys: np.ndarray = None  # (K, T) distinct joint degrees, sorted
+        self._counts: np.ndarray = np.zeros(0, dtype=np.int64)
+
+    def update(self, jds: np.ndarray) -> None:
+        """
+        Adds a chunk of joint degrees.
+        :param jds: (M, T) array or list of joint degree tuples
+        """
+        jds = np.asarray(jds, dtype=np.int64)
+        if len(jds) == 0:
+            return
+        keys, counts = np.unique(jds.reshape(len(jds), -1), axis=0, return_counts=True)
+        self.add(keys, counts)
+
+    def add(self, keys: np.ndarray, counts: np.ndarray) -> None:
+        """
+        Adds counts of distinct joint degrees.
+        :param keys: (K, T) array of joint degrees
+        :param counts: (K,) array of their counts
+        """
+        if self._keys is None:
+            self._keys = np.asarray(keys, dtype=np.int64)
+            self._counts = np.asarray(counts, dtype=np.int64)
+            return
+        if keys.shape[1] != self._keys.shape[1]:
+            raise ValueError(
+                f"Error in {self.__class__.__name__}: cannot add joint degrees "
+                f"of {keys.shape[1]} topologies to {self._keys.shape[1]}"
+            )
+        self._keys, inverse = np.unique(
+            np.concatenate([self._keys, keys]), axis=0, return_inverse=True
+        )
+        merged = np.zeros(len(self._keys), dtype=np.int64)
+        np.add.at(merged, inverse.reshape(-1), np.concatenate([self._counts, counts]))
+        self._counts = merged
+
+    def merge(self, other: "JointDegreeCounter") -> "JointDegreeCounter":
+        """
+        Adds the counts of another counter to this one.
+        :param other: JointDegreeCounter
+        :returns JointDegreeCounter: self
+        """
+        if other.keys is not None:
+            self.add(other.keys, other.counts)
+        return self
+
+    def read(self, path: str, chunk_size: int = 1 << 20, delimiter: str = None) -> None:
+        """
+        Counts the joint degrees in a `.npy` file or a text file with one joint
+        degree per line. Blank lines and lines starting with `#` are skipped.
+        :param path: file path
+        :param chunk_size: number of joint degrees read at a time
+        :param delimiter: text column separator, `,` for `.csv` files and
+        whitespace otherwise
+        """
+        if str(path).endswith(".npy"):
+            self.read_npy(path, chunk_size)
+        else:
+            if delimiter is None and str(path).endswith(".csv"):
+                delimiter = ","
+            self.read_text(path, chunk_size, delimiter)
+
+    def read_npy(self, path: str, chunk_size: int = 1 << 20) -> None:
+        """
+        Counts the joint degrees in a `.npy` file, memory mapped and read in chunks.
+        :param path: path of an (N, T) or (N,) integer array
+        :param chunk_size: number of joint degrees read at a time
+        """
+        jds = np.load(path, mmap_mode="r")
+        for start in range(0, len(jds), chunk_size):
+            self.update(np.array(jds[start : start + chunk_size]))
+
+    def read_text(
+        self, path: str, chunk_size: int = 1 << 20, delimiter: str = None
+    ) -> None:
+        """
+        Counts the joint degrees in a text file, read in chunks of lines.
+        :param path: file path
+        :param chunk_size: number of lines read at a time
+        :param delimiter: column separator, whitespace if None
+        """
+        with open(path) as f:
+            while True:
+                lines = list(islice(f, chunk_size))
+                if not lines:
+                    break
+                lines = [
+                    line
+                    for line in lines
+                    if line.strip() and not line.lstrip().startswith("#")
+                ]
+                if lines:
+                    self.update(
+                        np.loadtxt(lines, delimiter=delimiter, dtype=np.int64, ndmin=2)
+                    )
+
+    @staticmethod
+    def count_files(
+        paths: list,
+        chunk_size: int = 1 << 20,
+        delimiter: str = None,
+        n_workers: int = None,
+        mp_context=None,
+    ) -> "JointDegreeCounter":
+        """
+        Counts the joint degrees in several files, one file per worker process,
+        and merges the partial counts. With `n_workers=1` files are read in this
+        process.
+        :param paths: list of file paths
+        :param chunk_size: number of joint degrees read at a time
+        :param delimiter: text column separator, see `read`
+        :param n_workers: number of worker processes, defaults to the cpu count
+        :param mp_context: optional multiprocessing context for the pool
+        :returns JointDegreeCounter: merged counts
+        """
+        counter = JointDegreeCounter()
+        if n_workers == 1 or len(paths) == 1:
+            for path in paths:
+                counter.read(path, chunk_size, delimiter)
+            return counter
+
+        with ProcessPoolExecutor(max_workers=n_workers, mp_context=mp_context) as pool:
+            futures = [
+                pool.submit(_count_file, path, chunk_size, delimiter) for path in paths
+            ]
+            for future in futures:
+                keys, counts = future.result()
+                if keys is not None:
+                    counter.add(keys, counts)
+        return counter
+
+    def jdd_arrays(self) -> tuple:
+        """
+        :returns tuple: (K, T) array of joint degrees and (K,) array of their
+        frequencies
+        :raises ValueError: if no joint degrees were counted
+        """
+        if self._keys is None or self.n_samples == 0:
+            raise ValueError("JointDegreeCounter has counted no joint degrees")
+        return self._keys, self._counts / self._counts.sum()
+
+    def table(self) -> JointDegreeTable:
+        """
+        :returns JointDegreeTable: the empirical jdd
+        """
+        return JointDegreeTable(*self.jdd_arrays())
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    @property
+    def keys(self) -> np.ndarray:
+        return self._keys
+
+    @property
+    def counts(self) -> np.ndarray:
+        return self._counts
+
+    @property
+    def n_samples(self) -> int:
+        return int(self._counts.sum())
@@ -1,6 +1,7 @@
 from gcmpy.joint_degree.joint_degree_type import JointDegreeType
 from gcmpy.joint_degree.joint_degree import JointDegree
 from gcmpy.joint_degree.joint_degree_factory import JointDegreeFactory
+from gcmpy.joint_degree.joint_degree_cache import JointDegreeCache
 from gcmpy.names.joint_degree_names import JointDegreeNames
 
 
@@ -10,6 +11,11 @@ class JointDegreeDistribution:
     dict to contain key `joint_degree_type'.
     :method load_joint_degree: returns a subclass of ABC `JointDegree`. This
     will raise an error if the params dict does not contain the required keys.
+    An optional `seed' key seeds the Generator used to sample the jdd and an
+    optional `preserve_distribution' key selects the handshaking repair. The
+    returned loader builds its jdd on first use. If `cache_dir' is given the jdd
+    is instead read from, or built and written to, a `JointDegreeCache' in that
+    directory.
     """
 
     @staticmethod
@@ -18,8 +24,25 @@ class JointDegreeDistribution:
             input_type = JointDegreeType(params[JointDegreeNames.JOINT_DEGREE_TYPE])
         except Exception as e:
             raise (f"Error instantiating JointDegreeDistribution: {e}")
+        cache: JointDegreeCache = None
+        key: str = None
+        if JointDegreeNames.CACHE_DIR in params:
+            max_bytes = None
+            if JointDegreeNames.CACHE_MAX_BYTES in params:
+                max_bytes = params[JointDegreeNames.CACHE_MAX_BYTES]
+            cache = JointDegreeCache(params[JointDegreeNames.CACHE_DIR], max_bytes)
+            key = cache.key(input_type, params)
+
+        # the jdd is built lazily on first use, so a cache hit skips it entirely
         loader: JointDegree = JointDegreeFactory.resolve_joint_degree(
             input_type, params
         )
-        loader.create_jdd()
+        if key is not None and not cache.load(key, loader):
+            cache.store(key, loader)
+        if JointDegreeNames.SEED in params:
+            loader.rng = params[JointDegreeNames.SEED]
+        if JointDegreeNames.PRESERVE_DISTRIBUTION in params:
+            loader.preserve_distribution = params[
+                JointDegreeNames.PRESERVE_DISTRIBUTION
+            ]
         return loader
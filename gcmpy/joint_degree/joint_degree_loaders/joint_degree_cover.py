@@ -1,3 +1,7 @@
+from itertools import chain
+
+import numpy as np
+
 from gcmpy.joint_degree.joint_degree import JointDegree
 from gcmpy.joint_degree.joint_degree_type import JointDegreeType
 from gcmpy.names.joint_degree_names import JointDegreeNames
@@ -13,37 +17,33 @@ class JointDegreeCover(JointDegree):
             raise (f"Error instantiating {self.__class__.__name__}: {e}")
 
         self._motif_sizes = sorted(list(set([len(c) for c in self._cover])))
-        self.create_jdd()
 
     def create_jdd(self) -> None:
-        vertex_ids = list(set([vertex for clique in self._cover for vertex in clique]))
-
-        zero_index = 0
-        if min(vertex_ids) != zero_index:
-            zero_index = 1
-
-        largest_clique = len(max(self._cover, key=len))
-
-        jds = []
-        for _ in range(len(vertex_ids)):
-            jd = [0] * largest_clique
-            jds.append(jd)
-
-        for c in self._cover:
-            clique_size = len(c)
-            for vertex in c:
-                jds[vertex - zero_index][clique_size - 1] += 1
-
-        # iterate each column of the jds and record the index if all zeros
-        indxs = [i for i, top in enumerate(zip(*jds)) if not any(top)]
-
-        # use the indexes of the zero columns to remove
-        for i in indxs:
-            for jd in jds:
-                del jd[i]
-
-        # convert jds to jdd
-        self.convert_jds_to_jdd(jds)
+        """
+        Counts the cliques of each size that every vertex belongs to and takes
+        the distribution of the resulting joint degrees. Topologies are the
+        clique sizes present in the cover, in increasing order.
+        """
+        sizes = np.fromiter(
+            map(len, self._cover), dtype=np.int64, count=len(self._cover)
+        )
+        vertices = np.fromiter(
+            chain.from_iterable(self._cover), dtype=np.int64, count=int(sizes.sum())
+        )
+        # relabel vertices 0..N-1 and give each membership its clique size column
+        _, rows = np.unique(vertices, return_inverse=True)
+        columns = np.repeat(sizes - 1, sizes)
+
+        n_vertices = int(rows.max()) + 1
+        largest_clique = int(sizes.max())
+        counts = np.bincount(
+            rows * largest_clique + columns, minlength=n_vertices * largest_clique
+        ).reshape(n_vertices, largest_clique)
+
+        # drop the clique sizes that do not occur
+        jds = counts[:, counts.any(axis=0)]
+        keys, n_keys = np.unique(jds, axis=0, return_counts=True)
+        self.set_jdd_arrays(keys, n_keys / n_vertices)
 
     @property
     def cover(self) -> list:
@@ -52,3 +52,5 @@ class JointDegreeCover(JointDegree):
     @cover.setter
     def cover(self, value: list) -> None:
         self._cover = value
+        self._motif_sizes = sorted(list(set([len(c) for c in self._cover])))
+        self.invalidate_jdd()
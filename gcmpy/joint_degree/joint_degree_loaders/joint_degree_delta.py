@@ -1,3 +1,8 @@
+import numpy as np
+
+from gcmpy.joint_degree.joint_degree_loaders.joint_degree_marginal import (
+    JointDegreeMarginal,
+)
 from gcmpy.joint_degree.joint_degree_loaders.joint_degree_split_degree import (
     JointDegreeSplitDegree,
 )
@@ -18,15 +23,19 @@ class JointDegreeDelta(JointDegreeSplitDegree):
         except Exception as e:
             raise (f"Error instantiating {self.__class__.__name__}: {e}")
 
-        self.create_jdd()
-
     def create_jdd(self) -> None:
-        self._jdd = {}
-        for k in range(self._low_high_degree_bound[0], self._low_high_degree_bound[1]):
-            zeros = [0] * len(self._motif_sizes)
-            if k != self._target_k:
-                zeros[0] = k
-                self._jdd[tuple(zeros)] = self._fp(k)
-            else:
-                self.resolve_degree(k, self._fp(k))
+        ks = np.arange(*self._low_high_degree_bound)
+        pks = JointDegreeMarginal.evaluate_marginal(self._fp, ks)
+
+        # every degree but the target is placed in the first topology
+        keys = np.zeros((len(ks), len(self._motif_sizes)), dtype=np.int64)
+        keys[:, 0] = ks
+        weights = pks
+        target = np.flatnonzero(ks == self._target_k)
+        if len(target):
+            i = int(target[0])
+            jds, probabilities = self.resolve_degree(self._target_k, pks[i])
+            keys = np.concatenate([keys[:i], jds, keys[i + 1 :]])
+            weights = np.concatenate([pks[:i], probabilities, pks[i + 1 :]])
+        self.set_jdd_arrays(keys, weights)
         self.normalise_jdd()
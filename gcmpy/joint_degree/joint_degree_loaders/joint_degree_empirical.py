@@ -1,22 +1,53 @@
 from gcmpy.joint_degree.joint_degree import JointDegree
+from gcmpy.joint_degree.joint_degree_counter import JointDegreeCounter
 from gcmpy.joint_degree.joint_degree_type import JointDegreeType
 from gcmpy.names.joint_degree_names import JointDegreeNames
 
 
 class JointDegreeEmpirical(JointDegree):
+    """
+    Empirical jdd of a measured joint degree sequence. The sequence is given
+    either in memory as `jds`, a list of tuples or a `JointDegreeCounter`, or as
+    `jds_files`, a list of `.npy`, `.csv` or whitespace separated text files
+    that are streamed in chunks and counted in parallel.
+    :param motif_sizes: list of ints for number of vertices in each motif
+    :param jds: joint degree sequence
+    :param jds_files: list of file paths holding the joint degree sequence
+    :param chunk_size: optional number of joint degrees read at a time
+    :param n_workers: optional number of processes counting files
+    """
+
     _type: str = JointDegreeType.EMPIRICAL
 
     def __init__(self, params: dict):
         self._empirical_jds: list = []
+        self._jds_files: list = None
+        self._chunk_size: int = 1 << 20
+        self._n_workers: int = None
         try:
             self._motif_sizes = params[JointDegreeNames.MOTIF_SIZES]
-            self._empirical_jds = params[JointDegreeNames.JDS]
+            if JointDegreeNames.JDS_FILES in params:
+                self._jds_files = params[JointDegreeNames.JDS_FILES]
+            else:
+                self._empirical_jds = params[JointDegreeNames.JDS]
         except Exception as e:
             raise (f"Error instantiating {self.__class__.__name__}: {e}")
-        self.create_jdd()
+
+        if JointDegreeNames.CHUNK_SIZE in params:
+            self._chunk_size = params[JointDegreeNames.CHUNK_SIZE]
+        if JointDegreeNames.N_WORKERS in params:
+            self._n_workers = params[JointDegreeNames.N_WORKERS]
 
     def create_jdd(self) -> None:
-        self.convert_jds_to_jdd(self._empirical_jds)
+        if self._jds_files is not None:
+            counter = JointDegreeCounter.count_files(
+                self._jds_files, self._chunk_size, n_workers=self._n_workers
+            )
+            self.set_jdd_arrays(*counter.jdd_arrays())
+        elif isinstance(self._empirical_jds, JointDegreeCounter):
+            self.set_jdd_arrays(*self._empirical_jds.jdd_arrays())
+        else:
+            self.convert_jds_to_jdd(self._empirical_jds)
 
     @property
     def empirical_jds(self) -> list:
@@ -25,3 +56,14 @@ class JointDegreeEmpirical(JointDegree):
     @empirical_jds.setter
     def empirical_jds(self, value: list) -> None:
         self._empirical_jds = value
+        self._jds_files = None
+        self.invalidate_jdd()
+
+    @property
+    def jds_files(self) -> list:
+        return self._jds_files
+
+    @jds_files.setter
+    def jds_files(self, value: list) -> None:
+        self._jds_files = value
+        self.invalidate_jdd()
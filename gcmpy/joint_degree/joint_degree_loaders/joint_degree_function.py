@@ -1,18 +1,25 @@
-from itertools import product
+import numpy as np
 
 from gcmpy.joint_degree.joint_degree import JointDegree
 from gcmpy.joint_degree.joint_degree_type import JointDegreeType
+from gcmpy.joint_degree.vectorized import is_vectorized
 from gcmpy.names.joint_degree_names import JointDegreeNames
 
 
 class JointDegreeFunction(JointDegree):
     """
     Multivariate function to evaluate the probability of given joint degree from an analytical
-    source. Note, callable self._fp signature must accept a joint degree tuple and return a float.
+    source. Note, callable self._fp signature must accept a joint degree tuple and return a float,
+    unless it is marked with the `vectorized` decorator, in which case it is passed a tuple of
+    coordinate arrays and returns an array. The grid of joint degrees is walked in blocks of
+    `chunk_size` joint degrees so that it is never held in memory at once.
     :param fp: callback
     :param motif_sizes: list of ints for number of vertices in each motif
     :param hi_lo_degree_bounds: list of tuples (int,int) for kmin,kmax per topology
-    :param n_samples: number of samples if not direct
+    :param mass_threshold: optional probability below which joint degrees are dropped
+    :param chunk_size: optional number of joint degrees evaluated per block
+    :param memory_limit: optional cap in bytes on the arrays used to build the jdd, which
+    raises the mass threshold if needed
     """
 
     _type: str = JointDegreeType.JOINT_FUNCTION
@@ -20,6 +27,10 @@ class JointDegreeFunction(JointDegree):
     def __init__(self, param: dict):
         self._fp: callable = None
         self._low_high_degree_bounds: tuple = (0, 50)
+        self._mass_threshold: float = 0.0
+        self._chunk_size: int = 1 << 20
+        self._memory_limit: int = None
+        self._applied_threshold: float = None
         try:
             self._motif_sizes = param[JointDegreeNames.MOTIF_SIZES]
             self._fp = param[JointDegreeNames.FP]
@@ -27,16 +38,98 @@ class JointDegreeFunction(JointDegree):
         except Exception as e:
             raise (f"Error instantiating {self.__class__.__name__}: {e}")
 
-        self.create_jdd()
+        if JointDegreeNames.MASS_THRESHOLD in param:
+            self._mass_threshold = param[JointDegreeNames.MASS_THRESHOLD]
+        if JointDegreeNames.CHUNK_SIZE in param:
+            self._chunk_size = param[JointDegreeNames.CHUNK_SIZE]
+        if JointDegreeNames.MEMORY_LIMIT in param:
+            self._memory_limit = param[JointDegreeNames.MEMORY_LIMIT]
 
     def create_jdd(self) -> None:
         """
-        Evaluates probability directly by generating all possible joint degrees.
+        Evaluates probability directly over all possible joint degrees, one block
+        of the grid at a time, keeping the joint degrees whose probability is at
+        least `self._mass_threshold'. The fraction of the total mass that is
+        dropped is reported by `truncated_mass'.
+
+        With a `memory_limit`, the block size is capped so that a block's working
+        arrays take at most a quarter of the limit. The rest holds the kept jdd
+        twice over, once in parts and once concatenated. Before a block would
+        exceed that, the threshold is raised so that half the allowance is
+        kept. The threshold applied in the end is `applied_mass_threshold`.
+        """
+        kmins = np.array([kmin for kmin, _ in self._low_high_degree_bounds])
+        shape = tuple(kmax - kmin + 1 for kmin, kmax in self._low_high_degree_bounds)
+        n_grid = int(np.prod(shape, dtype=np.int64))
+        bytes_per_entry = 8 * (len(shape) + 1)
+
+        # flat indices, unravelled coordinates, the block, probabilities and mask
+        bytes_per_row = 8 * (2 * len(shape) + 2) + 1
+        chunk_size = self._chunk_size
+        max_kept = None
+        if self._memory_limit is not None:
+            chunk_size = min(chunk_size, self._memory_limit // 4 // bytes_per_row)
+            max_kept = (self._memory_limit - chunk_size * bytes_per_row) // (
+                2 * bytes_per_entry
+            )
+            if chunk_size < 1 or max_kept < 2:
+                raise MemoryError(
+                    f"Error in {self.__class__.__name__}: a memory limit of "
+                    f"{self._memory_limit} bytes is too small to build a jdd"
+                )
+
+        threshold: float = self._mass_threshold
+        keys: list = []
+        weights: list = []
+        n_kept: int = 0
+        total: float = 0.0
+        for start in range(0, n_grid, chunk_size):
+            flat = np.arange(start, min(start + chunk_size, n_grid))
+            block = np.column_stack(np.unravel_index(flat, shape)) + kmins
+            ps = self.evaluate_block(block)
+
+            total += float(ps.sum())
+            keep = (ps > 0) & (ps >= threshold)
+            n_new = int(keep.sum())
+            if max_kept is not None and n_kept + n_new > max_kept:
+                # keep the largest half of the allowance, dropping ties at the cut
+                kept = np.concatenate(weights + [ps[keep]])
+                cut = -np.partition(-kept, max_kept // 2)[max_kept // 2]
+                threshold = float(np.nextafter(cut, np.inf))
+                for i, w in enumerate(weights):
+                    above = w >= threshold
+                    keys[i], weights[i] = keys[i][above], w[above]
+                n_kept = sum(len(w) for w in weights)
+                keep &= ps >= threshold
+                n_new = int(keep.sum())
+
+            n_kept += n_new
+            keys.append(block[keep])
+            weights.append(ps[keep])
+
+        self._applied_threshold = threshold
+        weights = np.concatenate(weights)
+        self._truncated_mass = 1.0 - float(weights.sum()) / total if total > 0 else 0.0
+        self.set_jdd_arrays(np.concatenate(keys), weights)
+
+    def evaluate_block(self, block: np.ndarray) -> np.ndarray:
+        """
+        Evaluates the joint degree function on a block of joint degrees.
+        :param block: (B, T) array of joint degrees
+        :returns np.ndarray: (B,) array of probabilities
+        """
+        if is_vectorized(self._fp):
+            ps = np.asarray(self._fp(tuple(block.T)), dtype=float)
+            return np.broadcast_to(ps, (len(block),))
+        return np.array(
+            [self._fp(jd) for jd in map(tuple, block.tolist())], dtype=float
+        )
+
+    @property
+    def applied_mass_threshold(self) -> float:
+        """
+        :returns float: the mass threshold used to build the jdd, which exceeds
+        the requested one if the memory limit was reached
         """
-        # build list of lists of possible degrees in each dimension
-        ks = [
-            list(range(kmin, kmax + 1)) for kmin, kmax in self._low_high_degree_bounds
-        ]
-        # iterate all joint degrees and evaluate the joint degree
-        for jd in list(product(*ks)):
-            self._jdd[jd] = self._fp(jd)
+        self.build()
+        return self._applied_threshold
@@ -12,7 +12,6 @@ class JointDegreeManual(JointDegree):
             self._motif_sizes = params[JointDegreeNames.MOTIF_SIZES]
         except Exception as e:
             raise (f"Error instantiating {self.__class__.__name__}: {e}")
-        self.create_jdd()
 
     def create_jdd(self) -> None:
         return
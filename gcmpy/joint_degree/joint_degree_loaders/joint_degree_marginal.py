@@ -1,6 +1,5 @@
 from itertools import product
 import numpy as np
-import random
 
 from gcmpy.joint_degree.joint_degree import JointDegree
 from gcmpy.joint_degree.joint_degree_type import JointDegreeType
@@ -8,18 +7,22 @@ from gcmpy.names.joint_degree_names import JointDegreeNames
 
 
 class JointDegreeMarginal(JointDegree):
-
     """
     Merge uncorrelated marginals in each topology from analytical data together to create
     self._jdd. If using a direct method, all possible joint degree tuples are evaluated;
     however, for large varience in the allowed degrees this method is slow. Instead, we can
     choose to sample the analytical functions by setting use_sampling which draws n_samples
-    weighted samples from each marginal function and pieces them together.
+    weighted samples from each marginal function and pieces them together. Setting
+    factorized skips the jdd altogether: each marginal is tabulated once as an inverse
+    cdf and joint degree sequences are drawn from the tables directly.
     :param arr_fp: array of callbacks
     :param motif_sizes: list of ints for number of vertices in each motif
     :param hi_lo_degree_bounds: list of tuples (int,int) for kmin,kmax per topology
     :param use_sampling: bool to use sampling or direct approach
     :param n_samples: number of samples if not direct
+    :param mass_threshold: optional probability below which joint degrees are
+    dropped by the direct method
+    :param factorized: bool to sample the independent marginals directly
     """
 
     _type: str = JointDegreeType.MARGINAL
@@ -29,6 +32,9 @@ class JointDegreeMarginal(JointDegree):
         self._low_high_degree_bounds: tuple = None
         self._use_sampling: bool = False
         self._n_samples: int = 100000
+        self._mass_threshold: float = 0.0
+        self._factorized: bool = False
+        self._inverse_cdfs: list = None  # (degrees, cdf) per topology
 
         try:
             self._motif_sizes = params[JointDegreeNames.MOTIF_SIZES]
@@ -44,24 +50,122 @@ class JointDegreeMarginal(JointDegree):
             self._use_sampling = params[JointDegreeNames.USE_SAMPLING]
         if JointDegreeNames.N_SAMPLES in params:
             self._n_samples = params[JointDegreeNames.N_SAMPLES]
-        self.create_jdd()
+        if JointDegreeNames.MASS_THRESHOLD in params:
+            self._mass_threshold = params[JointDegreeNames.MASS_THRESHOLD]
+        if JointDegreeNames.FACTORIZED in params:
+            self._factorized = params[JointDegreeNames.FACTORIZED]
 
     def create_jdd(self) -> None:
-        if not self._use_sampling:
+        if self._factorized:
+            self.create_inverse_cdfs()
+        elif not self._use_sampling:
             self.create_jdd_directly()
         else:
             self.create_jdd_by_sampling()
 
+    def create_inverse_cdfs(self) -> None:
+        """
+        Tabulates the cdf of each marginal over its degrees kmin..kmax for
+        inverse transform sampling. No jdd is created.
+        """
+        self._inverse_cdfs = []
+        for fp, (kmin, kmax) in zip(self._arr_fp, self._low_high_degree_bounds):
+            ks = np.arange(kmin, kmax + 1)
+            cdf = np.cumsum(self.evaluate_marginal(fp, ks))
+            if not cdf[-1] > 0:
+                raise ValueError(
+                    f"Error in {self.__class__.__name__}: marginal has no mass "
+                    f"on degrees {kmin} to {kmax}"
+                )
+            self._inverse_cdfs.append((ks, cdf / cdf[-1]))
+
+    def sample_jds_from_jdd(self, N: int) -> np.ndarray:
+        """
+        In factorized mode draws each topology of the `N' joint degrees straight
+        from the inverse cdf of its marginal, otherwise samples the jdd.
+        :param N int: number of joint degrees
+        :returns np.ndarray: (N, T) joint degree array
+        """
+        if not self._factorized:
+            return super().sample_jds_from_jdd(N)
+
+        self.build()
+        jds = np.empty((N, len(self._inverse_cdfs)), dtype=np.int64)
+        for i, (ks, cdf) in enumerate(self._inverse_cdfs):
+            index = np.searchsorted(cdf, self.rng.random(N), side="right")
+            jds[:, i] = ks[np.minimum(index, len(ks) - 1)]
+        return self.handshaking_lemma(jds)
+
+    def log_weight(self, key: np.ndarray) -> float:
+        """
+        In factorized mode the log probability of a joint degree is the sum of
+        the log marginals.
+        """
+        if not self._factorized:
+            return super().log_weight(key)
+
+        self.build()
+        total: float = 0.0
+        for k, (ks, cdf) in zip(key.tolist(), self._inverse_cdfs):
+            if not ks[0] <= k <= ks[-1]:
+                return -np.inf
+            i = k - ks[0]
+            p = cdf[i] - (cdf[i - 1] if i > 0 else 0.0)
+            if p <= 0:
+                return -np.inf
+            total += np.log(p)
+        return float(total)
+
     def create_jdd_directly(self) -> None:
         """
-        Create self._jdd by enumerating probability of all possible joint degrees from
-        analytical functions.
+        Create the jdd as the outer product of the marginals, held as key and weight
+        arrays. Each marginal is evaluated once per degree and normalised, and the
+        product is built one topology at a time, dropping joint degrees whose
+        probability falls below `self._mass_threshold'. As normalised marginals are
+        at most one, a partial product bounds every joint degree that extends it,
+        so pruning early drops exactly the entries that would be pruned at the end.
         """
-        self._jdd = dict((key, 0.0) for key in self.generate_all_joint_degrees())
-        for key in self._jdd:
-            self._jdd[key] = self.evaluate_prob_of_joint_degree(key)
+        keys = np.zeros((1, 0), dtype=np.int64)
+        weights = np.ones(1)
+        for fp, (kmin, kmax) in zip(self._arr_fp, self._low_high_degree_bounds):
+            ks = np.arange(kmin, kmax)
+            pks = self.evaluate_marginal(fp, ks)
+            if not pks.sum() > 0:
+                raise ValueError(
+                    f"Error in {self.__class__.__name__}: marginal has no mass "
+                    f"on degrees {kmin} to {kmax}"
+                )
+
+            weights = np.outer(weights, pks / pks.sum()).ravel()
+            keys = np.column_stack(
+                [np.repeat(keys, len(ks), axis=0), np.tile(ks, len(keys))]
+            )
+            keep = (weights > 0) & (weights >= self._mass_threshold)
+            keys, weights = keys[keep], weights[keep]
+
+        self._truncated_mass = max(0.0, 1.0 - float(weights.sum()))
+        self.set_jdd_arrays(keys, weights)
         self.normalise_jdd()
 
+    @staticmethod
+    def evaluate_marginal(fp: callable, ks: np.ndarray) -> np.ndarray:
+        """
+        Evaluates a marginal at every degree in `ks'. The callback is first called
+        once with the whole array and, if it does not return a finite array of the
+        same shape, once per degree.
+        :param fp: marginal callback
+        :param ks: 1D array of degrees
+        :returns np.ndarray: probability of each degree
+        """
+        try:
+            with np.errstate(all="ignore"):
+                pks = np.asarray(fp(ks), dtype=float)
+            if pks.shape == ks.shape and np.isfinite(pks).all():
+                return pks
+        except (TypeError, ValueError):
+            pass
+        return np.array([fp(k) for k in ks.tolist()], dtype=float)
+
     def generate_all_joint_degrees(self) -> list:
         """
         Generate all possible joint degrees from a range of min/max degree of each motif.
@@ -89,10 +193,10 @@ class JointDegreeMarginal(JointDegree):
         ret = []
         for i in range(len(self._low_high_degree_bounds)):
             kmin, kmax = self._low_high_degree_bounds[i]
-            ks = [k for k in range(kmin, kmax + 1)]  # possible degrees
-            pks = [self._arr_fp[i](k) for k in ks]  # degree weights
+            ks = np.arange(kmin, kmax + 1)  # possible degrees
+            pks = self.evaluate_marginal(self._arr_fp[i], ks)  # degree weights
             ret.append(
-                random.choices(ks, pks, k=self._n_samples)
+                self.rng.choice(ks, size=self._n_samples, p=pks / pks.sum())
             )  # sample this dimension
         return [
             tuple(jd) for jd in np.column_stack(ret).tolist()
@@ -1,4 +1,10 @@
+import numpy as np
+
+from gcmpy.joint_degree.integer_partitions import IntegerPartitions
 from gcmpy.joint_degree.joint_degree import JointDegree
+from gcmpy.joint_degree.joint_degree_loaders.joint_degree_marginal import (
+    JointDegreeMarginal,
+)
 from gcmpy.joint_degree.joint_degree_type import JointDegreeType
 from gcmpy.names.joint_degree_names import JointDegreeNames
 
@@ -19,63 +25,59 @@ class JointDegreeSplitDegree(JointDegree):
         except Exception as e:
             raise (f"Error instantiating {self.__class__.__name__}: {e}")
 
-        self.create_jdd()
-
     def create_jdd(self) -> None:
-        for k in range(self._low_high_degree_bound[0], self._low_high_degree_bound[1]):
-            self.resolve_degree(k, self._fp(k))
+        partitions = IntegerPartitions(len(self._probs))
+        ks = np.arange(*self._low_high_degree_bound)
+        pks = JointDegreeMarginal.evaluate_marginal(self._fp, ks)
+        keys: list = []
+        weights: list = []
+        for k, pk in zip(ks.tolist(), pks.tolist()):
+            jds, probabilities = self.resolve_degree(k, pk, partitions)
+            keys.append(jds)
+            weights.append(probabilities)
+        self.set_jdd_arrays(np.concatenate(keys), np.concatenate(weights))
         self.normalise_jdd()
 
-    def get_valid_joint_degrees(self, remaining_degree: int, topology: int) -> list:
-        """
-        Returns a list of tuples by recursion. Only an ordered list of cliques are
-        currently supported.
-        :param remaining_degree: current free edges that can be partitioned
-        :param topology: column index of joint degree tuple
-        :returns list of joint degrees
-        """
-        if topology == 1:
-            yield [remaining_degree]
-        else:
-            for i in range(0, remaining_degree // topology + 1):
-                for row in self.get_valid_joint_degrees(
-                    remaining_degree - i * topology, topology - 1
-                ):
-                    yield row + [i]
-
-    def calc_prob_of_joint_degree(self, jd: tuple) -> float:
+    def log_weights(self, jds: np.ndarray) -> np.ndarray:
         """
-        Calculates the probability of a joint degree from the input params.
-        :param jd: joint degree
-        :returns probability: float value
+        Log probability of each joint degree from the input params, up to a
+        constant, as the product of the part counts with log(probs[i]^(i+1)).
+        :param jds: (n, T) array of joint degrees
+        :returns np.ndarray: (n,) array of log weights
         """
-        prod: float = 1.0
-        for i, degree in enumerate(jd):
-            prod *= pow(self._probs[i], (i + 1) * degree)
-        return prod
+        probs = np.asarray(self._probs, dtype=float)
+        sizes = np.arange(1, len(probs) + 1)
+        possible = probs > 0
+        coefficients = np.where(
+            possible, sizes * np.log(np.where(possible, probs, 1)), 0
+        )
+        log_w = jds @ coefficients
+        # joint degrees that use a part of probability zero are impossible
+        log_w[(jds[:, ~possible] > 0).any(axis=1)] = -np.inf
+        return log_w
 
-    def resolve_degree(self, k: int, prob_overall_k: float) -> None:
+    def resolve_degree(
+        self, k: int, prob_overall_k: float, partitions: IntegerPartitions = None
+    ) -> tuple:
         """
-        creates all valid joint degrees for overall k and their probability
-        and updates self._jdd.
+        creates all valid joint degrees for overall k and their probability.
         :param k: overall degree
         :param prob_overall_k: float value
+        :param partitions: optional IntegerPartitions reused across increasing k
+        :returns tuple: (n, T) array of joint degrees and (n,) array of weights
         """
-        self._jdd = {}
-
-        # get a list of valid joint degrees
-        valid_tuples: list = list(self.get_valid_joint_degrees(k, len(self._probs)))
+        if partitions is None:
+            partitions = IntegerPartitions(len(self._probs))
 
-        # calculate the probability of each joint degree tuple
-        probabilities = []
-        for jd in valid_tuples:
-            probabilities.append(self.calc_prob_of_joint_degree(jd))
+        # get the valid joint degrees
+        jds = partitions(k)
 
-        # normalise the probabilities to unity
-        total = sum(probabilities)
-        for i in range(len(probabilities)):
-            probabilities[i] /= total
+        # normalise the probabilities of the joint degrees to unity
+        log_w = self.log_weights(jds)
+        if not np.isfinite(log_w).any():
+            return jds[:0], np.zeros(0)
+        probabilities = np.exp(log_w - log_w.max())
+        probabilities /= probabilities.sum()
 
-        # add each tuple to self._jdd weighted by probability of overall degree k
-        for i, jd in enumerate(valid_tuples):
-            self._jdd[tuple(jd)] = prob_overall_k * probabilities[i]
+        # weight each joint degree by probability of overall degree k
+        return jds, prob_overall_k * probabilities
@@ -0,0 +1,186 @@
+import numpy as np
+
+
+class JointDegreeTable:
+    """
+    Array form of a joint degree distribution: a (K, T) integer matrix of joint
+    degrees and a (K,) vector of their weights. Each joint degree is packed into
+    a single int64 by treating its entries as digits in a mixed radix given by
+    the largest degree per topology, so a key is found in O(1) through a dict of
+    packed keys, and many keys at once by a binary search of the sorted packed
+    keys.
+    :param keys: (K, T) array of non-negative joint degrees, one row per key
+    :param weights: (K,) array of weights
+    """
+
+    def __init__(self, keys: np.ndarray, weights: np.ndarray):
+        weights = np.asarray(weights, dtype=float)
+        self._keys: np.ndarray = np.asarray(keys, dtype=np.int64).reshape(
+            len(weights), -1
+        )
+        self._weights: np.ndarray = weights
+        self._radices: np.ndarray = None
+        self._packed: np.ndarray = None  # (K,) packed keys, or None if too wide
+        self._order: np.ndarray = None  # rows sorted by packed key
+        self._sorted_packed: np.ndarray = None  # packed keys in that order
+        self._rows: dict = None  # packed key, or tuple if too wide, to row
+
+    @staticmethod
+    def from_dict(jdd: dict) -> "JointDegreeTable":
+        """
+        :param jdd: dict of joint degree tuples to weights
+        :returns JointDegreeTable: table with the keys in dict order
+        """
+        keys = list(jdd.keys())
+        weights = np.fromiter(jdd.values(), dtype=float, count=len(keys))
+        return JointDegreeTable(np.array(keys, dtype=np.int64), weights)
+
+    def to_dict(self) -> dict:
+        """
+        :returns dict: joint degree tuples to weights
+        """
+        return dict(zip(map(tuple, self._keys.tolist()), self._weights.tolist()))
+
+    def __len__(self) -> int:
+        return len(self._weights)
+
+    def build_index(self) -> None:
+        """
+        Packs the keys and builds the lookup structures. Called on first lookup.
+        """
+        self._radices = (
+            self._keys.max(axis=0) + 1
+            if len(self)
+            else np.ones(self.n_topologies, dtype=np.int64)
+        )
+        # packed keys must stay below 2**63 to fit in an int64
+        if np.sum(np.log2(self._radices.astype(float))) < 63:
+            self._packed = self.pack(self._keys)
+            self._order = np.argsort(self._packed, kind="stable")
+            self._sorted_packed = self._packed[self._order]
+            self._rows = dict(zip(self._packed.tolist(), range(len(self))))
+        else:
+            self._rows = dict(zip(map(tuple, self._keys.tolist()), range(len(self))))
+
+    def pack(self, keys: np.ndarray) -> np.ndarray:
+        """
+        :param keys: (M, T) array of joint degrees within the radices
+        :returns np.ndarray: (M,) array of packed keys
+        """
+        packed = np.zeros(len(keys), dtype=np.int64)
+        for i, radix in enumerate(self._radices.tolist()):
+            packed = packed * radix + keys[:, i]
+        return packed
+
+    def row(self, key: tuple) -> int:
+        """
+        :param key: joint degree tuple
+        :returns int: row of `key`, or -1 if it is absent
+        """
+        if self._rows is None:
+            self.build_index()
+        key = tuple(key)
+        if self._packed is None:
+            return self._rows.get(key, -1)
+        if len(key) != self.n_topologies or any(
+            not 0 <= k < r for k, r in zip(key, self._radices.tolist())
+        ):
+            return -1
+        packed = 0
+        for k, radix in zip(key, self._radices.tolist()):
+            packed = packed * radix + k
+        return self._rows.get(packed, -1)
+
+    def rows(self, keys: np.ndarray) -> np.ndarray:
+        """
+        Vectorised `row`.
+        :param keys: (M, T) array of joint degrees
+        :returns np.ndarray: (M,) array of rows, -1 where a key is absent
+        """
+        if self._rows is None:
+            self.build_index()
+        keys = np.asarray(keys, dtype=np.int64).reshape(-1, self.n_topologies)
+        if len(self) == 0:
+            return np.full(len(keys), -1, dtype=np.int64)
+        if self._packed is None:
+            return np.array([self.row(k) for k in keys.tolist()], dtype=np.int64)
+
+        valid = np.all((keys >= 0) & (keys < self._radices), axis=1)
+        packed = self.pack(np.where(valid[:, None], keys, 0))
+        pos = np.minimum(np.searchsorted(self._sorted_packed, packed), len(self) - 1)
+        found = valid & (self._sorted_packed[pos] == packed)
+        return np.where(found, self._order[pos], -1)
+
+    def weight(self, key: tuple) -> float:
+        """
+        :param key: joint degree tuple
+        :returns float: weight of `key`, 0 if it is absent
+        """
+        row = self.row(key)
+        return float(self._weights[row]) if row >= 0 else 0.0
+
+    def __contains__(self, key: tuple) -> bool:
+        return self.row(key) >= 0
+
+    def __getitem__(self, key: tuple) -> float:
+        row = self.row(key)
+        if row < 0:
+            raise KeyError(key)
+        return float(self._weights[row])
+
+    def moment(self, n: int = 1, normalise: bool = True) -> np.ndarray:
+        """
+        :param n: order of the moment
+        :param normalise: divide by the total weight
+        :returns np.ndarray: (T,) n-th moment of the degree in each topology
+        """
+        moments = (self._keys.astype(float) ** n * self._weights[:, None]).sum(axis=0)
+        if normalise:
+            moments /= self._weights.sum()
+        return moments
+
+    def mean(self) -> np.ndarray:
+        """
+        :returns np.ndarray: (T,) mean degree in each topology
+        """
+        return self.moment(1)
+
+    def marginal(self, i: int) -> tuple:
+        """
+        Distribution of the degree in topology `i`.
+        :param i: topology index
+        :returns tuple: (D,) array of sorted degrees and (D,) array of weights
+        """
+        degrees, inverse = np.unique(self._keys[:, i], return_inverse=True)
+        return degrees, np.bincount(inverse, weights=self._weights)
+
+    def normalised(self) -> "JointDegreeTable":
+        """
+        :returns JointDegreeTable: table whose weights sum to one
+        """
+        return JointDegreeTable(self._keys, self._weights / self._weights.sum())
+
+    def excess(self, i: int) -> "JointDegreeTable":
+        """
+        Excess joint degree distribution of topology `i`: the joint degree seen
+        from the end of a randomly chosen `i` motif, with that motif removed.
+        :param i: topology index
+        :returns JointDegreeTable: excess table, weights k_i P(k) / <k_i>
+        """
+        mask = self._keys[:, i] > 0
+        keys = self._keys[mask].copy()
+        weights = keys[:, i] * self._weights[mask] / self.moment(1, False)[i]
+        keys[:, i] -= 1
+        return JointDegreeTable(keys, weights)
+
+    @property
+    def keys(self) -> np.ndarray:
+        return self._keys
+
+    @property
+    def weights(self) -> np.ndarray:
+        return self._weights
+
+    @property
+    def n_topologies(self) -> int:
+        return self._keys.shape[1]
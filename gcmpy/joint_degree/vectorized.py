@@ -0,0 +1,18 @@
+def vectorized(fp: callable) -> callable:
+    """
+    Decorator that marks a joint degree function as vectorized. Instead of one
+    joint degree tuple, a vectorized function is passed a tuple of T integer
+    arrays, the coordinates of a block of joint degrees in each topology, and
+    returns an array with the probability of each joint degree in the block.
+    :param fp: joint degree function
+    :returns callable: the same function with `vectorized` set
+    """
+    fp.vectorized = True
+    return fp
+
+
+def is_vectorized(fp: callable) -> bool:
+    """
+    True if `fp` was marked with the `vectorized` decorator.
+    """
+    return getattr(fp, "vectorized", False)
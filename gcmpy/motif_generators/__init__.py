@@ -1,4 +1,5 @@
 # flake8: noqa
-from .clique_motif import clique_motif
-from .cycle_motif import cycle_motif
-from .diamond_motif import diamond_motif
+from .clique_motif import clique_motif, clique_motif_batch, clique_template
+from .cycle_motif import cycle_motif, cycle_motif_batch, cycle_template
+from .diamond_motif import diamond_motif, diamond_motif_batch, DIAMOND_TEMPLATE
+from .motif_template import motif_template, get_template, build_from_template
@@ -1,6 +1,25 @@
+from functools import lru_cache
 from itertools import combinations
 
+import numpy as np
 
+from gcmpy.motif_generators.motif_template import motif_template, build_from_template
+
+
+@lru_cache(maxsize=None)
+def clique_template(size: int) -> np.ndarray:
+    """
+    Local edge template of a clique: all pairs of orbit positions.
+    :param size: number of vertices in the clique
+    :returns np.ndarray: (size choose 2, 2) array of orbit positions
+    """
+    template = np.array(list(combinations(range(size), 2)), dtype=np.intp)
+    template = template.reshape(-1, 2)
+    template.flags.writeable = False
+    return template
+
+
+@motif_template(clique_template)
 def clique_motif(vertices: list) -> list:
     """
     Accepts list of ints and creates all possible pairs which it returns as a list of tuples of int pairs
@@ -8,3 +27,12 @@ def clique_motif(vertices: list) -> list:
     :returns: edge list as list of tuples (int, int)
     """
     return list(combinations(vertices, 2))
+
+
+def clique_motif_batch(vertices: np.ndarray) -> np.ndarray:
+    """
+    Builds the edges of many cliques at once.
+    :param vertices: (n_motifs, size) array of vertices
+    :returns np.ndarray: (n_motifs * size choose 2, 2) edge array
+    """
+    return build_from_template(vertices, clique_template(vertices.shape[1]))
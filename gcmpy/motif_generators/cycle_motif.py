@@ -1,6 +1,27 @@
+from functools import lru_cache
 from itertools import tee
 
+import numpy as np
 
+from gcmpy.motif_generators.motif_template import motif_template, build_from_template
+
+
+@lru_cache(maxsize=None)
+def cycle_template(size: int) -> np.ndarray:
+    """
+    Local edge template of a cycle: adjacent orbit positions followed by the
+    edge closing the chain.
+    :param size: number of vertices in the cycle
+    :returns np.ndarray: (size, 2) array of orbit positions
+    """
+    template = [(i, i + 1) for i in range(size - 1)]
+    template.append((0, size - 1))
+    template = np.array(template, dtype=np.intp)
+    template.flags.writeable = False
+    return template
+
+
+@motif_template(cycle_template)
 def cycle_motif(vertices: list) -> list:
     """
     Accepts a list of ints and creates a cycle of adjacent vertex pairs. Creates two
@@ -15,3 +36,12 @@ def cycle_motif(vertices: list) -> list:
     edges = list(zip(a, b))
     edges.append((vertices[0], vertices[-1]))
     return edges
+
+
+def cycle_motif_batch(vertices: np.ndarray) -> np.ndarray:
+    """
+    Builds the edges of many cycles at once.
+    :param vertices: (n_motifs, size) array of vertices
+    :returns np.ndarray: (n_motifs * size, 2) edge array
+    """
+    return build_from_template(vertices, cycle_template(vertices.shape[1]))
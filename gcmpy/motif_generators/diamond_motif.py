@@ -1,6 +1,14 @@
-from gcmpy.motif_generators.cycle_motif import cycle_motif
+import numpy as np
 
+from gcmpy.motif_generators.cycle_motif import cycle_motif, cycle_template
+from gcmpy.motif_generators.motif_template import motif_template, build_from_template
 
+# the 4-cycle followed by the two chords
+DIAMOND_TEMPLATE: np.ndarray = np.vstack([cycle_template(4), [(0, 2), (1, 3)]])
+DIAMOND_TEMPLATE.flags.writeable = False
+
+
+@motif_template(DIAMOND_TEMPLATE)
 def diamond_motif(vertices: list) -> list:
     """
     Accepts list of ints and creates edge pairs for a diamond motif of 4 vertices.
@@ -15,3 +23,12 @@ def diamond_motif(vertices: list) -> list:
     edges.append((n0, n2))
     edges.append((n1, n3))
     return edges
+
+
+def diamond_motif_batch(vertices: np.ndarray) -> np.ndarray:
+    """
+    Builds the edges of many diamonds at once.
+    :param vertices: (n_motifs, 4) array of vertices
+    :returns np.ndarray: (n_motifs * 6, 2) edge array
+    """
+    return build_from_template(vertices, DIAMOND_TEMPLATE)
@@ -0,0 +1,50 @@
+import numpy as np
+
+
+def motif_template(template) -> callable:
+    """
+    Decorator that attaches a local edge template to a motif builder. The template
+    lists the edges of one motif as pairs of orbit positions, i.e. indices into the
+    vertex list passed to the builder. It is either a fixed sequence of pairs or a
+    callable accepting the number of vertices and returning the pairs. GCM algorithms
+    use the template to build all motifs of a topology at once.
+    :param template: sequence of (int, int) pairs or callable
+    :returns decorator: callable that sets `template` on the builder
+    """
+
+    def decorator(build_function: callable) -> callable:
+        build_function.template = template
+        return build_function
+
+    return decorator
+
+
+def get_template(build_function: callable, size: int) -> np.ndarray:
+    """
+    Returns the edge template of a motif builder for motifs with `size` vertices,
+    or None if the builder does not declare one.
+    :param build_function: motif builder callback
+    :param size: number of vertices in the motif
+    :returns np.ndarray: (edges_per_motif, 2) array of orbit positions
+    """
+    template = getattr(build_function, "template", None)
+    if template is None:
+        return None
+    if callable(template):
+        template = template(size)
+    template = np.asarray(template, dtype=np.intp).reshape(-1, 2)
+    if template.size > 0 and (template.min() < 0 or template.max() >= size):
+        raise ValueError(
+            f"Edge template of {build_function.__name__} does not fit a motif of {size} vertices"
+        )
+    return template
+
+
+def build_from_template(vertices: np.ndarray, template: np.ndarray) -> np.ndarray:
+    """
+    Builds the edges of many motifs at once by fancy indexing.
+    :param vertices: (n_motifs, size) array of motif vertices
+    :param template: (edges_per_motif, 2) array of orbit positions
+    :returns np.ndarray: (n_motifs * edges_per_motif, 2) edge array
+    """
+    return vertices[:, template].reshape(-1, 2)
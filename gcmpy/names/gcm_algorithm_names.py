@@ -8,3 +8,6 @@ class GCMAlgorithmNames(Enum):
     EDGE_NAMES = "edge_names"
     MOTIF_INDICES = "motif_indices"
     MOTIF_ID = "motif_id"
+    SEED = "seed"
+    MULTI_EDGE_POLICY = "multi_edge_policy"
+    RESAMPLE_ROUNDS = "resample_rounds"
@@ -14,3 +14,14 @@ class JointDegreeNames(Enum):
     ARR_FP = "arr_fp"
     USE_SAMPLING = "use_sampling"
     N_SAMPLES = "n_samples"
+    SEED = "seed"
+    PRESERVE_DISTRIBUTION = "preserve_distribution"
+    MASS_THRESHOLD = "mass_threshold"
+    FACTORIZED = "factorized"
+    CHUNK_SIZE = "chunk_size"
+    MEMORY_LIMIT = "memory_limit"
+    CACHE_DIR = "cache_dir"
+    CACHE_TOKEN = "cache_token"
+    CACHE_MAX_BYTES = "cache_max_bytes"
+    JDS_FILES = "jds_files"
+    N_WORKERS = "n_workers"
@@ -1,5 +1,11 @@
 # flake8: noqa
 from .network import Network
 from .edge_list import LightWeightEdgeList
+from .compact_edge_list import CompactEdgeList
+from .edge_block import EdgeBlock
+from .edge_block_store import EdgeBlockStore
+from .sparse_network import SparseNetwork
+from .multi_edges import MultiEdges
 from .edge_list_to_network import EdgeListToNetwork
+from .edge_list_to_sparse_network import EdgeListToSparseNetwork
 from .network_to_edge_list import NetworkToEdgeList
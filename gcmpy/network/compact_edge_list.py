@@ -0,0 +1,222 @@
+from collections.abc import Sequence
+
+import numpy as np
+
+from gcmpy.network.edge_list import LightWeightEdgeList
+
+
+class ArrayRowsView(Sequence):
+    """
+    Read-only list-like view of a NumPy array. Rows of a 2D array are returned
+    as tuples of Python ints and entries of a 1D array as Python scalars, so the
+    view can stand in for the lists held by `LightWeightEdgeList`. If `names`
+    is given, the entries are treated as codes into that table.
+    :param array: 1D or 2D array
+    :param names: optional table that the entries index into
+    """
+
+    _CHUNK: int = 1 << 16
+
+    def __init__(self, array: np.ndarray, names: list = None):
+        self._array: np.ndarray = array
+        self._names: list = names
+
+    def __len__(self) -> int:
+        return len(self._array)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self._convert(self._array[index]))
+        return next(iter(self._convert(self._array[index][np.newaxis])))
+
+    def __iter__(self):
+        for start in range(0, len(self._array), self._CHUNK):
+            yield from self._convert(self._array[start : start + self._CHUNK])
+
+    def _convert(self, block: np.ndarray):
+        values = block.tolist()
+        if self._names is not None:
+            return [self._names[v] for v in values]
+        if block.ndim > 1:
+            return map(tuple, values)
+        return values
+
+
+class CompactEdgeList:
+    """
+    Array-backed counterpart of `LightWeightEdgeList`. Edges are held in an
+    `(E, 2)` integer array, topologies as small integer codes into a table of
+    names, motif ids in an `int64` array and the joint degree sequence as an
+    `(N, T)` matrix. The properties `edge_list`, `topologies`, `joint_degrees`
+    and `motif_id` return list-like views so the object can be passed to code
+    written for `LightWeightEdgeList`, such as `EdgeListToNetwork.convert`.
+    :param edges: (E, 2) array of vertex pairs
+    :param topology_codes: (E,) array of indices into `topology_names`
+    :param topology_names: list of topology names
+    :param motif_ids: (E,) array of motif ids
+    :param joint_degrees: (N, T) joint degree matrix
+    """
+
+    __slots__ = (
+        "_edges",
+        "_topology_codes",
+        "_topology_names",
+        "_motif_ids",
+        "_joint_degrees",
+    )
+
+    def __init__(
+        self,
+        edges: np.ndarray = None,
+        topology_codes: np.ndarray = None,
+        topology_names: list = None,
+        motif_ids: np.ndarray = None,
+        joint_degrees: np.ndarray = None,
+    ):
+        if edges is None:
+            edges = np.empty((0, 2), dtype=np.int32)
+        if topology_codes is None:
+            topology_codes = np.empty(0, dtype=np.int8)
+        if motif_ids is None:
+            motif_ids = np.empty(0, dtype=np.int64)
+        if joint_degrees is None:
+            joint_degrees = np.empty((0, 0), dtype=np.int32)
+
+        self._edges: np.ndarray = edges
+        self._topology_codes: np.ndarray = topology_codes
+        self._topology_names: list = list(topology_names or [])
+        self._motif_ids: np.ndarray = motif_ids
+        self._joint_degrees: np.ndarray = joint_degrees
+
+    def __len__(self) -> int:
+        return len(self._edges)
+
+    @staticmethod
+    def vertex_dtype(n_vertices: int) -> np.dtype:
+        """
+        Smallest signed integer type able to index `n_vertices` vertices.
+        """
+        return np.dtype(np.int32) if n_vertices < 2**31 else np.dtype(np.int64)
+
+    @staticmethod
+    def code_dtype(n_names: int) -> np.dtype:
+        """
+        Smallest signed integer type able to index `n_names` topology names.
+        """
+        return np.dtype(np.int8) if n_names < 2**7 else np.dtype(np.int16)
+
+    @staticmethod
+    def from_edge_list(edgelist: LightWeightEdgeList) -> "CompactEdgeList":
+        """
+        Packs a `LightWeightEdgeList` into arrays.
+        :param edgelist: list based edge list
+        :returns CompactEdgeList: array based edge list
+        """
+        names = list(dict.fromkeys(edgelist.topologies))
+        lookup = {name: code for code, name in enumerate(names)}
+        joint_degrees = np.asarray(edgelist.joint_degrees, dtype=np.int32)
+        if joint_degrees.ndim == 1:
+            joint_degrees = joint_degrees.reshape(len(joint_degrees), -1)
+        edges = np.asarray(edgelist.edge_list, dtype=np.int64).reshape(-1, 2)
+        n_vertices = max(len(joint_degrees), int(edges.max(initial=-1)) + 1)
+
+        return CompactEdgeList(
+            edges.astype(CompactEdgeList.vertex_dtype(n_vertices)),
+            np.fromiter(
+                (lookup[name] for name in edgelist.topologies),
+                dtype=CompactEdgeList.code_dtype(len(names)),
+                count=len(edgelist.topologies),
+            ),
+            names,
+            np.asarray(edgelist.motif_id, dtype=np.int64),
+            joint_degrees,
+        )
+
+    def to_edge_list(self) -> LightWeightEdgeList:
+        """
+        Unpacks the arrays into a `LightWeightEdgeList`.
+        :returns LightWeightEdgeList: list based edge list
+        """
+        model = LightWeightEdgeList()
+        model.edge_list = list(self.edge_list)
+        model.topologies = list(self.topologies)
+        model.motif_id = list(self.motif_id)
+        model.joint_degrees = list(self.joint_degrees)
+        return model
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Total bytes held by the arrays.
+        """
+        return (
+            self._edges.nbytes
+            + self._topology_codes.nbytes
+            + self._motif_ids.nbytes
+            + self._joint_degrees.nbytes
+        )
+
+    @property
+    def bytes_per_edge(self) -> float:
+        """
+        Bytes held by the arrays per edge, including the joint degree matrix.
+        """
+        if len(self._edges) == 0:
+            return 0.0
+        return self.nbytes / len(self._edges)
+
+    @property
+    def edges(self) -> np.ndarray:
+        return self._edges
+
+    @edges.setter
+    def edges(self, value: np.ndarray) -> None:
+        self._edges = value
+
+    @property
+    def topology_codes(self) -> np.ndarray:
+        return self._topology_codes
+
+    @topology_codes.setter
+    def topology_codes(self, value: np.ndarray) -> None:
+        self._topology_codes = value
+
+    @property
+    def topology_names(self) -> list:
+        return self._topology_names
+
+    @topology_names.setter
+    def topology_names(self, value: list) -> None:
+        self._topology_names = list(value)
+
+    @property
+    def motif_ids(self) -> np.ndarray:
+        return self._motif_ids
+
+    @motif_ids.setter
+    def motif_ids(self, value: np.ndarray) -> None:
+        self._motif_ids = value
+
+    @property
+    def joint_degree_matrix(self) -> np.ndarray:
+        return self._joint_degrees
+
+    @joint_degree_matrix.setter
+    def joint_degree_matrix(self, value: np.ndarray) -> None:
+        self._joint_degrees = value
+
+    @property
+    def edge_list(self) -> ArrayRowsView:
+        return ArrayRowsView(self._edges)
+
+    @property
+    def topologies(self) -> ArrayRowsView:
+        return ArrayRowsView(self._topology_codes, self._topology_names)
+
+    @property
+    def motif_id(self) -> ArrayRowsView:
+        return ArrayRowsView(self._motif_ids)
+
+    @property
+    def joint_degrees(self) -> ArrayRowsView:
+        return ArrayRowsView(self._joint_degrees)
@@ -0,0 +1,16 @@
+from typing import NamedTuple
+
+import numpy as np
+
+
+class EdgeBlock(NamedTuple):
+    """
+    A chunk of a generated graph: edges with their topology codes and motif ids.
+    :param edges: (E, 2) array of vertex pairs
+    :param topologies: (E,) array of topology codes
+    :param motif_ids: (E,) array of motif ids
+    """
+
+    edges: np.ndarray
+    topologies: np.ndarray
+    motif_ids: np.ndarray
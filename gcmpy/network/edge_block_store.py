@@ -0,0 +1,153 @@
+import os
+
+import numpy as np
+
+from gcmpy.network.compact_edge_list import CompactEdgeList
+from gcmpy.network.edge_block import EdgeBlock
+
+
+class EdgeBlockStore:
+    """
+    Sink that appends edge blocks to `.npy` files in the directory `path`, so a
+    graph can be written without ever holding the full edge list in memory. The
+    edges, topology codes and motif ids go to `edges.npy`, `topologies.npy` and
+    `motif_ids.npy`; the topology names and joint degree matrix are written to
+    `meta.npz`. Each `.npy` file is given a fixed size header that is rewritten
+    with the final shape on `close`, after which `load` opens the store as a
+    memory-mapped `CompactEdgeList`. Used as a context manager, the store is
+    closed on success and its files are deleted if an exception is raised.
+    :param path: directory to write to, created if missing
+    :param topology_names: names indexed by the topology codes
+    :param joint_degrees: optional (N, T) joint degree matrix
+    :param vertex_dtype: integer type used for the edges
+    :param code_dtype: integer type used for the topology codes
+    """
+
+    EDGES: str = "edges.npy"
+    TOPOLOGIES: str = "topologies.npy"
+    MOTIF_IDS: str = "motif_ids.npy"
+    META: str = "meta.npz"
+
+    # bytes reserved for each .npy header, enough for any 64 bit shape
+    HEADER_SIZE: int = 128
+
+    def __init__(
+        self,
+        path: str,
+        topology_names: list,
+        joint_degrees: np.ndarray = None,
+        vertex_dtype: np.dtype = np.int64,
+        code_dtype: np.dtype = np.int8,
+    ):
+        os.makedirs(path, exist_ok=True)
+        self._path: str = path
+        self._n_edges: int = 0
+        self._dtypes: dict = {
+            self.EDGES: np.dtype(vertex_dtype),
+            self.TOPOLOGIES: np.dtype(code_dtype),
+            self.MOTIF_IDS: np.dtype(np.int64),
+        }
+        self._files: dict = {}
+        for name, dtype in self._dtypes.items():
+            f = open(os.path.join(path, name), "wb")
+            self._write_header(f, dtype, self._shape(name, 0))
+            self._files[name] = f
+
+        if joint_degrees is None:
+            joint_degrees = np.empty((0, 0), dtype=np.int32)
+        np.savez(
+            os.path.join(path, self.META),
+            topology_names=np.array(topology_names, dtype=str),
+            joint_degrees=np.asarray(joint_degrees),
+        )
+
+    def __enter__(self) -> "EdgeBlockStore":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        # an exception may have stopped a write partway, so do not finalise it
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def _shape(self, name: str, n_edges: int) -> tuple:
+        return (n_edges, 2) if name == self.EDGES else (n_edges,)
+
+    def _write_header(self, f, dtype: np.dtype, shape: tuple) -> None:
+        """
+        Writes a version 1.0 `.npy` header padded to `HEADER_SIZE` bytes.
+        """
+        magic = np.lib.format.magic(1, 0)
+        header = "{'descr': %r, 'fortran_order': False, 'shape': %r, }" % (
+            np.lib.format.dtype_to_descr(dtype),
+            shape,
+        )
+        n_header = self.HEADER_SIZE - len(magic) - 2
+        header = header.ljust(n_header - 1) + "\n"
+        f.write(magic)
+        f.write(np.uint16(n_header).astype("<u2").tobytes())
+        f.write(header.encode("latin1"))
+
+    def append(self, block: EdgeBlock) -> None:
+        """
+        Appends a block of edges to the store.
+        :param block: EdgeBlock of edges, topology codes and motif ids
+        """
+        arrays = zip(
+            (self.EDGES, self.TOPOLOGIES, self.MOTIF_IDS),
+            (block.edges, block.topologies, block.motif_ids),
+        )
+        for name, array in arrays:
+            self._files[name].write(
+                np.ascontiguousarray(array, dtype=self._dtypes[name]).tobytes()
+            )
+        self._n_edges += len(block.edges)
+
+    def close(self) -> None:
+        """
+        Rewrites the headers with the number of edges written and closes the files.
+        """
+        for name, f in self._files.items():
+            if f.closed:
+                continue
+            f.seek(0)
+            self._write_header(f, self._dtypes[name], self._shape(name, self._n_edges))
+            f.close()
+
+    def abort(self) -> None:
+        """
+        Closes the files without finalising them and deletes the store's files,
+        so an incomplete store cannot be loaded.
+        """
+        for f in self._files.values():
+            f.close()
+        for name in (*self._files, self.META):
+            try:
+                os.remove(os.path.join(self._path, name))
+            except FileNotFoundError:
+                pass
+
+    @property
+    def n_edges(self) -> int:
+        return self._n_edges
+
+    @staticmethod
+    def load(path: str, mmap_mode: str = "r") -> CompactEdgeList:
+        """
+        Opens a store written by `EdgeBlockStore`.
+        :param path: store directory
+        :param mmap_mode: memory map mode passed to `np.load`
+        :returns CompactEdgeList: edge list backed by memory-mapped arrays
+        """
+        with np.load(os.path.join(path, EdgeBlockStore.META)) as meta:
+            topology_names = meta["topology_names"].tolist()
+            joint_degrees = meta["joint_degrees"]
+
+        return CompactEdgeList(
+            np.load(os.path.join(path, EdgeBlockStore.EDGES), mmap_mode=mmap_mode),
+            np.load(os.path.join(path, EdgeBlockStore.TOPOLOGIES), mmap_mode=mmap_mode),
+            topology_names,
+            np.load(os.path.join(path, EdgeBlockStore.MOTIF_IDS), mmap_mode=mmap_mode),
+            joint_degrees,
+        )
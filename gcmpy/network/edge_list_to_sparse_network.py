@@ -0,0 +1,44 @@
+import numpy as np
+
+from gcmpy.network.compact_edge_list import CompactEdgeList
+from gcmpy.network.sparse_network import SparseNetwork, import_sparse
+
+
+class EdgeListToSparseNetwork:
+    @staticmethod
+    def convert(edgelist) -> SparseNetwork:
+        """
+        Builds a CSR adjacency straight from the edge arrays. Both directions of
+        each edge are sorted by (row, column) and the row pointer is the cumulative
+        count of entries per row.
+        :param edgelist: CompactEdgeList or LightWeightEdgeList
+        :returns SparseNetwork: symmetric CSR adjacency with aligned edge data
+        """
+        sparse = import_sparse()
+        if not isinstance(edgelist, CompactEdgeList):
+            edgelist = CompactEdgeList.from_edge_list(edgelist)
+
+        edges = edgelist.edges
+        n_vertices = max(
+            len(edgelist.joint_degree_matrix), int(edges.max(initial=-1)) + 1
+        )
+
+        rows = np.concatenate([edges[:, 0], edges[:, 1]])
+        cols = np.concatenate([edges[:, 1], edges[:, 0]])
+        order = np.lexsort((cols, rows))
+
+        indptr = np.zeros(n_vertices + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=n_vertices), out=indptr[1:])
+
+        adjacency = sparse.csr_matrix(
+            (np.ones(len(order), dtype=np.int32), cols[order], indptr),
+            shape=(n_vertices, n_vertices),
+        )
+
+        return SparseNetwork(
+            adjacency,
+            np.tile(edgelist.topology_codes, 2)[order],
+            edgelist.topology_names,
+            np.tile(edgelist.motif_ids, 2)[order],
+            edgelist.joint_degree_matrix,
+        )
@@ -0,0 +1,83 @@
+import numpy as np
+
+
+class MultiEdges:
+    """
+    Vectorised detection of self-loops and repeated edges in an `(E, 2)` edge
+    array. An undirected edge `(u, v)` is packed into the integer key
+    `min(u, v) * N + max(u, v)`, so repeated pairs are found with a single sort
+    of the keys in O(E log E).
+    """
+
+    @staticmethod
+    def keys(edges: np.ndarray, n_vertices: int) -> np.ndarray:
+        """
+        Packs each undirected edge into one int64 key.
+        :param edges: (E, 2) array of vertex pairs
+        :param n_vertices: number of vertices, larger than any vertex index
+        :returns np.ndarray: (E,) array of keys
+        """
+        u = edges[:, 0].astype(np.int64)
+        v = edges[:, 1].astype(np.int64)
+        return np.minimum(u, v) * n_vertices + np.maximum(u, v)
+
+    @staticmethod
+    def self_loops(edges: np.ndarray) -> np.ndarray:
+        """
+        :param edges: (E, 2) array of vertex pairs
+        :returns np.ndarray: (E,) mask of edges that join a vertex to itself
+        """
+        return edges[:, 0] == edges[:, 1]
+
+    @staticmethod
+    def repeats(edges: np.ndarray, n_vertices: int) -> np.ndarray:
+        """
+        Marks every occurrence of a vertex pair after its first, so erasing the
+        marked edges leaves one copy of each pair.
+        :param edges: (E, 2) array of vertex pairs
+        :param n_vertices: number of vertices, larger than any vertex index
+        :returns np.ndarray: (E,) mask of repeated edges
+        """
+        keys = MultiEdges.keys(edges, n_vertices)
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+
+        mask = np.zeros(len(keys), dtype=bool)
+        mask[order[1:][sorted_keys[1:] == sorted_keys[:-1]]] = True
+        return mask
+
+    @staticmethod
+    def find(edges: np.ndarray, n_vertices: int) -> tuple:
+        """
+        Finds self-loops and repeated edges. A repeated self-loop is counted as
+        a self-loop only.
+        :param edges: (E, 2) array of vertex pairs
+        :param n_vertices: number of vertices, larger than any vertex index
+        :returns tuple: (E,) masks of self-loops and of repeated edges
+        """
+        loops = MultiEdges.self_loops(edges)
+        repeats = MultiEdges.repeats(edges, n_vertices) & ~loops
+        return loops, repeats
+
+    @staticmethod
+    def count(
+        loops: np.ndarray,
+        repeats: np.ndarray,
+        topology_codes: np.ndarray,
+        topology_names: list,
+    ) -> dict:
+        """
+        Counts self-loops and repeated edges per topology.
+        :param loops: (E,) mask of self-loops
+        :param repeats: (E,) mask of repeated edges
+        :param topology_codes: (E,) array of indices into `topology_names`
+        :param topology_names: list of topology names
+        :returns dict: topology name to tuple of (self-loops, repeated edges)
+        """
+        n = len(topology_names)
+        n_loops = np.bincount(topology_codes[loops], minlength=n)
+        n_repeats = np.bincount(topology_codes[repeats], minlength=n)
+        return {
+            name: (int(n_loops[k]), int(n_repeats[k]))
+            for k, name in enumerate(topology_names)
+        }
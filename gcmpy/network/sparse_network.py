@@ -0,0 +1,89 @@
+import numpy as np
+
+
+def import_sparse():
+    """
+    Imports `scipy.sparse`, which is only needed by the CSR output mode.
+    :returns module: scipy.sparse
+    """
+    try:
+        from scipy import sparse
+    except ImportError as e:
+        raise ImportError(
+            "The CSR output mode requires scipy: pip install gcmpy[sparse]"
+        ) from e
+    return sparse
+
+
+class SparseNetwork:
+    """
+    Graph held as a symmetric `scipy.sparse.csr_matrix` adjacency. Every edge
+    `(u, v)` is stored in both rows `u` and `v`; repeated edges are kept as
+    separate entries, so the matrix is not in canonical format and row sums
+    give vertex degrees. `topology_codes` and `motif_ids` are aligned with the
+    CSR entries, i.e. with `adjacency.indices`.
+    :param adjacency: (N, N) csr_matrix
+    :param topology_codes: (nnz,) array of indices into `topology_names`
+    :param topology_names: list of topology names
+    :param motif_ids: (nnz,) array of motif ids
+    :param joint_degrees: (N, T) joint degree matrix
+    """
+
+    __slots__ = (
+        "_adjacency",
+        "_topology_codes",
+        "_topology_names",
+        "_motif_ids",
+        "_joint_degrees",
+    )
+
+    def __init__(
+        self,
+        adjacency,
+        topology_codes: np.ndarray,
+        topology_names: list,
+        motif_ids: np.ndarray,
+        joint_degrees: np.ndarray,
+    ):
+        self._adjacency = adjacency
+        self._topology_codes: np.ndarray = topology_codes
+        self._topology_names: list = list(topology_names)
+        self._motif_ids: np.ndarray = motif_ids
+        self._joint_degrees: np.ndarray = joint_degrees
+
+    def __len__(self) -> int:
+        return self._adjacency.shape[0]
+
+    def neighbours(self, v: int) -> np.ndarray:
+        """
+        Neighbours of vertex `v`, with repeats for multi-edges.
+        """
+        indptr = self._adjacency.indptr
+        return self._adjacency.indices[indptr[v] : indptr[v + 1]]
+
+    @property
+    def degrees(self) -> np.ndarray:
+        """
+        Number of edge ends at each vertex.
+        """
+        return np.diff(self._adjacency.indptr)
+
+    @property
+    def adjacency(self):
+        return self._adjacency
+
+    @property
+    def topology_codes(self) -> np.ndarray:
+        return self._topology_codes
+
+    @property
+    def topology_names(self) -> list:
+        return self._topology_names
+
+    @property
+    def motif_ids(self) -> np.ndarray:
+        return self._motif_ids
+
+    @property
+    def joint_degrees(self) -> np.ndarray:
+        return self._joint_degrees
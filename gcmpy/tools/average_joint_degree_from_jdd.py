@@ -1,10 +1,15 @@
+from gcmpy.joint_degree.joint_degree_table import JointDegreeTable
+
+
 class AverageJointDegreeFromJDD:
     @staticmethod
-    def get_average_joint_degrees(jdd: dict) -> list:
-        joint_degrees = list(jdd.keys())
-        num_topologies = len(joint_degrees[0])
-        average_degrees = [0.0] * num_topologies
-        for joint_degree in joint_degrees:
-            for index in range(num_topologies):
-                average_degrees[index] += joint_degree[index] * jdd[joint_degree]
-        return average_degrees
+    def get_average_joint_degrees(jdd) -> list:
+        """
+        Weighted sum of the joint degrees, the average degree in each topology
+        if the jdd is normalised.
+        :param jdd: dict or JointDegreeTable joint degree distribution
+        :returns list: average degree per topology
+        """
+        if not isinstance(jdd, JointDegreeTable):
+            jdd = JointDegreeTable.from_dict(jdd)
+        return jdd.moment(1, normalise=False).tolist()
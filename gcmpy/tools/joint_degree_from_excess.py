@@ -1,13 +1,24 @@
+import numpy as np
+
+from gcmpy.joint_degree.joint_degree_table import JointDegreeTable
+
+
 class JointDegreeFromExcess:
     @staticmethod
-    def invert_single(qk: dict, i: int) -> dict:
+    def invert_single(qk, i: int):
         """
         Invert a excess joint degree distribution to a joint
         degree distribution.
-        :param qk: dict excess joint degree distribution
+        :param qk: dict or JointDegreeTable excess joint degree distribution
         :param i: index of current topology in joint degree tuple
-        :returns dict: joint degree distribution
+        :returns: joint degree distribution, of the same type as `qk`
         """
+        if isinstance(qk, JointDegreeTable):
+            top = qk.weights / (qk.keys[:, i] + 1)
+            keys = qk.keys.copy()
+            keys[:, i] += 1
+            return JointDegreeTable(keys, top / np.sum(top))
+
         P = {}
         bottom = sum(
             [(qk[joint_excess] / (joint_excess[i] + 1)) for joint_excess in qk]
@@ -21,14 +32,68 @@ class JointDegreeFromExcess:
 
     @staticmethod
     def observations_from_dict(qks: dict, keys: list) -> dict:
+        """
+        :param qks: dict of topology to excess jdd, a dict or JointDegreeTable
+        :param keys: list of topologies, in joint degree tuple order
+        :returns dict: topology to observed jdd, of the same type as its qk
+        """
         P_observations = {}
         for i, key in enumerate(keys):
             P_observations[key] = JointDegreeFromExcess.invert_single(qks[key], i)
         return P_observations
 
     @staticmethod
-    def get_joint_degree_distribution(qks: dict, keys: list) -> dict:
+    def table_from_observations(p_obs: dict) -> JointDegreeTable:
+        """
+        `get_joint_degree_distribution` for observations held in tables.
+        :param p_obs: dict of topology to observed JointDegreeTable
+        :returns JointDegreeTable: the stitched joint degree distribution
+        """
+        chosen_topology = "2-clique"
+        base = p_obs[chosen_topology]
+
+        # the first key of the reference topology observed in all topologies
+        common = np.ones(len(base), dtype=bool)
+        for topology in p_obs:
+            common &= p_obs[topology].rows(base.keys) >= 0
+        if not common.any():
+            raise ValueError(
+                "JointDDFromExcess - no common keys found across observations"
+            )
+        common_key = base.keys[np.argmax(common)]
+
+        # scale all observations to the reference value and merge them, later
+        # topologies taking precedence for keys observed more than once
+        base_value = base.weights[base.row(tuple(common_key))]
+        keys, weights = [], []
+        for topology, obs in p_obs.items():
+            scale_factor = base_value / obs.weights[obs.row(tuple(common_key))]
+            keys.append(obs.keys)
+            weights.append(obs.weights * scale_factor)
+        keys = np.concatenate(keys)[::-1]
+        weights = np.concatenate(weights)[::-1]
+        keys, first = np.unique(keys, axis=0, return_index=True)
+        weights = weights[first]
+
+        return JointDegreeTable(keys, weights / np.sum(weights))
+
+    @staticmethod
+    def get_joint_degree_distribution(qks: dict, keys: list):
+        """
+        Stitches the jdds observed from each topology's excess jdd into one.
+        :param qks: dict of topology to excess jdd, a dict or JointDegreeTable
+        :param keys: list of topologies, in joint degree tuple order
+        :returns: joint degree distribution, a JointDegreeTable if every qk is
+        one and a dict otherwise
+        """
         p_obs: dict = JointDegreeFromExcess.observations_from_dict(qks, keys)
+        if all(isinstance(obs, JointDegreeTable) for obs in p_obs.values()):
+            return JointDegreeFromExcess.table_from_observations(p_obs)
+        p_obs = {
+            topology: obs.to_dict() if isinstance(obs, JointDegreeTable) else obs
+            for topology, obs in p_obs.items()
+        }
+
         # get set of common keys across all observations
         p_obs_list = [p_obs[topology] for topology in p_obs]
         common_keys = list(set.intersection(*map(set, p_obs_list)))
@@ -1,26 +1,18 @@
-from gcmpy.tools.average_joint_degree_from_jdd import AverageJointDegreeFromJDD
+from gcmpy.joint_degree.joint_degree_table import JointDegreeTable
 
 
 class JointExcessfromJDD:
     @staticmethod
-    def get_joint_excess_distributions(jdd: dict) -> list[dict]:
-        qks = []
-
-        averages = AverageJointDegreeFromJDD.get_average_joint_degrees(jdd)
-
-        joint_degrees = list(jdd.keys())
-        num_topologies: int = len(joint_degrees[0])
-        for index in range(num_topologies):
-            q = {}
-            for joint_degree in joint_degrees:
-                _joint_degree = list(joint_degree)
-                if _joint_degree[index] > 0:
-                    _joint_degree[index] -= 1
-                    q[tuple(_joint_degree)] = (
-                        (_joint_degree[index] + 1) * jdd[joint_degree] + 0.0
-                    ) / averages[index]
-            qks.append(q)
-        return qks
+    def get_joint_excess_distributions(jdd) -> list:
+        """
+        Excess joint degree distribution of each topology.
+        :param jdd: dict or JointDegreeTable joint degree distribution
+        :returns list: excess distribution per topology, of the same type as `jdd`
+        """
+        if isinstance(jdd, JointDegreeTable):
+            return [jdd.excess(i) for i in range(jdd.n_topologies)]
+        table = JointDegreeTable.from_dict(jdd)
+        return [table.excess(i).to_dict() for i in range(table.n_topologies)]
 
     @staticmethod
     def convert_list_qks_to_dict(qks_list: list[dict], keys: list[str]) -> dict:
@@ -64,4 +64,5 @@ setup(
         "networkx==2.8.8",
         "numpy==1.24.3",
     ],
+    extras_require={"sparse": ["scipy"]},
 )
@@ -0,0 +1,49 @@
+import unittest
+from itertools import combinations
+
+import networkx as nx
+
+from gcmpy.covers.bounded_cliques import bounded_cliques, bounded_cliques_through
+
+
+def decomposed_maximal_cliques(G: nx.Graph, m0: int) -> set:
+    C = set()
+    for c in nx.find_cliques(G):
+        c = sorted(c)
+        C.update(combinations(c, m0) if len(c) > m0 else [tuple(c)])
+    return C
+
+
+class BoundedCliquesTest(unittest.TestCase):
+    def setUp(self):
+        self._G = nx.powerlaw_cluster_graph(150, 3, 0.8, seed=1)
+        self._G.add_edges_from(combinations(range(150, 162), 2))
+        self._G.add_node(200)
+
+    def test_maximal(self):
+        for m0 in (2, 3, 4, 5):
+            C = list(bounded_cliques(self._G, m0))
+            self.assertEqual(len(C), len(set(C)))
+            self.assertEqual(set(C), decomposed_maximal_cliques(self._G, m0))
+
+    def test_all(self):
+        for m0 in (2, 3, 4):
+            C = list(bounded_cliques(self._G, m0, maximal=False))
+            expected = [
+                tuple(sorted(c))
+                for c in nx.enumerate_all_cliques(self._G)
+                if len(c) <= m0
+            ]
+            self.assertEqual(len(C), len(set(C)))
+            self.assertEqual(set(C), set(expected))
+
+    def test_through(self):
+        C = set(bounded_cliques(self._G, 4))
+        for v in (0, 10, 155, 200):
+            through = list(bounded_cliques_through(self._G, v, 4))
+            self.assertEqual(len(through), len(set(through)))
+            self.assertEqual(set(through), {c for c in C if v in c})
+
+
+if __name__ == "__main__":
+    unittest.main()
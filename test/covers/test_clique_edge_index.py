@@ -0,0 +1,39 @@
+import unittest
+from itertools import combinations
+
+from gcmpy.covers.clique_edge_index import CliqueEdgeIndex
+
+
+class CliqueEdgeIndexTest(unittest.TestCase):
+    def test_index(self):
+        cliques = [[1, 2, 3], [3, 2, 4], [4, 5]]
+        index = CliqueEdgeIndex(cliques)
+
+        self.assertEqual(len(index), 6)
+        self.assertEqual(index.cliques(3, 2), [0, 1])
+        self.assertEqual(index.multiplicity(2, 3), 2)
+        self.assertEqual(index.multiplicity(1, 5), 0)
+        self.assertEqual(index.shared_edges(cliques[0]), 1)
+        self.assertEqual(index.shared_edges(cliques[2]), 0)
+
+        index.remove(1, cliques[1])
+        self.assertEqual(index.cliques(2, 3), [0])
+        self.assertEqual(index.multiplicity(2, 4), 0)
+        self.assertEqual(len(index), 4)
+
+        index.add(3, [2, 5])
+        self.assertEqual(index.cliques(5, 2), [3])
+
+    def test_shared_edges_match_scan(self):
+        cliques = [list(c) for c in combinations(range(7), 3)][::3]
+        index = CliqueEdgeIndex(cliques)
+        for c, clique in enumerate(cliques):
+            expected = sum(
+                any(n != c and {u, v} <= set(other) for n, other in enumerate(cliques))
+                for u, v in combinations(clique, 2)
+            )
+            self.assertEqual(index.shared_edges(clique), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+from itertools import combinations
+
+import networkx as nx
+
+from gcmpy.covers.component_cover import ComponentCover
+from gcmpy.covers.cover_types import CoverTypes
+
+
+def edge_set(cover: list) -> list:
+    return [frozenset(e) for c in cover for e in combinations(c, 2)]
+
+
+class ComponentCoverTest(unittest.TestCase):
+    def setUp(self):
+        # many components, with cut vertices between clustered blocks
+        self._G = nx.disjoint_union_all(
+            [nx.powerlaw_cluster_graph(40, 3, 0.7, seed=i) for i in range(20)]
+        )
+        self._G.add_edge(0, 0)
+        self._G.add_node(-1)
+
+    def test_covers(self):
+        expected = {frozenset(e) for e in self._G.edges() if e[0] != e[1]}
+        for cover_type, max_size in [(CoverTypes.EECC, 4), (CoverTypes.MPCC, 0)]:
+            for blocks in (True, False):
+                cover = ComponentCover(cover_type, max_size, blocks).cover(
+                    self._G, seed=3, n_workers=1
+                )
+                edges = edge_set(cover)
+                self.assertEqual(len(edges), len(set(edges)))
+                self.assertEqual(set(edges), expected)
+
+    def test_workers_reproduce_serial_cover(self):
+        for cover_type, max_size in [(CoverTypes.EECC, 3), (CoverTypes.MPCC, 3)]:
+            covers = ComponentCover(cover_type, max_size)
+            serial = covers.cover(self._G, seed=5, n_workers=1)
+            parallel = covers.cover(self._G, seed=5, n_workers=2, batch_edges=50)
+            self.assertEqual(serial, parallel)
+
+    def test_label(self):
+        G = ComponentCover(CoverTypes.MPCC).label(self._G, seed=1, n_workers=1)
+        ids = {}
+        for u, v in G.edges():
+            if u != v:
+                size, _, ID = G.edges[u, v]["clique"].split("-")
+                ids.setdefault(ID, []).append(int(size))
+        for ID, sizes in ids.items():
+            self.assertEqual(len(sizes), sizes[0] * (sizes[0] - 1) // 2)
+
+    def test_eecc_needs_max_size(self):
+        with self.assertRaises(ValueError):
+            ComponentCover(CoverTypes.EECC)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+from itertools import combinations
+
+import networkx as nx
+
+from gcmpy.covers.eecc import EECC
+from gcmpy.covers.limited_clique_set import LimitedCliqueSet
+
+
+def live_cliques(cliques: LimitedCliqueSet) -> dict:
+    return {c: cliques.score_of(c) for c in cliques}
+
+
+class LimitedCliqueSetTest(unittest.TestCase):
+    def test_removal_matches_recomputation(self):
+        g = nx.powerlaw_cluster_graph(80, 3, 0.7, seed=4)
+        for m0 in (3, 4):
+            G = g.copy()
+            cliques = LimitedCliqueSet(G, m0)
+            for _ in range(10):
+                cliques.remove(cliques.pop_best())
+                self.assertEqual(
+                    live_cliques(cliques), live_cliques(LimitedCliqueSet(G.copy(), m0))
+                )
+
+    def test_EECC_is_edge_disjoint_cover(self):
+        g = nx.powerlaw_cluster_graph(100, 3, 0.7, seed=2)
+        for m0 in (2, 3, 4):
+            G = EECC()
+            G.add_edges_from(g.edges())
+            G.set_max_clique_size(m0)
+
+            covered = []
+            for c in G.get_EECC():
+                self.assertTrue(2 <= len(c) <= m0)
+                covered.extend(tuple(sorted(e)) for e in combinations(c, 2))
+            self.assertEqual(len(covered), len(set(covered)))
+            self.assertEqual(set(covered), set(tuple(sorted(e)) for e in g.edges()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,9 @@
 import unittest
+from itertools import combinations
+
 import networkx as nx
 
-from gcmpy.covers.mpcc import MPCC
+from gcmpy.covers.mpcc import MPCC, MPCC_cover
 from gcmpy.motif_generators.clique_motif import clique_motif
 from gcmpy.joint_degree.joint_degree_loaders.joint_degree_manual import (
     JointDegreeManual,
@@ -69,3 +71,19 @@ class MPCCTest(unittest.TestCase):
             cliques[size] /= size
 
         self.assertTrue(max([size for size in cliques]) == 2)
+
+    def test_mpcc_large_clique(self):
+        # a 30-clique has 2^30 sub-cliques, which are never enumerated
+        G = nx.powerlaw_cluster_graph(200, 3, 0.8, seed=7)
+        G.add_edges_from(combinations(range(10, 40), 2))
+        edges = {frozenset(e) for e in G.edges()}
+
+        for max_size in [0, 4]:
+            cover = MPCC_cover(G, max_size)
+            covered = [frozenset(e) for c in cover for e in combinations(c, 2)]
+            self.assertEqual(len(covered), len(set(covered)))
+            self.assertEqual(set(covered), edges)
+            if max_size == 0:
+                self.assertEqual(sorted(cover[0]), list(range(10, 40)))
+            else:
+                self.assertEqual(max(len(c) for c in cover), max_size)
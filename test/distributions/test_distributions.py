@@ -0,0 +1,93 @@
+import math
+import unittest
+
+import numpy as np
+
+from gcmpy.distributions.exponential import exponential
+from gcmpy.distributions.poisson import poisson
+from gcmpy.distributions.power_law import power_law
+from gcmpy.distributions.scale_free_cut_off import scale_free_cut_off
+from gcmpy.distributions.special_functions import zeta, polylog
+
+
+class DistributionsTest(unittest.TestCase):
+    def test_scalar_matches_closed_form(self):
+        self.assertAlmostEqual(
+            poisson(2.5)(4), math.exp(-2.5) * 2.5**4 / math.factorial(4)
+        )
+        self.assertAlmostEqual(
+            exponential(0.5)(3), (1 - math.exp(-0.5)) * math.exp(-1.5)
+        )
+        self.assertAlmostEqual(power_law(2.5)(1) / power_law(2.5)(2), 2**2.5)
+        self.assertAlmostEqual(
+            scale_free_cut_off(2.0, 10.0)(1) / scale_free_cut_off(2.0, 10.0)(2),
+            4 * math.exp(0.1),
+        )
+
+    def test_array_matches_scalar(self):
+        ks = np.arange(0, 40)
+        for p in (
+            poisson(3.0),
+            exponential(0.3),
+            power_law(2.2),
+            scale_free_cut_off(2.2, 20.0),
+        ):
+            values = p(ks)
+            self.assertEqual(values.shape, ks.shape)
+            for k in ks.tolist():
+                self.assertAlmostEqual(values[k], p(k))
+
+    def test_poisson_large_k(self):
+        p = poisson(500.0)
+        values = p(np.arange(0, 2000))
+        self.assertTrue(np.isfinite(values).all())
+        self.assertAlmostEqual(values.sum(), 1.0)
+        self.assertEqual(p(5000), 0.0)
+
+        # beyond the log factorial table, without tabulating up to k
+        p = poisson(3.0e6)
+        self.assertAlmostEqual(
+            p(3_000_000) * math.sqrt(2 * math.pi * 3.0e6), 1.0, places=6
+        )
+        ks = np.array([99_999, 100_000, 100_001])
+        self.assertTrue(
+            np.allclose(
+                poisson(1.0e5)(ks),
+                [math.exp(-1e5 + k * math.log(1e5) - math.lgamma(k + 1)) for k in ks],
+            )
+        )
+
+    def test_outside_support(self):
+        self.assertEqual(poisson(2.0)(-1), 0.0)
+        self.assertEqual(exponential(0.5)(-1), 0.0)
+        self.assertEqual(power_law(2.5)(0), 0.0)
+        self.assertEqual(scale_free_cut_off(2.0, 10.0)(0), 0.0)
+
+    def test_zeta(self):
+        self.assertAlmostEqual(zeta(2), math.pi**2 / 6, places=14)
+        self.assertAlmostEqual(zeta(4), math.pi**4 / 90, places=14)
+        self.assertAlmostEqual(zeta(1.001), 1000.5772884782, places=8)
+        self.assertAlmostEqual(zeta(-1), -1 / 12, places=14)
+        with self.assertRaises(ValueError):
+            zeta(1)
+
+    def test_polylog(self):
+        for z in (0.1, 0.5, 0.9, 0.999999):
+            self.assertAlmostEqual(polylog(1, z) / -math.log(1 - z), 1.0, places=12)
+            self.assertAlmostEqual(polylog(0, z) / (z / (1 - z)), 1.0, places=12)
+        self.assertAlmostEqual(
+            polylog(2, 0.5), math.pi**2 / 12 - math.log(2) ** 2 / 2, places=14
+        )
+        self.assertEqual(polylog(2.5, 1.0), zeta(2.5))
+
+    def test_normalisation(self):
+        ks = np.arange(0, 200000)
+        self.assertAlmostEqual(power_law(3.0)(ks).sum(), 1.0, places=9)
+        self.assertAlmostEqual(scale_free_cut_off(1.5, 1000.0)(ks).sum(), 1.0)
+        self.assertAlmostEqual(scale_free_cut_off(0.5, 100.0)(ks).sum(), 1.0)
+        with self.assertRaises(ValueError):
+            power_law(1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
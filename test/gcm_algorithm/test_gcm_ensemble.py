@@ -0,0 +1,55 @@
+import unittest
+import numpy as np
+
+from gcmpy.joint_degree.joint_degree_loaders.joint_degree_manual import (
+    JointDegreeManual,
+)
+from gcmpy.gcm_algorithm.gcm_ensemble import GCMEnsemble
+from gcmpy.gcm_algorithm.gcm_algorithm_types import GCMAlgorithmTypes
+from gcmpy.motif_generators.clique_motif import clique_motif
+from gcmpy.names.joint_degree_names import JointDegreeNames
+from gcmpy.names.gcm_algorithm_names import GCMAlgorithmNames
+
+NETWORK_SIZE: int = 1000
+
+
+class GCMEnsembleTest(unittest.TestCase):
+    def setUp(self):
+        params = {}
+        params[JointDegreeNames.JDD] = {
+            (1, 0): 0.2,
+            (2, 1): 0.5,
+            (3, 0): 0.1,
+            (5, 1): 0.2,
+        }
+        params[JointDegreeNames.MOTIF_SIZES] = [2, 3]
+        joint_degree = JointDegreeManual(params)
+
+        params = {}
+        params[GCMAlgorithmNames.GCM_TYPE] = GCMAlgorithmTypes.FAST
+        params[GCMAlgorithmNames.MOTIF_SIZES] = [2, 3]
+        params[GCMAlgorithmNames.EDGE_NAMES] = ["2-clique", "3-clique"]
+        params[GCMAlgorithmNames.BUILD_FUNCTIONS] = [clique_motif, clique_motif]
+
+        self.ensemble = GCMEnsemble(joint_degree, params, NETWORK_SIZE)
+
+    def test_serial_and_parallel_agree(self):
+        serial = self.ensemble.generate(4, seed=123, n_workers=1)
+        parallel = self.ensemble.generate(4, seed=123, n_workers=2)
+
+        self.assertEqual(len(parallel), 4)
+        for g1, g2 in zip(serial, parallel):
+            self.assertEqual(g1.edge_list, g2.edge_list)
+            self.assertEqual(g1.joint_degrees, g2.joint_degrees)
+
+        # realizations are independent of one another
+        self.assertNotEqual(serial[0].edge_list, serial[1].edge_list)
+
+    def test_reproducible_from_seed(self):
+        results = list(self.ensemble.realizations(3, seed=5, n_workers=1))
+        index, seed, graph = results[2]
+        self.assertEqual(index, 2)
+
+        again = self.ensemble.realization(np.random.SeedSequence(5, spawn_key=(2,)))
+        self.assertEqual(graph.edge_list, again.edge_list)
+        self.assertEqual(graph.edge_list, self.ensemble.realization(seed).edge_list)
@@ -0,0 +1,53 @@
+import unittest
+import numpy as np
+
+from gcmpy.gcm_algorithm.motif_stubs import MotifStubs
+from gcmpy.gcm_algorithm.gcm_algorithm_fast import GCMAlgorithmFast
+from gcmpy.motif_generators.clique_motif import clique_motif
+from gcmpy.names.gcm_algorithm_names import GCMAlgorithmNames
+
+
+class MotifStubsTest(unittest.TestCase):
+    def test_motif_blocks(self):
+        jds = [(1, 2), (2, 0), (3, 1), (0, 3)]
+        arr = MotifStubs.as_joint_degree_array(jds)
+        self.assertEqual(arr.shape, (4, 2))
+
+        blocks = MotifStubs.motif_blocks(arr, [2, 3], np.random.default_rng(1))
+        self.assertEqual(len(blocks), 2)
+
+        motifs, remainder = blocks[0]
+        self.assertEqual(motifs.shape, (3, 2))
+        self.assertEqual(len(remainder), 0)
+        self.assertEqual(
+            np.bincount(motifs.ravel(), minlength=4).tolist(), arr[:, 0].tolist()
+        )
+
+        motifs, remainder = blocks[1]
+        self.assertEqual(motifs.shape, (2, 3))
+        self.assertEqual(
+            np.bincount(motifs.ravel(), minlength=4).tolist(), arr[:, 1].tolist()
+        )
+
+    def test_partition_remainder(self):
+        motifs, remainder = MotifStubs.partition(np.arange(7), 3)
+        self.assertEqual(motifs.shape, (2, 3))
+        self.assertEqual(remainder.tolist(), [6])
+
+    def test_seeded_algorithm(self):
+        jds = [(2, 1), (1, 1), (3, 1), (2, 0)]
+
+        params = {}
+        params[GCMAlgorithmNames.MOTIF_SIZES] = [2, 3]
+        params[GCMAlgorithmNames.EDGE_NAMES] = ["2-clique", "3-clique"]
+        params[GCMAlgorithmNames.BUILD_FUNCTIONS] = [clique_motif, clique_motif]
+        params[GCMAlgorithmNames.SEED] = 42
+
+        g1 = GCMAlgorithmFast(params).random_clustered_graph(jds)
+        g2 = GCMAlgorithmFast(params).random_clustered_graph(jds)
+
+        self.assertEqual(g1.edge_list, g2.edge_list)
+        self.assertEqual(len(g1.edge_list), 4 + 3)
+        self.assertEqual(g1.topologies, ["2-clique"] * 4 + ["3-clique"] * 3)
+        self.assertEqual(g1.motif_id, [0, 1, 2, 3, 4, 4, 4])
+        self.assertEqual(g1.joint_degrees, jds)
@@ -0,0 +1,51 @@
+import unittest
+import numpy as np
+
+from gcmpy.joint_degree.alias_table import AliasTable
+from gcmpy.joint_degree.joint_degree_loaders.joint_degree_manual import (
+    JointDegreeManual,
+)
+from gcmpy.names.joint_degree_names import JointDegreeNames
+
+NETWORK_SIZE: int = 200000
+
+
+class AliasTableTest(unittest.TestCase):
+    def test_frequencies(self):
+        weights = np.array([0.1, 0.0, 3.0, 0.9, 1.0])
+        table = AliasTable(weights)
+        samples = table.sample(NETWORK_SIZE, np.random.default_rng(0))
+
+        frequencies = np.bincount(samples, minlength=len(weights)) / NETWORK_SIZE
+        np.testing.assert_allclose(frequencies, weights / weights.sum(), atol=0.005)
+        self.assertEqual(frequencies[1], 0.0)
+
+    def test_invalid_weights(self):
+        with self.assertRaises(ValueError):
+            AliasTable(np.zeros(3))
+
+    def test_cached_sampler(self):
+        params = {}
+        params[JointDegreeNames.JDD] = {(1, 0): 0.2, (2, 1): 0.5, (3, 0): 0.3}
+        params[JointDegreeNames.MOTIF_SIZES] = [2, 3]
+        params[JointDegreeNames.SEED] = 4
+        jd = JointDegreeManual(params)
+
+        jds = jd.sample_jds_from_jdd(NETWORK_SIZE)
+        self.assertEqual(jds.shape, (NETWORK_SIZE, 2))
+        self.assertTrue(np.issubdtype(jds.dtype, np.integer))
+        self.assertEqual(jds[:, 0].sum() % 2, 0)
+        self.assertEqual(jds[:, 1].sum() % 3, 0)
+
+        _, table = jd.sampler()
+        jd.sample_jds_from_jdd(10)
+        self.assertIs(jd.sampler()[1], table)
+
+        # replacing the jdd rebuilds the table
+        jd.jdd = {(4, 4): 1.0}
+        self.assertIsNot(jd.sampler()[1], table)
+        np.testing.assert_array_equal(jd.sample_jds_from_jdd(6), [[4, 4]] * 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
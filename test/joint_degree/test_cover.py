@@ -0,0 +1,72 @@
+import unittest
+from collections import Counter
+
+import numpy as np
+
+from gcmpy.joint_degree.joint_degree_loaders.joint_degree_cover import (
+    JointDegreeCover,
+)
+from gcmpy.names.joint_degree_names import JointDegreeNames
+
+
+def reference_jdd(cover: list) -> dict:
+    # per-vertex loop over the cover, without the empty clique sizes
+    vertex_ids = sorted(set(v for c in cover for v in c))
+    largest_clique = max(len(c) for c in cover)
+    jds = {v: [0] * largest_clique for v in vertex_ids}
+    for c in cover:
+        for v in c:
+            jds[v][len(c) - 1] += 1
+    present = sorted(set(len(c) - 1 for c in cover))
+    counts = Counter(tuple(jd[i] for i in present) for jd in jds.values())
+    return {k: v / len(vertex_ids) for k, v in counts.items()}
+
+
+class JDCoverTest(unittest.TestCase):
+    def test_cover_jdd(self):
+        cover = [[1, 2], [2, 3, 4], [1, 3, 4, 5], [5, 6], [6, 4, 2], [7, 1]]
+
+        params = {}
+        params[JointDegreeNames.COVER] = cover
+        loader = JointDegreeCover(params)
+
+        self.assertEqual(loader.motif_sizes, [2, 3, 4])
+        self.assertEqual(loader.jdd, reference_jdd(cover))
+        self.assertAlmostEqual(sum(loader.jdd.values()), 1.0)
+
+    def test_changing_cover(self):
+        params = {}
+        params[JointDegreeNames.COVER] = [[0, 1], [1, 2]]
+        loader = JointDegreeCover(params)
+        self.assertEqual(loader.motif_sizes, [2])
+        loader.jdd
+
+        cover = [[0, 1, 2], [2, 3], [3, 4, 5]]
+        loader.cover = cover
+        self.assertEqual(loader.motif_sizes, [2, 3])
+        self.assertEqual(loader.jdd, reference_jdd(cover))
+
+        jds = loader.sample_jds_from_jdd(1000)
+        self.assertEqual(jds.shape, (1000, 2))
+        self.assertEqual(jds[:, 0].sum() % 2, 0)
+        self.assertEqual(jds[:, 1].sum() % 3, 0)
+
+    def test_random_cover_matches_reference(self):
+        rng = np.random.default_rng(3)
+        cover = [
+            rng.choice(200, size=size, replace=False).tolist()
+            for size in rng.choice([2, 3, 5], size=500)
+        ]
+
+        params = {}
+        params[JointDegreeNames.COVER] = cover
+        loader = JointDegreeCover(params)
+
+        expected = reference_jdd(cover)
+        self.assertEqual(set(loader.jdd), set(expected))
+        for key, p in expected.items():
+            self.assertAlmostEqual(loader.jdd[key], p)
+
+
+if __name__ == "__main__":
+    unittest.main()
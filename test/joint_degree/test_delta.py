@@ -34,3 +34,20 @@ class JDDeltaTest(unittest.TestCase):
                 sum([jd[i] for jd in jds]) % params[JointDegreeNames.MOTIF_SIZES][i]
                 == 0
             )
+
+    def test_degree_delta_keeps_other_degrees(self):
+        params = {}
+        params[JointDegreeNames.MOTIF_SIZES] = [2, 3]
+        params[JointDegreeNames.PROBS] = [0.8, 0.2]
+        params[JointDegreeNames.FP] = power_law(2.5)
+        params[JointDegreeNames.LOW_HIGH_DEGREE_BOUND] = (1, 10)
+        params[JointDegreeNames.TARGET_K] = 4
+        jdd = JointDegreeDelta(params).jdd
+
+        # every degree except the target is a single 2-clique joint degree
+        for k in [1, 2, 3, 5, 6, 7, 8, 9]:
+            self.assertIn((k, 0), jdd)
+        self.assertEqual(
+            {jd for jd in jdd if jd[0] + 2 * jd[1] == 4}, {(4, 0), (2, 1), (0, 2)}
+        )
+        self.assertAlmostEqual(sum(jdd.values()), 1.0)
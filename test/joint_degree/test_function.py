@@ -0,0 +1,86 @@
+import unittest
+import numpy as np
+
+from gcmpy.joint_degree.joint_degree_loaders.joint_degree_function import (
+    JointDegreeFunction,
+)
+from gcmpy.joint_degree.vectorized import vectorized
+from gcmpy.names.joint_degree_names import JointDegreeNames
+
+NETWORK_SIZE: int = 10000
+
+
+def fp(jd: tuple) -> float:
+    return np.exp(-jd[0] - 0.5 * jd[1] - 2.0 * jd[2])
+
+
+@vectorized
+def fp_vectorized(jd: tuple) -> np.ndarray:
+    return np.exp(-jd[0] - 0.5 * jd[1] - 2.0 * jd[2])
+
+
+class JDFunctionTest(unittest.TestCase):
+    def setUp(self):
+        self.params = {}
+        self.params[JointDegreeNames.MOTIF_SIZES] = [2, 3, 4]
+        self.params[JointDegreeNames.FP] = fp
+        self.params[JointDegreeNames.LOW_HIGH_DEGREE_BOUND] = [(0, 9), (1, 10), (0, 5)]
+        self.params[JointDegreeNames.CHUNK_SIZE] = 77
+
+    def test_function_JDD(self):
+        DegreeDistObj = JointDegreeFunction(self.params)
+        jdd = DegreeDistObj.jdd
+
+        self.assertEqual(len(jdd), 10 * 10 * 6)
+        self.assertAlmostEqual(jdd[(2, 3, 1)], fp((2, 3, 1)))
+        self.assertAlmostEqual(DegreeDistObj.truncated_mass, 0.0)
+
+        jds = DegreeDistObj.sample_jds_from_jdd(NETWORK_SIZE)
+        self.assertEqual(jds.shape, (NETWORK_SIZE, 3))
+        for i, m in enumerate(self.params[JointDegreeNames.MOTIF_SIZES]):
+            self.assertEqual(jds[:, i].sum() % m, 0)
+
+    def test_vectorized_matches_scalar(self):
+        keys, weights = JointDegreeFunction(self.params).jdd_arrays()
+        self.params[JointDegreeNames.FP] = fp_vectorized
+        vkeys, vweights = JointDegreeFunction(self.params).jdd_arrays()
+
+        np.testing.assert_array_equal(keys, vkeys)
+        np.testing.assert_allclose(weights, vweights)
+
+    def test_mass_threshold(self):
+        self.params[JointDegreeNames.FP] = fp_vectorized
+        self.params[JointDegreeNames.MASS_THRESHOLD] = 1e-3
+        DegreeDistObj = JointDegreeFunction(self.params)
+        keys, weights = DegreeDistObj.jdd_arrays()
+
+        self.assertTrue((weights >= 1e-3).all())
+        self.assertLess(len(keys), 10 * 10 * 6)
+        self.assertGreater(DegreeDistObj.truncated_mass, 0.0)
+        self.assertLess(DegreeDistObj.truncated_mass, 0.05)
+
+    def test_memory_limit(self):
+        self.params[JointDegreeNames.MEMORY_LIMIT] = 20000
+        loader = JointDegreeFunction(self.params)
+        keys, weights = loader.jdd_arrays()
+
+        # the kept arrays, twice over, fit beside a block's working set
+        self.assertLessEqual(2 * (keys.nbytes + weights.nbytes), 20000)
+        threshold = loader.applied_mass_threshold
+        self.assertGreater(threshold, 0.0)
+        self.assertGreater(loader.truncated_mass, 0.0)
+
+        # the same as asking for the raised threshold directly
+        del self.params[JointDegreeNames.MEMORY_LIMIT]
+        self.params[JointDegreeNames.MASS_THRESHOLD] = threshold
+        expected_keys, expected_weights = JointDegreeFunction(self.params).jdd_arrays()
+        np.testing.assert_array_equal(keys, expected_keys)
+        np.testing.assert_array_equal(weights, expected_weights)
+
+        self.params[JointDegreeNames.MEMORY_LIMIT] = 100
+        with self.assertRaises(MemoryError):
+            JointDegreeFunction(self.params).jdd
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+import numpy as np
+
+from gcmpy.joint_degree.joint_degree_loaders.joint_degree_manual import (
+    JointDegreeManual,
+)
+from gcmpy.names.joint_degree_names import JointDegreeNames
+
+
+class HandshakingLemmaTest(unittest.TestCase):
+    def setUp(self):
+        params = {}
+        params[JointDegreeNames.JDD] = {(3, 0): 0.8, (4, 0): 0.1, (3, 1): 0.1}
+        params[JointDegreeNames.MOTIF_SIZES] = [3, 2]
+        self.jd = JointDegreeManual(params)
+        self.jd.rng = 0
+
+    def test_adds_missing_stubs(self):
+        jds = np.array([[3, 0]] * 10 + [[4, 1]])
+        repaired = self.jd.handshaking_lemma(jds.copy())
+        self.assertEqual(repaired[:, 0].sum(), 36)
+        self.assertEqual(repaired[:, 1].sum(), 2)
+        self.assertTrue((repaired >= jds).all())
+
+    def test_preserve_distribution(self):
+        self.jd.preserve_distribution = True
+        jds = np.array([[3, 0]] * 10 + [[4, 1]])
+        repaired = self.jd.handshaking_lemma(jds)
+
+        # removing the excess stubs restores the most likely joint degrees
+        np.testing.assert_array_equal(repaired, [[3, 0]] * 11)
+
+    def test_list_input(self):
+        repaired = self.jd.handshaking_lemma([(3, 0), (3, 1)])
+        self.assertEqual(repaired.shape, (2, 2))
+        self.assertEqual(repaired[:, 1].sum() % 2, 0)
+
+    def test_empty_sample(self):
+        jds = self.jd.sample_jds_from_jdd(0)
+        self.assertEqual(jds.shape, (0, 2))
+
+        self.jd.preserve_distribution = True
+        self.assertEqual(self.jd.handshaking_lemma([]).shape, (0, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
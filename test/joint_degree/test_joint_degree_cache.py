@@ -0,0 +1,122 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from gcmpy.joint_degree.joint_degree_cache import JointDegreeCache
+from gcmpy.joint_degree.joint_degree_distribution import JointDegreeDistribution
+from gcmpy.joint_degree.joint_degree_type import JointDegreeType
+from gcmpy.names.joint_degree_names import JointDegreeNames
+from gcmpy.distributions.poisson import poisson
+
+
+def marginal_params(cache_dir: str, calls: list) -> dict:
+    fp = poisson(2.0)
+
+    def counted(k):
+        calls.append(k)
+        return fp(k)
+
+    params = {}
+    params[JointDegreeNames.JOINT_DEGREE_TYPE] = JointDegreeType.MARGINAL
+    params[JointDegreeNames.MOTIF_SIZES] = [2, 3]
+    params[JointDegreeNames.ARR_FP] = [counted, counted]
+    params[JointDegreeNames.LOW_HIGH_DEGREE_BOUND] = [(0, 6), (0, 4)]
+    params[JointDegreeNames.CACHE_DIR] = cache_dir
+    return params
+
+
+class JointDegreeCacheTest(unittest.TestCase):
+    def test_hit_skips_construction(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            calls = []
+            params = marginal_params(cache_dir, calls)
+            params[JointDegreeNames.CACHE_TOKEN] = "poisson-2.0"
+
+            built = JointDegreeDistribution.load_joint_degree(params)
+            self.assertTrue(len(calls) > 0)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+            del calls[:]
+            cached = JointDegreeDistribution.load_joint_degree(params)
+            self.assertEqual(len(calls), 0)
+            self.assertEqual(cached.motif_sizes, [2, 3])
+            self.assertEqual(cached.jdd, built.jdd)
+
+    def test_callables_without_token_bypass_cache(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            params = marginal_params(cache_dir, [])
+            JointDegreeDistribution.load_joint_degree(params)
+            self.assertEqual(os.listdir(cache_dir), [])
+
+    def test_key_depends_on_params_not_seed(self):
+        params = {}
+        params[JointDegreeNames.JOINT_DEGREE_TYPE] = JointDegreeType.EMPIRICAL
+        params[JointDegreeNames.MOTIF_SIZES] = [2]
+        params[JointDegreeNames.JDS] = [(1,), (2,), (3,)]
+        key = JointDegreeCache.key(JointDegreeType.EMPIRICAL, params)
+
+        params[JointDegreeNames.SEED] = 7
+        self.assertEqual(JointDegreeCache.key(JointDegreeType.EMPIRICAL, params), key)
+        params[JointDegreeNames.JDS] = np.array([(1,), (2,), (3,)])
+        self.assertEqual(JointDegreeCache.key(JointDegreeType.EMPIRICAL, params), key)
+        params[JointDegreeNames.JDS] = [(1,), (2,), (4,)]
+        self.assertNotEqual(
+            JointDegreeCache.key(JointDegreeType.EMPIRICAL, params), key
+        )
+
+    def test_eviction_bounds_size(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            sizes = []
+            for k in range(4):
+                params = {}
+                params[JointDegreeNames.JOINT_DEGREE_TYPE] = JointDegreeType.EMPIRICAL
+                params[JointDegreeNames.MOTIF_SIZES] = [2]
+                params[JointDegreeNames.JDS] = [(k,), (k + 1,)]
+                params[JointDegreeNames.CACHE_DIR] = cache_dir
+                JointDegreeDistribution.load_joint_degree(params)
+                sizes.append(
+                    sum(
+                        os.path.getsize(os.path.join(cache_dir, f))
+                        for f in os.listdir(cache_dir)
+                    )
+                )
+
+            # keep room for two entries only
+            params[JointDegreeNames.JDS] = [(4,), (5,)]
+            params[JointDegreeNames.CACHE_MAX_BYTES] = sizes[1]
+            JointDegreeDistribution.load_joint_degree(params)
+            self.assertEqual(len(os.listdir(cache_dir)), 2)
+
+    def test_rewritten_file_misses(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            path = os.path.join(cache_dir, "jds.npy")
+            np.save(path, np.array([[1, 0], [1, 0], [2, 1]]))
+
+            params = {}
+            params[JointDegreeNames.JOINT_DEGREE_TYPE] = JointDegreeType.EMPIRICAL
+            params[JointDegreeNames.MOTIF_SIZES] = [2, 3]
+            params[JointDegreeNames.JDS_FILES] = [path]
+            params[JointDegreeNames.CACHE_DIR] = os.path.join(cache_dir, "cache")
+            key = JointDegreeCache.key(JointDegreeType.EMPIRICAL, params)
+            JointDegreeDistribution.load_joint_degree(params)
+
+            params[JointDegreeNames.CHUNK_SIZE] = 1
+            params[JointDegreeNames.N_WORKERS] = 1
+            self.assertEqual(
+                JointDegreeCache.key(JointDegreeType.EMPIRICAL, params), key
+            )
+
+            np.save(path, np.array([[5, 5]]))
+            os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1))
+            self.assertNotEqual(
+                JointDegreeCache.key(JointDegreeType.EMPIRICAL, params), key
+            )
+            self.assertEqual(
+                JointDegreeDistribution.load_joint_degree(params).jdd, {(5, 5): 1.0}
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
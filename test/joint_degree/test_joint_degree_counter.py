@@ -0,0 +1,92 @@
+import os
+import tempfile
+import unittest
+from collections import Counter
+
+import numpy as np
+
+from gcmpy.joint_degree.joint_degree_counter import JointDegreeCounter
+from gcmpy.joint_degree.joint_degree_loaders.joint_degree_empirical import (
+    JointDegreeEmpirical,
+)
+from gcmpy.names.joint_degree_names import JointDegreeNames
+
+
+class JointDegreeCounterTest(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        self.jds = rng.integers(0, 4, size=(1000, 2))
+        self.expected = Counter(map(tuple, self.jds.tolist()))
+        self.dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def assertCounts(self, counter: JointDegreeCounter, expected: Counter):
+        counts = dict(zip(map(tuple, counter.keys.tolist()), counter.counts.tolist()))
+        self.assertEqual(counts, dict(expected))
+
+    def test_chunked_updates(self):
+        counter = JointDegreeCounter()
+        for start in range(0, len(self.jds), 64):
+            counter.update(self.jds[start : start + 64])
+        self.assertCounts(counter, self.expected)
+        self.assertEqual(counter.n_samples, len(self.jds))
+
+    def test_read_files(self):
+        npy = os.path.join(self.dir.name, "jds.npy")
+        csv = os.path.join(self.dir.name, "jds.csv")
+        txt = os.path.join(self.dir.name, "jds.txt")
+        np.save(npy, self.jds)
+        np.savetxt(csv, self.jds, fmt="%d", delimiter=",")
+        with open(txt, "w") as f:
+            f.write("# k_2 k_3\n\n")
+            np.savetxt(f, self.jds, fmt="%d")
+
+        for path in (npy, csv, txt):
+            counter = JointDegreeCounter()
+            counter.read(path, chunk_size=100)
+            self.assertCounts(counter, self.expected)
+
+    def test_merge_files_in_parallel(self):
+        paths = []
+        for i, part in enumerate(np.array_split(self.jds, 3)):
+            paths.append(os.path.join(self.dir.name, f"part{i}.npy"))
+            np.save(paths[-1], part)
+
+        for n_workers in (1, 2):
+            counter = JointDegreeCounter.count_files(
+                paths, chunk_size=50, n_workers=n_workers
+            )
+            self.assertCounts(counter, self.expected)
+
+    def test_empirical_from_files(self):
+        path = os.path.join(self.dir.name, "jds.csv")
+        np.savetxt(path, self.jds, fmt="%d", delimiter=",")
+
+        params = {}
+        params[JointDegreeNames.MOTIF_SIZES] = [2, 3]
+        params[JointDegreeNames.JDS_FILES] = [path]
+        params[JointDegreeNames.CHUNK_SIZE] = 128
+        loader = JointDegreeEmpirical(params)
+
+        for key, n in self.expected.items():
+            self.assertAlmostEqual(loader.jdd[key], n / len(self.jds))
+
+    def test_empty_input(self):
+        with self.assertRaises(ValueError):
+            JointDegreeCounter().jdd_arrays()
+
+        path = os.path.join(self.dir.name, "jds.txt")
+        with open(path, "w") as f:
+            f.write("# k_2 k_3\n")
+
+        params = {}
+        params[JointDegreeNames.MOTIF_SIZES] = [2, 3]
+        params[JointDegreeNames.JDS_FILES] = [path]
+        with self.assertRaises(ValueError):
+            JointDegreeEmpirical(params).jdd
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -97,3 +97,42 @@ class JointDegreeDistributionTest(unittest.TestCase):
         DegreeDist: JointDegree = JointDegreeDistribution.load_joint_degree(params)
 
         jds = DegreeDist.sample_jds_from_jdd(n_vertices)
+
+    def test_jdd_built_once_on_first_use(self):
+
+        calls = []
+        fp = poisson(2.5)
+
+        def counted(k):
+            calls.append(k)
+            return fp(k)
+
+        params = {}
+        params[JointDegreeNames.JOINT_DEGREE_TYPE] = JointDegreeType.MARGINAL
+        params[JointDegreeNames.MOTIF_SIZES] = [2]
+        params[JointDegreeNames.ARR_FP] = [counted]
+        params[JointDegreeNames.LOW_HIGH_DEGREE_BOUND] = [(0, 10)]
+
+        DegreeDist: JointDegree = JointDegreeDistribution.load_joint_degree(params)
+        self.assertEqual(len(calls), 0)
+        self.assertEqual(DegreeDist.motif_sizes, [2])
+
+        DegreeDist.sample_jds_from_jdd(100)
+        n_calls = len(calls)
+        self.assertTrue(n_calls > 0)
+        DegreeDist.jdd
+        DegreeDist.sample_jds_from_jdd(100)
+        self.assertEqual(len(calls), n_calls)
+
+    def test_setter_rebuilds_jdd(self):
+
+        params = {}
+        params[JointDegreeNames.JOINT_DEGREE_TYPE] = JointDegreeType.EMPIRICAL
+        params[JointDegreeNames.JDS] = [(1,), (1,)]
+        params[JointDegreeNames.MOTIF_SIZES] = [2]
+
+        DegreeDist: JointDegree = JointDegreeDistribution.load_joint_degree(params)
+        self.assertEqual(DegreeDist.jdd, {(1,): 1.0})
+
+        DegreeDist.empirical_jds = [(2,), (2,)]
+        self.assertEqual(DegreeDist.jdd, {(2,): 1.0})
@@ -0,0 +1,100 @@
+import unittest
+
+import numpy as np
+
+from gcmpy.joint_degree.joint_degree_table import JointDegreeTable
+from gcmpy.joint_degree.joint_degree_loaders.joint_degree_manual import (
+    JointDegreeManual,
+)
+from gcmpy.names.joint_degree_names import JointDegreeNames
+from gcmpy.tools.average_joint_degree_from_jdd import AverageJointDegreeFromJDD
+from gcmpy.tools.joint_degree_from_excess import JointDegreeFromExcess
+from gcmpy.tools.joint_excess_from_jdd import JointExcessfromJDD
+
+
+class JointDegreeTableTest(unittest.TestCase):
+    def setUp(self):
+        self.jdd = {(5, 1): 0.25, (3, 2): 0.25, (1, 3): 0.25, (0, 0): 0.25}
+        self.table = JointDegreeTable.from_dict(self.jdd)
+
+    def test_round_trip(self):
+        self.assertEqual(self.table.to_dict(), self.jdd)
+        self.assertEqual(self.table.keys.shape, (4, 2))
+        self.assertEqual(self.table.n_topologies, 2)
+
+    def test_lookup(self):
+        for row, key in enumerate(self.jdd):
+            self.assertEqual(self.table.row(key), row)
+            self.assertEqual(self.table[key], self.jdd[key])
+        self.assertEqual(self.table.row((2, 2)), -1)
+        self.assertEqual(self.table.row((9, 0)), -1)
+        self.assertEqual(self.table.weight((-1, 0)), 0.0)
+        self.assertFalse((1, 2, 3) in self.table)
+        with self.assertRaises(KeyError):
+            self.table[(2, 2)]
+
+        rows = self.table.rows(np.array([[1, 3], [2, 2], [0, 0], [6, 1], [5, 1]]))
+        self.assertEqual(rows.tolist(), [2, -1, 3, -1, 0])
+
+    def test_lookup_of_wide_keys(self):
+        table = JointDegreeTable(np.array([[2**40, 2**40], [1, 0]]), [0.5, 0.5])
+        self.assertEqual(table.row((2**40, 2**40)), 0)
+        self.assertEqual(table.rows(np.array([[1, 0], [1, 1]])).tolist(), [1, -1])
+
+    def test_moments_and_marginals(self):
+        self.assertEqual(self.table.mean().tolist(), [2.25, 1.5])
+        self.assertEqual(self.table.moment(2).tolist(), [8.75, 3.5])
+
+        degrees, weights = self.table.marginal(1)
+        self.assertEqual(degrees.tolist(), [0, 1, 2, 3])
+        self.assertEqual(weights.tolist(), [0.25] * 4)
+
+    def test_tools_accept_tables(self):
+        self.assertEqual(
+            AverageJointDegreeFromJDD.get_average_joint_degrees(self.table),
+            AverageJointDegreeFromJDD.get_average_joint_degrees(self.jdd),
+        )
+        excess_tables = JointExcessfromJDD.get_joint_excess_distributions(self.table)
+        excess_dicts = JointExcessfromJDD.get_joint_excess_distributions(self.jdd)
+        for table, qk in zip(excess_tables, excess_dicts):
+            self.assertEqual(table.to_dict(), qk)
+
+    def test_jdd_from_excess_tables(self):
+        jdd = {(5, 1): 0.25, (3, 2): 0.25, (1, 3): 0.25, (2, 0): 0.25}
+        topologies = ["2-clique", "3-clique"]
+        qks = dict(
+            zip(
+                topologies,
+                JointExcessfromJDD.get_joint_excess_distributions(
+                    JointDegreeTable.from_dict(jdd)
+                ),
+            )
+        )
+
+        table = JointDegreeFromExcess.get_joint_degree_distribution(qks, topologies)
+        self.assertIsInstance(table, JointDegreeTable)
+        for key, weight in jdd.items():
+            self.assertAlmostEqual(table[key], weight)
+        self.assertEqual(len(table), len(jdd))
+
+        qks = {topology: qk.to_dict() for topology, qk in qks.items()}
+        P = JointDegreeFromExcess.get_joint_degree_distribution(qks, topologies)
+        self.assertIsInstance(P, dict)
+        for key, weight in jdd.items():
+            self.assertAlmostEqual(P[key], weight)
+
+    def test_loader_table(self):
+        params = {}
+        params[JointDegreeNames.JDD] = self.jdd
+        params[JointDegreeNames.MOTIF_SIZES] = [2, 3]
+        loader = JointDegreeManual(params)
+
+        self.assertEqual(loader.table.to_dict(), self.jdd)
+        self.assertIs(loader.table, loader.table)
+
+        loader.table = JointDegreeTable(np.array([[2, 3]]), [1.0])
+        self.assertEqual(loader.jdd, {(2, 3): 1.0})
+
+
+if __name__ == "__main__":
+    unittest.main()
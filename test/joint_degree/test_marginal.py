@@ -1,9 +1,11 @@
 import unittest
+from itertools import product
 
 from gcmpy.joint_degree.joint_degree_loaders.joint_degree_marginal import (
     JointDegreeMarginal,
 )
 from gcmpy.names.joint_degree_names import JointDegreeNames
+from gcmpy.distributions.exponential import exponential
 from gcmpy.distributions.poisson import poisson
 from gcmpy.distributions.power_law import power_law
 from gcmpy.distributions.scale_free_cut_off import scale_free_cut_off
@@ -132,3 +134,66 @@ class JDMarginalTest(unittest.TestCase):
                 sum([jd[i] for jd in jds]) % params[JointDegreeNames.MOTIF_SIZES][i]
                 == 0
             )
+
+
+class JDMarginalDirectTest(unittest.TestCase):
+    def setUp(self):
+        self.params = {}
+        self.params[JointDegreeNames.MOTIF_SIZES] = [2, 3]
+        self.params[JointDegreeNames.ARR_FP] = [poisson(2.5), exponential(0.5)]
+        self.params[JointDegreeNames.LOW_HIGH_DEGREE_BOUND] = [(0, 10), (1, 8)]
+
+    def test_matches_enumeration(self):
+        jd = JointDegreeMarginal(self.params)
+        fps = self.params[JointDegreeNames.ARR_FP]
+        expected = {
+            key: fps[0](key[0]) * fps[1](key[1])
+            for key in product(range(0, 10), range(1, 8))
+        }
+        total = sum(expected.values())
+
+        self.assertEqual(set(jd.jdd), set(expected))
+        for key, p in expected.items():
+            self.assertAlmostEqual(jd.jdd[key], p / total)
+        self.assertAlmostEqual(jd.truncated_mass, 0.0)
+
+    def test_mass_threshold(self):
+        self.params[JointDegreeNames.MASS_THRESHOLD] = 1e-4
+        jd = JointDegreeMarginal(self.params)
+        keys, weights = jd.jdd_arrays()
+
+        self.assertEqual(keys.shape[1], 2)
+        self.assertAlmostEqual(weights.sum(), 1.0)
+        self.assertGreater(jd.truncated_mass, 0.0)
+        self.assertTrue((weights * (1.0 - jd.truncated_mass) >= 1e-4 - 1e-12).all())
+        self.assertLess(len(keys), 10 * 7)
+
+
+class JDMarginalFactorizedTest(unittest.TestCase):
+    def test_factorized_sampling(self):
+        params = {}
+        params[JointDegreeNames.MOTIF_SIZES] = [2, 3]
+        params[JointDegreeNames.ARR_FP] = [poisson(2.5), exponential(0.5)]
+        params[JointDegreeNames.LOW_HIGH_DEGREE_BOUND] = [(0, 10), (1, 8)]
+        params[JointDegreeNames.FACTORIZED] = True
+
+        DegreeDistObj = JointDegreeMarginal(params)
+        DegreeDistObj.rng = 2
+        jds = DegreeDistObj.sample_jds_from_jdd(NETWORK_SIZE)
+
+        self.assertIsNone(DegreeDistObj.jdd)
+        self.assertEqual(jds.shape, (NETWORK_SIZE, 2))
+        self.assertEqual(jds[:, 0].sum() % 2, 0)
+        self.assertEqual(jds[:, 1].sum() % 3, 0)
+        self.assertTrue((jds[:, 0] <= 10).all() and (jds[:, 1] >= 1).all())
+
+        # each column follows its marginal
+        for i, (kmin, kmax) in enumerate(
+            params[JointDegreeNames.LOW_HIGH_DEGREE_BOUND]
+        ):
+            ks = list(range(kmin, kmax + 1))
+            pks = [params[JointDegreeNames.ARR_FP][i](k) for k in ks]
+            for k, p in zip(ks, pks):
+                self.assertAlmostEqual(
+                    (jds[:, i] == k).mean(), p / sum(pks), delta=0.01
+                )
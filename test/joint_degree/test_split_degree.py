@@ -35,3 +35,28 @@ class JDSplitDegreeTest(unittest.TestCase):
                 sum([jd[i] for jd in jds]) % params[JointDegreeNames.MOTIF_SIZES][i]
                 == 0
             )
+
+    def test_split_k_matches_enumeration(self):
+        params = {}
+        params[JointDegreeNames.MOTIF_SIZES] = [2, 3, 4]
+        params[JointDegreeNames.PROBS] = [0.5, 0.3, 0.2]
+        params[JointDegreeNames.FP] = power_law(2.5)
+        params[JointDegreeNames.LOW_HIGH_DEGREE_BOUND] = (1, 15)
+        jdd = JointDegreeSplitDegree(params).jdd
+
+        # brute force: every (n1, n2, n3) with n1 + 2 n2 + 3 n3 = k
+        expected = {}
+        for k in range(1, 15):
+            weights = {}
+            for n3 in range(k // 3 + 1):
+                for n2 in range((k - 3 * n3) // 2 + 1):
+                    jd = (k - 3 * n3 - 2 * n2, n2, n3)
+                    weights[jd] = 0.5 ** jd[0] * 0.3 ** (2 * jd[1]) * 0.2 ** (3 * jd[2])
+            total = sum(weights.values())
+            for jd, w in weights.items():
+                expected[jd] = params[JointDegreeNames.FP](k) * w / total
+        norm = sum(expected.values())
+
+        self.assertEqual(set(jdd), set(expected))
+        for jd, p in expected.items():
+            self.assertAlmostEqual(jdd[jd], p / norm)
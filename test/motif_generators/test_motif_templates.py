@@ -0,0 +1,65 @@
+import unittest
+import numpy as np
+
+from gcmpy.motif_generators.clique_motif import clique_motif, clique_motif_batch
+from gcmpy.motif_generators.cycle_motif import cycle_motif, cycle_motif_batch
+from gcmpy.motif_generators.diamond_motif import diamond_motif, diamond_motif_batch
+from gcmpy.motif_generators.motif_template import motif_template, get_template
+from gcmpy.gcm_algorithm.gcm_algorithm_custom_motifs import GCMAlgorithmCustomMotifs
+from gcmpy.names.gcm_algorithm_names import GCMAlgorithmNames
+
+
+class MotifTemplateTest(unittest.TestCase):
+    def assert_batch_matches(self, motif, batch, vertices):
+        expected = [e for row in vertices.tolist() for e in motif(row)]
+        self.assertEqual(list(map(tuple, batch(vertices).tolist())), expected)
+
+    def test_batch_builders(self):
+        rng = np.random.default_rng(3)
+        for size in (2, 3, 5):
+            vertices = rng.integers(0, 100, (10, size))
+            self.assert_batch_matches(clique_motif, clique_motif_batch, vertices)
+            self.assert_batch_matches(cycle_motif, cycle_motif_batch, vertices)
+
+        vertices = rng.integers(0, 100, (10, 4))
+        self.assert_batch_matches(diamond_motif, diamond_motif_batch, vertices)
+
+    def test_get_template(self):
+        self.assertEqual(get_template(clique_motif, 4).shape, (6, 2))
+        self.assertEqual(get_template(diamond_motif, 4).shape, (6, 2))
+        self.assertIsNone(get_template(lambda vs: [(vs[0], vs[1])], 2))
+        with self.assertRaises(ValueError):
+            get_template(diamond_motif, 3)
+
+    def test_custom_motif_template(self):
+        @motif_template([(0, 1), (1, 2), (2, 3), (3, 1), (0, 2)])
+        def diamond(vs):
+            return (
+                (vs[0], vs[1]),
+                (vs[1], vs[2]),
+                (vs[2], vs[3]),
+                (vs[3], vs[1]),
+                (vs[0], vs[2]),
+            )
+
+        def diamond_names():
+            return ("outer", "outer", "outer", "outer", "inner")
+
+        jds = [(1, 0), (0, 1), (1, 0), (0, 1), (1, 0), (0, 1), (1, 0), (0, 1)]
+
+        params = {}
+        params[GCMAlgorithmNames.MOTIF_SIZES] = [2, 2]
+        params[GCMAlgorithmNames.EDGE_NAMES] = [diamond_names]
+        params[GCMAlgorithmNames.BUILD_FUNCTIONS] = [diamond]
+        params[GCMAlgorithmNames.MOTIF_INDICES] = [[0, 1]]
+        params[GCMAlgorithmNames.SEED] = 11
+
+        es = GCMAlgorithmCustomMotifs(params).random_clustered_graph(jds)
+        self.assertEqual(len(es.edge_list), 10)
+        self.assertEqual(es.topologies, list(diamond_names()) * 2)
+        self.assertEqual(es.motif_id, [0] * 5 + [1] * 5)
+
+        # the first two positions of each diamond come from the first orbit
+        for u, v in es.edge_list[::5]:
+            self.assertEqual(jds[u], (1, 0))
+            self.assertEqual(jds[v], (1, 0))
@@ -0,0 +1,77 @@
+import unittest
+import numpy as np
+
+from gcmpy.joint_degree.joint_degree_loaders.joint_degree_manual import (
+    JointDegreeManual,
+)
+from gcmpy.gcm_algorithm.gcm_algorithm_main import GCMAlgorithmMain
+from gcmpy.gcm_algorithm.gcm_algorithm_types import GCMAlgorithmTypes
+from gcmpy.motif_generators.clique_motif import clique_motif
+from gcmpy.names.joint_degree_names import JointDegreeNames
+from gcmpy.names.gcm_algorithm_names import GCMAlgorithmNames
+from gcmpy.names.network_names import NetworkNames
+from gcmpy.network.compact_edge_list import CompactEdgeList
+from gcmpy.network.edge_list_to_network import EdgeListToNetwork
+
+NETWORK_SIZE: int = 10000
+
+
+class CompactEdgeListTest(unittest.TestCase):
+    def setUp(self):
+        params = {}
+        params[JointDegreeNames.JDD] = {
+            (1, 0): 0.2,
+            (2, 1): 0.5,
+            (3, 0): 0.1,
+            (5, 1): 0.2,
+        }
+        params[JointDegreeNames.MOTIF_SIZES] = [2, 3]
+        self.jds = JointDegreeManual(params).sample_jds_from_jdd(NETWORK_SIZE)
+
+        self.params = {}
+        self.params[GCMAlgorithmNames.MOTIF_SIZES] = [2, 3]
+        self.params[GCMAlgorithmNames.EDGE_NAMES] = ["2-clique", "3-clique"]
+        self.params[GCMAlgorithmNames.BUILD_FUNCTIONS] = [clique_motif, clique_motif]
+        self.params[GCMAlgorithmNames.SEED] = 7
+
+    def test_compact_matches_fast(self):
+        self.params[GCMAlgorithmNames.GCM_TYPE] = GCMAlgorithmTypes.FAST
+        g = GCMAlgorithmMain.load_gcm_algorithm(self.params).random_clustered_graph(
+            self.jds
+        )
+        self.params[GCMAlgorithmNames.GCM_TYPE] = GCMAlgorithmTypes.COMPACT
+        c = GCMAlgorithmMain.load_gcm_algorithm(self.params).random_clustered_graph(
+            self.jds
+        )
+
+        self.assertTrue(isinstance(c, CompactEdgeList))
+        self.assertEqual(c.edges.dtype, np.int32)
+        self.assertEqual(c.topology_codes.dtype, np.int8)
+        self.assertEqual(len(c), len(g.edge_list))
+        self.assertEqual(list(c.edge_list), g.edge_list)
+        self.assertEqual(list(c.topologies), g.topologies)
+        self.assertEqual(list(c.motif_id), g.motif_id)
+        self.assertEqual(list(c.joint_degrees), g.joint_degrees)
+        self.assertTrue(0 < c.bytes_per_edge < 32)
+
+    def test_compatibility_views(self):
+        self.params[GCMAlgorithmNames.GCM_TYPE] = GCMAlgorithmTypes.COMPACT
+        c = GCMAlgorithmMain.load_gcm_algorithm(self.params).random_clustered_graph(
+            self.jds
+        )
+        e = c.edge_list[0]
+        self.assertTrue(isinstance(e, tuple))
+        self.assertTrue(c.topologies[-1] in ("2-clique", "3-clique"))
+
+        network = EdgeListToNetwork.convert(c)
+        self.assertEqual(network.G.order(), NETWORK_SIZE)
+        self.assertTrue(
+            network.G.edges[e][NetworkNames.TOPOLOGY] in ("2-clique", "3-clique")
+        )
+
+        # round trip through the list based edge list
+        c2 = CompactEdgeList.from_edge_list(c.to_edge_list())
+        self.assertTrue(np.array_equal(c.edges, c2.edges))
+        self.assertTrue(np.array_equal(c.motif_ids, c2.motif_ids))
+        self.assertTrue(np.array_equal(c.joint_degree_matrix, c2.joint_degree_matrix))
+        self.assertEqual(list(c.topologies), list(c2.topologies))
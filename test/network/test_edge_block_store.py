@@ -0,0 +1,93 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+
+from gcmpy.joint_degree.joint_degree_loaders.joint_degree_manual import (
+    JointDegreeManual,
+)
+from gcmpy.gcm_algorithm.gcm_algorithm_main import GCMAlgorithmMain
+from gcmpy.gcm_algorithm.gcm_algorithm_types import GCMAlgorithmTypes
+from gcmpy.motif_generators.clique_motif import clique_motif
+from gcmpy.names.joint_degree_names import JointDegreeNames
+from gcmpy.names.gcm_algorithm_names import GCMAlgorithmNames
+from gcmpy.network.edge_block import EdgeBlock
+from gcmpy.network.edge_block_store import EdgeBlockStore
+
+NETWORK_SIZE: int = 5000
+
+
+class EdgeBlockStoreTest(unittest.TestCase):
+    def setUp(self):
+        params = {}
+        params[JointDegreeNames.JDD] = {
+            (1, 0): 0.2,
+            (2, 1): 0.5,
+            (3, 0): 0.1,
+            (5, 1): 0.2,
+        }
+        params[JointDegreeNames.MOTIF_SIZES] = [2, 3]
+        self.jds = JointDegreeManual(params).sample_jds_from_jdd(NETWORK_SIZE)
+
+        self.params = {}
+        self.params[GCMAlgorithmNames.MOTIF_SIZES] = [2, 3]
+        self.params[GCMAlgorithmNames.EDGE_NAMES] = ["2-clique", "3-clique"]
+        self.params[GCMAlgorithmNames.BUILD_FUNCTIONS] = [clique_motif, clique_motif]
+
+    def load(self, gcm_type):
+        self.params[GCMAlgorithmNames.GCM_TYPE] = gcm_type
+        self.params[GCMAlgorithmNames.SEED] = 11
+        return GCMAlgorithmMain.load_gcm_algorithm(self.params)
+
+    def test_chunked_blocks_match_compact(self):
+        g = self.load(GCMAlgorithmTypes.COMPACT).random_clustered_graph(self.jds)
+        blocks = list(self.load(GCMAlgorithmTypes.FAST).edge_blocks(self.jds, 100))
+
+        self.assertTrue(all(len(np.unique(b.motif_ids)) <= 101 for b in blocks))
+        np.testing.assert_array_equal(
+            np.concatenate([b.edges for b in blocks]), g.edges
+        )
+        np.testing.assert_array_equal(
+            np.concatenate([b.motif_ids for b in blocks]), g.motif_ids
+        )
+
+    def test_store_round_trip(self):
+        g = self.load(GCMAlgorithmTypes.COMPACT).random_clustered_graph(self.jds)
+        with tempfile.TemporaryDirectory() as path:
+            stored = self.load(GCMAlgorithmTypes.FAST).write_random_clustered_graph(
+                self.jds, path, chunk_size=64
+            )
+
+            self.assertIsInstance(stored.edges, np.memmap)
+            np.testing.assert_array_equal(stored.edges, g.edges)
+            np.testing.assert_array_equal(stored.topology_codes, g.topology_codes)
+            np.testing.assert_array_equal(stored.motif_ids, g.motif_ids)
+            np.testing.assert_array_equal(
+                stored.joint_degree_matrix, g.joint_degree_matrix
+            )
+            self.assertEqual(list(stored.topologies), list(g.topologies))
+            del stored
+
+    def test_empty_store(self):
+        with tempfile.TemporaryDirectory() as path:
+            with EdgeBlockStore(path, ["2-clique"]):
+                pass
+            stored = EdgeBlockStore.load(path)
+            self.assertEqual(stored.edges.shape, (0, 2))
+            self.assertEqual(len(stored), 0)
+            del stored
+
+    def test_failed_write_is_not_finalised(self):
+        block = EdgeBlock(np.array([[0, 1], [1, 2]]), np.zeros(2), np.arange(2))
+        with tempfile.TemporaryDirectory() as path:
+            with self.assertRaises(RuntimeError):
+                with EdgeBlockStore(path, ["2-clique"]) as store:
+                    store.append(block)
+                    raise RuntimeError("interrupted")
+            self.assertEqual(os.listdir(path), [])
+            with self.assertRaises(OSError):
+                EdgeBlockStore.load(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+import numpy as np
+
+from gcmpy.joint_degree.joint_degree_loaders.joint_degree_manual import (
+    JointDegreeManual,
+)
+from gcmpy.gcm_algorithm.gcm_algorithm_fast import GCMAlgorithmFast
+from gcmpy.gcm_algorithm.multi_edge_policy import MultiEdgePolicy
+from gcmpy.motif_generators.clique_motif import clique_motif
+from gcmpy.names.joint_degree_names import JointDegreeNames
+from gcmpy.names.gcm_algorithm_names import GCMAlgorithmNames
+from gcmpy.network.multi_edges import MultiEdges
+
+
+class MultiEdgesTest(unittest.TestCase):
+    def test_find(self):
+        edges = np.array([(0, 1), (1, 0), (2, 2), (1, 2), (0, 1), (2, 2)])
+        loops, repeats = MultiEdges.find(edges, 3)
+        np.testing.assert_array_equal(loops, [0, 0, 1, 0, 0, 1])
+        np.testing.assert_array_equal(repeats, [0, 1, 0, 0, 1, 0])
+
+        counts = MultiEdges.count(
+            loops, repeats, np.array([0, 0, 1, 1, 1, 0]), ["a", "b"]
+        )
+        self.assertEqual(counts, {"a": (1, 1), "b": (1, 1)})
+
+
+class MultiEdgePolicyTest(unittest.TestCase):
+    def setUp(self):
+        # a small dense graph produces many self-loops and repeated edges
+        params = {}
+        params[JointDegreeNames.JDD] = {(4, 1): 0.5, (6, 2): 0.5}
+        params[JointDegreeNames.MOTIF_SIZES] = [2, 3]
+        params[JointDegreeNames.SEED] = 1
+        self.jds = JointDegreeManual(params).sample_jds_from_jdd(50)
+
+        self.params = {}
+        self.params[GCMAlgorithmNames.MOTIF_SIZES] = [2, 3]
+        self.params[GCMAlgorithmNames.EDGE_NAMES] = ["2-clique", "3-clique"]
+        self.params[GCMAlgorithmNames.BUILD_FUNCTIONS] = [clique_motif, clique_motif]
+        self.params[GCMAlgorithmNames.SEED] = 5
+
+    def generate(self, policy):
+        self.params[GCMAlgorithmNames.MULTI_EDGE_POLICY] = policy
+        gcm = GCMAlgorithmFast(self.params)
+        g = gcm.random_clustered_graph(self.jds)
+        loops, repeats = MultiEdges.find(np.array(g.edge_list), len(self.jds))
+        return gcm, g, int(loops.sum()), int(repeats.sum())
+
+    def test_report(self):
+        gcm, g, n_loops, n_repeats = self.generate(MultiEdgePolicy.REPORT)
+        self.assertGreater(n_loops + n_repeats, 0)
+        self.assertEqual(
+            sum(map(sum, gcm.multi_edge_counts.values())), n_loops + n_repeats
+        )
+
+    def test_erase(self):
+        report = self.generate(MultiEdgePolicy.REPORT)
+        gcm, g, n_loops, n_repeats = self.generate(MultiEdgePolicy.ERASE)
+        self.assertEqual(n_loops + n_repeats, 0)
+        self.assertEqual(
+            len(g.edge_list), len(report[1].edge_list) - report[2] - report[3]
+        )
+        self.assertEqual(len(g.topologies), len(g.edge_list))
+        self.assertEqual(len(g.motif_id), len(g.edge_list))
+
+    def test_resample(self):
+        erased = self.generate(MultiEdgePolicy.ERASE)[1]
+        gcm, g, n_loops, n_repeats = self.generate(MultiEdgePolicy.RESAMPLE)
+        self.assertEqual(n_loops + n_repeats, 0)
+        self.assertGreater(len(g.edge_list), len(erased.edge_list))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import unittest
+import numpy as np
+
+from gcmpy.joint_degree.joint_degree_loaders.joint_degree_manual import (
+    JointDegreeManual,
+)
+from gcmpy.gcm_algorithm.gcm_algorithm_main import GCMAlgorithmMain
+from gcmpy.gcm_algorithm.gcm_algorithm_types import GCMAlgorithmTypes
+from gcmpy.motif_generators.clique_motif import clique_motif
+from gcmpy.names.joint_degree_names import JointDegreeNames
+from gcmpy.names.gcm_algorithm_names import GCMAlgorithmNames
+from gcmpy.network.edge_list import LightWeightEdgeList
+from gcmpy.network.edge_list_to_sparse_network import EdgeListToSparseNetwork
+
+try:
+    import scipy  # noqa: F401
+
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
+
+NETWORK_SIZE: int = 5000
+
+
+@unittest.skipIf(not HAS_SCIPY, "scipy is not installed")
+class SparseNetworkTest(unittest.TestCase):
+    def setUp(self):
+        params = {}
+        params[JointDegreeNames.JDD] = {
+            (1, 0): 0.2,
+            (2, 1): 0.5,
+            (3, 0): 0.1,
+            (5, 1): 0.2,
+        }
+        params[JointDegreeNames.MOTIF_SIZES] = [2, 3]
+        self.jds = JointDegreeManual(params).sample_jds_from_jdd(NETWORK_SIZE)
+
+        self.params = {}
+        self.params[GCMAlgorithmNames.MOTIF_SIZES] = [2, 3]
+        self.params[GCMAlgorithmNames.EDGE_NAMES] = ["2-clique", "3-clique"]
+        self.params[GCMAlgorithmNames.BUILD_FUNCTIONS] = [clique_motif, clique_motif]
+        self.params[GCMAlgorithmNames.SEED] = 3
+
+    def test_csr_matches_compact(self):
+        self.params[GCMAlgorithmNames.GCM_TYPE] = GCMAlgorithmTypes.COMPACT
+        compact = GCMAlgorithmMain.load_gcm_algorithm(
+            self.params
+        ).random_clustered_graph(self.jds)
+        self.params[GCMAlgorithmNames.GCM_TYPE] = GCMAlgorithmTypes.CSR
+        g = GCMAlgorithmMain.load_gcm_algorithm(self.params).random_clustered_graph(
+            self.jds
+        )
+
+        A = g.adjacency
+        self.assertEqual(A.shape, (NETWORK_SIZE, NETWORK_SIZE))
+        self.assertEqual(A.nnz, 2 * len(compact))
+        self.assertEqual((A - A.T).count_nonzero(), 0)
+        self.assertEqual(len(g.topology_codes), A.nnz)
+        self.assertEqual(len(g.motif_ids), A.nnz)
+
+        # each vertex has one edge end per stub
+        motif_sizes = np.array([2, 3])
+        expected = np.asarray(self.jds) @ (motif_sizes - 1)
+        np.testing.assert_array_equal(g.degrees, expected)
+
+        # the edge data stored at (u, v) belong to an edge between u and v
+        u = 0
+        for v, code, id in zip(
+            g.neighbours(u),
+            g.topology_codes[A.indptr[u] : A.indptr[u + 1]],
+            g.motif_ids[A.indptr[u] : A.indptr[u + 1]],
+        ):
+            match = (compact.motif_ids == id) & (compact.topology_codes == code)
+            pairs = set(map(frozenset, compact.edges[match].tolist()))
+            self.assertIn(frozenset((u, int(v))), pairs)
+
+    def test_from_light_weight_edge_list(self):
+        edgelist = LightWeightEdgeList()
+        edgelist.edge_list = [(0, 1), (1, 2), (0, 1)]
+        edgelist.topologies = ["a", "b", "a"]
+        edgelist.motif_id = [0, 1, 2]
+        edgelist.joint_degrees = [(2,), (2,), (1,), (0,)]
+        g = EdgeListToSparseNetwork.convert(edgelist)
+
+        self.assertEqual(len(g), 4)
+        np.testing.assert_array_equal(g.degrees, [2, 3, 1, 0])
+        np.testing.assert_array_equal(g.neighbours(1), [0, 0, 2])
+        np.testing.assert_array_equal(
+            g.motif_ids[g.adjacency.indptr[1] :][:3], [0, 2, 1]
+        )
+        self.assertEqual(g.adjacency.toarray()[0, 1], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()